@@ -6,7 +6,6 @@ from typing import Dict, Any, Optional
 import datetime
 import os
 import json
-import asyncio
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,7 +15,11 @@ load_dotenv()
 # Import trading agents
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.utils.timing import timing_tracker
+from tradingagents.utils.tracing import start_run
+from tradingagents.utils.async_bridge import iterate_in_thread, run_blocking
+from tradingagents.utils.analysis_jobs import (
+    AnalysisJob, JobManager, JobQueueFullError, JobResultStore
+)
 
 # Create FastAPI app
 app = FastAPI(
@@ -138,67 +141,163 @@ def save_results_to_disk(ticker: str, analysis_date: str, results: dict, config:
 async def root():
     return {"message": "TradingAgents API is running"}
 
-@app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_ticker(request: AnalysisRequest):
-    """Analyze a stock ticker and return trading recommendations"""
-    try:
-        # Validate ticker
-        ticker = request.ticker.strip().upper()
-        if not ticker:
-            raise HTTPException(status_code=400, detail="Ticker cannot be empty")
-        
-        # Use current date
-        analysis_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        
-        # Start timing
-        timing_tracker.start_total()
-        
-        # Initialize trading graph with all analysts
-        config = get_config()
-        graph = TradingAgentsGraph(
+# Report sections published as job events: (state key, agent, progress %)
+JOB_REPORT_SECTIONS = [
+    ("market_report", "market", 25),
+    ("sentiment_report", "social", 40),
+    ("news_report", "news", 55),
+    ("fundamentals_report", "fundamentals", 70),
+    ("investment_plan", "research_manager", 85),
+    ("trader_investment_plan", "trader", 90),
+    ("final_trade_decision", "risk_manager", 100),
+]
+
+async def run_analysis_job(job: AnalysisJob) -> dict:
+    """Run one analysis for the job queue, publishing report events as sections complete"""
+    ticker, analysis_date = job.ticker, job.analysis_date
+    config = get_config()
+    
+    with start_run(f"analyze:{ticker}", ticker=ticker, trade_date=analysis_date, job_id=job.job_id) as run:
+        graph = await run_blocking(
+            TradingAgentsGraph,
             selected_analysts=["market", "social", "news", "fundamentals"],
             debug=False,
             config=config
         )
+        job.publish({'type': 'status', 'message': f'Starting analysis for {ticker}...'})
+        for agent in ("market", "social", "news", "fundamentals"):
+            job.publish({'type': 'agent_status', 'agent': agent, 'status': 'in_progress'})
+        job.publish({'type': 'progress', 'content': '5'})
         
-        # Run analysis
-        final_state, processed_signal = graph.propagate(ticker, analysis_date)
-        
-        # End timing and get summary
-        timing_tracker.end_total()
-        timing_summary = timing_tracker.get_summary()
+        # Same path as propagate(): spans go into this run and the final state is logged
+        final_state = {}
+        published = set()
+        async for chunk in iterate_in_thread(lambda: graph.stream_states(ticker, analysis_date)):
+            if not chunk:
+                continue
+            final_state = chunk
+            for key, agent, progress in JOB_REPORT_SECTIONS:
+                if chunk.get(key) and key not in published:
+                    published.add(key)
+                    job.publish({'type': 'agent_status', 'agent': agent, 'status': 'completed'})
+                    job.publish({'type': 'report', 'section': key, 'content': chunk[key]})
+                    job.publish({'type': 'progress', 'content': str(progress)})
         
-        # Prepare results
-        results = {
-            "ticker": ticker,
-            "analysis_date": analysis_date,
-            "market_report": final_state.get("market_report"),
-            "sentiment_report": final_state.get("sentiment_report"),
-            "news_report": final_state.get("news_report"),
-            "fundamentals_report": final_state.get("fundamentals_report"),
-            "investment_plan": final_state.get("investment_plan"),
-            "trader_investment_plan": final_state.get("trader_investment_plan"),
-            "final_trade_decision": final_state.get("final_trade_decision"),
-            "processed_signal": processed_signal,
-            "timing_summary": timing_summary  # Include timing info
-        }
-        
-        # Save results to disk
-        saved_path = save_results_to_disk(ticker, analysis_date, results, config)
-        print(f"✅ Results saved to: {saved_path}")
+        processed_signal = await run_blocking(graph.process_signal, final_state.get("final_trade_decision", ""))
+    
+    results = {
+        "ticker": ticker,
+        "analysis_date": analysis_date,
+        "market_report": final_state.get("market_report"),
+        "sentiment_report": final_state.get("sentiment_report"),
+        "news_report": final_state.get("news_report"),
+        "fundamentals_report": final_state.get("fundamentals_report"),
+        "investment_plan": final_state.get("investment_plan"),
+        "trader_investment_plan": final_state.get("trader_investment_plan"),
+        "final_trade_decision": final_state.get("final_trade_decision"),
+        "processed_signal": processed_signal,
+        "timing_summary": run.summary()  # Timing of this run only
+    }
+    
+    # Save results to disk
+    saved_path = await run_blocking(save_results_to_disk, ticker, analysis_date, results, config)
+    print(f"✅ Results saved to: {saved_path}")
+    await run_blocking(run.export_json, os.path.join(saved_path, "trace.json"))
+    await run_blocking(run.export_otlp, os.path.join(saved_path, "trace.otlp.json"))
+    return results
+
+# Job queue: bounded concurrency, shared runs for identical (ticker, date) requests
+job_manager = JobManager(
+    run_analysis_job,
+    JobResultStore(os.getenv("ANALYSIS_JOB_DB") or str(Path(get_config()["results_dir"]) / "analysis_jobs.sqlite3"))
+)
+
+@app.on_event("startup")
+async def start_job_workers():
+    await job_manager.start()
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    await job_manager.stop()
+
+async def submit_analysis(ticker: str) -> AnalysisJob:
+    """Validate and submit an analysis job for today's date"""
+    ticker = ticker.strip().upper()
+    if not ticker:
+        raise HTTPException(status_code=400, detail="Ticker cannot be empty")
+    analysis_date = datetime.datetime.now().strftime("%Y-%m-%d")
+    try:
+        job, _ = await job_manager.submit(ticker, analysis_date)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+    return job
+
+@app.post("/analyze", response_model=AnalysisResponse)
+async def analyze_ticker(request: AnalysisRequest):
+    """Analyze a stock ticker and return trading recommendations"""
+    job = await submit_analysis(request.ticker)
+    
+    try:
+        await job_manager.wait(job)
+        if job.error:
+            raise RuntimeError(job.error)
         
         # Return API response (without timing_summary as it's not in the model)
-        response_data = {k: v for k, v in results.items() if k != 'timing_summary'}
+        response_data = {k: v for k, v in job.result.items() if k != 'timing_summary'}
         return AnalysisResponse(**response_data)
         
     except Exception as e:
         # Return error in response
         return AnalysisResponse(
-            ticker=request.ticker,
-            analysis_date=datetime.datetime.now().strftime("%Y-%m-%d"),
+            ticker=job.ticker,
+            analysis_date=job.analysis_date,
             error=str(e)
         )
 
+@app.post("/jobs", status_code=202)
+async def submit_job(request: AnalysisRequest):
+    """Submit an analysis job; identical in-flight requests share one job"""
+    job = await submit_analysis(request.ticker)
+    return job.to_dict(include_result=False)
+
+@app.get("/jobs/stats")
+async def job_stats():
+    return job_manager.get_stats()
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Poll a job's status (and its result once completed)"""
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+def job_event_response(job: AnalysisJob, since: int = 0) -> StreamingResponse:
+    """SSE response relaying a job's events until it finishes"""
+    async def event_stream():
+        async for event in job_manager.events(job, since=since):
+            yield f"data: {json.dumps(event)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "Cache-Control",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        }
+    )
+
+@app.get("/jobs/{job_id}/stream")
+async def stream_job(job_id: str, since: int = 0):
+    """Follow a job's events using SSE; `since` skips events already received"""
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_event_response(job, since)
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -227,434 +326,14 @@ async def test_stream():
 
 @app.get("/analyze/stream")
 async def stream_analysis(ticker: str):
-    """Stream real-time analysis updates using SSE"""
-    print(f"\n🚀 NEW STREAM REQUEST: ticker={ticker}")
-    try:
-        # Validate ticker
-        ticker = ticker.strip().upper()
-        if not ticker:
-            print("❌ Empty ticker provided")
-            raise HTTPException(status_code=400, detail="Ticker cannot be empty")
-        
-        print(f"✅ Validated ticker: {ticker}")
-        
-        # Use current date
-        analysis_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        print(f"📅 Analysis date: {analysis_date}")
-        
-        async def event_stream():
-            try:
-                print(f"📡 Starting event stream for {ticker}")
-                
+    """
+    Stream real-time analysis updates using SSE.
 
-                
-                # Initialize trading graph with all analysts
-                print("🔧 Initializing trading graph...")
-                config = get_config()
-                print(f"📋 Config: {config}")
-                
-                graph = TradingAgentsGraph(
-                    selected_analysts=["market", "social", "news", "fundamentals"],
-                    debug=True,  # Enable debug mode
-                    config=config
-                )
-                print("✅ Trading graph initialized")
-                
-                # Initialize state and get graph args
-                print("🔧 Creating initial state...")
-                init_agent_state = graph.propagator.create_initial_state(ticker, analysis_date)
-                print(f"📊 Initial state keys: {list(init_agent_state.keys()) if init_agent_state else 'None'}")
-                
-                args = graph.propagator.get_graph_args()
-                print(f"🔧 Graph args: {args}")
-                
-                # Track progress and reports
-                agent_progress = {
-                    "Market Analyst": "pending",
-                    "Social Media Analyst": "pending",
-                    "News Analyst": "pending", 
-                    "Fundamentals Analyst": "pending",
-                    "Bull Researcher": "pending",
-                    "Bear Researcher": "pending",
-                    "Research Manager": "pending",
-                    "Trading Team": "pending",
-                    "Risky Analyst": "pending",
-                    "Safe Analyst": "pending",
-                    "Neutral Analyst": "pending",
-                    "Risk Manager": "pending"
-                }
-                print(f"📊 Initial agent progress: {agent_progress}")
-                
-                reports_completed = []
-                trace = []
-                chunk_count = 0
-                
-                print("🔄 Starting real-time streaming using graph.graph.stream()...")
-                
-                # Send initial status updates
-                initial_events = [
-                    json.dumps({'type': 'status', 'message': f'Starting analysis for {ticker}...'}),
-                    json.dumps({'type': 'agent_status', 'agent': 'market', 'status': 'in_progress'}),
-                    json.dumps({'type': 'agent_status', 'agent': 'social', 'status': 'in_progress'}),
-                    json.dumps({'type': 'agent_status', 'agent': 'news', 'status': 'in_progress'}),
-                    json.dumps({'type': 'agent_status', 'agent': 'fundamentals', 'status': 'in_progress'}),
-                    json.dumps({'type': 'progress', 'content': '5'})
-                ]
-                
-                # Update agent progress to reflect parallel execution
-                agent_progress["Market Analyst"] = "in_progress"
-                agent_progress["Social Media Analyst"] = "in_progress"
-                agent_progress["News Analyst"] = "in_progress"
-                agent_progress["Fundamentals Analyst"] = "in_progress"
-                
-                for event in initial_events:
-                    print(f"📤 Sending initial: {event[:100]}...")
-                    yield f"data: {event}\n\n"
-                
-                # Real-time streaming using graph.stream()
-                for chunk in graph.graph.stream(init_agent_state, **args):
-                    chunk_count += 1
-                    print(f"\n📦 CHUNK {chunk_count}: {list(chunk.keys()) if chunk else 'Empty'}")
-                    trace.append(chunk)
-                    
-                    # Allow async event loop to process
-                    await asyncio.sleep(0.1)
-                    
-                    # Check all analyst message channels for new messages
-                    message_channels = ["market_messages", "social_messages", "news_messages", "fundamentals_messages"]
-                    
-                    for channel in message_channels:
-                        if channel in chunk and len(chunk[channel]) > 0:
-                            # Extract agent name from channel (e.g., 'market_messages' -> 'market')
-                            agent_name = channel.replace('_messages', '')
-                            
-                            print(f"💬 Processing {len(chunk[channel])} messages from {channel} ({agent_name.upper()} AGENT)")
-                            
-                            # Process messages for agent detection
-                            last_message = chunk[channel][-1]
-                            print(f"📨 Last message type: {type(last_message)}")
-                        
-                            # Enhanced logging - Print raw message details
-                            print(f"🌐 RAW MESSAGE ATTRS: {[attr for attr in dir(last_message) if not attr.startswith('_')]}")
-                            
-                            # Log different message types
-                            if hasattr(last_message, 'name') and last_message.name:
-                                print(f"🤖 AGENT NAME: {last_message.name}")
-                            
-                            if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-                                print(f"🔧 [{agent_name.upper()}] TOOL CALLS: {len(last_message.tool_calls)} tools invoked")
-                                for i, tool_call in enumerate(last_message.tool_calls):
-                                    tool_name = tool_call.name if hasattr(tool_call, 'name') else 'Unknown'
-                                    print(f"🔧 [{agent_name.upper()}] TOOL[{i}]: {tool_name}")
-                                    if hasattr(tool_call, 'args'):
-                                        print(f"🔧 [{agent_name.upper()}] TOOL[{i}] ARGS: {json.dumps(tool_call.args, indent=2) if isinstance(tool_call.args, dict) else tool_call.args}")
-                            
-                            if hasattr(last_message, "content"):
-                                content = str(last_message.content) if hasattr(last_message.content, '__str__') else str(last_message.content)
-                                
-                                # Enhanced logging - Print raw content structure
-                                print(f"📋 [{agent_name.upper()}] RAW CONTENT TYPE: {type(last_message.content)}")
-                                print(f"📋 [{agent_name.upper()}] RAW CONTENT LENGTH: {len(last_message.content) if hasattr(last_message.content, '__len__') else 'N/A'}")
-                                
-                                # Extract text content if it's a list
-                                if isinstance(last_message.content, list):
-                                    print(f"📋 [{agent_name.upper()}] CONTENT LIST LENGTH: {len(last_message.content)}")
-                                    text_parts = []
-                                    for j, part in enumerate(last_message.content):
-                                        print(f"📋 [{agent_name.upper()}] CONTENT[{j}] TYPE: {type(part)}")
-                                        if hasattr(part, 'text'):
-                                            text_parts.append(part.text)
-                                            print(f"📋 [{agent_name.upper()}] CONTENT[{j}] TEXT (first 200 chars): {part.text[:200]}...")
-                                        elif isinstance(part, str):
-                                            text_parts.append(part)
-                                            print(f"📋 [{agent_name.upper()}] CONTENT[{j}] STRING (first 200 chars): {part[:200]}...")
-                                        else:
-                                            text_parts.append(str(part))
-                                            print(f"📋 [{agent_name.upper()}] CONTENT[{j}] OTHER: {str(part)[:200]}...")
-                                    content = " ".join(text_parts)
-                                else:
-                                    # Single content item
-                                    print(f"📋 [{agent_name.upper()}] SINGLE CONTENT (first 500 chars): {content[:500]}...")
-                                
-                                # Log full content for debugging (can be toggled)
-                                if os.getenv("LOG_FULL_CONTENT", "false").lower() == "true":
-                                    print(f"📝 [{agent_name.upper()}] FULL CONTENT:\n{content}\n")
-                                
-                                # Send reasoning updates WITH agent information
-                                if isinstance(content, str) and content.strip():
-                                    reasoning_event = json.dumps({
-                                        'type': 'reasoning', 
-                                        'agent': agent_name,
-                                        'content': content[:500]
-                                    })
-                                    print(f"📤 [{agent_name.upper()}] Sending reasoning: {reasoning_event[:100]}...")
-                                    yield f"data: {reasoning_event}\n\n"
-                            
-                            # Log tool message responses
-                            if hasattr(last_message, 'type') and str(last_message.type) == 'tool':
-                                print(f"🛠️ TOOL MESSAGE DETECTED")
-                                if hasattr(last_message, 'tool_call_id'):
-                                    print(f"🛠️ TOOL CALL ID: {last_message.tool_call_id}")
-                                if hasattr(last_message, 'content'):
-                                    print(f"🛠️ TOOL RESPONSE LENGTH: {len(last_message.content)} chars")
-                                    print(f"🛠️ TOOL RESPONSE PREVIEW (first 500 chars):\n{last_message.content[:500]}...")
-                    
-                    # Handle section completions and send progress updates
-                    if "market_report" in chunk and chunk["market_report"] and "market_report" not in reports_completed:
-                        print("✅ Market report completed!")
-                        agent_progress["Market Analyst"] = "completed"
-                        reports_completed.append("market_report")
-                        
-                        events = [
-                            json.dumps({'type': 'agent_status', 'agent': 'market', 'status': 'completed'}),
-                            json.dumps({'type': 'report', 'section': 'market_report', 'content': chunk['market_report']}),
-                            json.dumps({'type': 'progress', 'content': '25'})
-                        ]
-                        
-                        for event in events:
-                            print(f"📤 Sending: {event[:100]}...")
-                            yield f"data: {event}\n\n"
-                    
-                    if "sentiment_report" in chunk and chunk["sentiment_report"] and "sentiment_report" not in reports_completed:
-                        print("✅ Sentiment report completed!")
-                        agent_progress["Social Media Analyst"] = "completed"
-                        reports_completed.append("sentiment_report")
-                        
-                        events = [
-                            json.dumps({'type': 'agent_status', 'agent': 'social', 'status': 'completed'}),
-                            json.dumps({'type': 'report', 'section': 'sentiment_report', 'content': chunk['sentiment_report']}),
-                            json.dumps({'type': 'progress', 'content': '40'})
-                        ]
-                        
-                        for event in events:
-                            print(f"📤 Sending: {event[:100]}...")
-                            yield f"data: {event}\n\n"
-                    
-                    if "news_report" in chunk and chunk["news_report"] and "news_report" not in reports_completed:
-                        print("✅ News report completed!")
-                        agent_progress["News Analyst"] = "completed"
-                        reports_completed.append("news_report")
-                        
-                        events = [
-                            json.dumps({'type': 'agent_status', 'agent': 'news', 'status': 'completed'}),
-                            json.dumps({'type': 'report', 'section': 'news_report', 'content': chunk['news_report']}),
-                            json.dumps({'type': 'progress', 'content': '55'})
-                        ]
-                        
-                        for event in events:
-                            print(f"📤 Sending: {event[:100]}...")
-                            yield f"data: {event}\n\n"
-                    
-                    if "fundamentals_report" in chunk and chunk["fundamentals_report"] and "fundamentals_report" not in reports_completed:
-                        print("✅ Fundamentals report completed!")
-                        agent_progress["Fundamentals Analyst"] = "completed"
-                        
-                        # Start research team only if all analysts are done
-                        all_analysts_done = all(agent_progress[agent] == "completed" for agent in ["Market Analyst", "Social Media Analyst", "News Analyst", "Fundamentals Analyst"])
-                        
-                        if all_analysts_done:
-                            agent_progress["Bull Researcher"] = "in_progress"
-                            agent_progress["Bear Researcher"] = "in_progress"
-                        
-                        reports_completed.append("fundamentals_report")
-                        
-                        events = [
-                            json.dumps({'type': 'agent_status', 'agent': 'fundamentals', 'status': 'completed'}),
-                            json.dumps({'type': 'report', 'section': 'fundamentals_report', 'content': chunk['fundamentals_report']}),
-                            json.dumps({'type': 'progress', 'content': '70'})
-                        ]
-                        
-                        # Add research team start events if all analysts are done
-                        if all_analysts_done:
-                            events.extend([
-                                json.dumps({'type': 'agent_status', 'agent': 'bull_researcher', 'status': 'in_progress'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'bear_researcher', 'status': 'in_progress'})
-                            ])
-                        
-                        for event in events:
-                            print(f"📤 Sending: {event[:100]}...")
-                            yield f"data: {event}\n\n"
-                    
-                    # Handle research team debates
-                    if "investment_debate_state" in chunk and chunk["investment_debate_state"]:
-                        print("🔄 Processing investment debate state...")
-                        debate_state = chunk["investment_debate_state"]
-                        
-                        if "judge_decision" in debate_state and debate_state["judge_decision"] and "investment_plan" not in reports_completed:
-                            print("✅ Investment plan completed!")
-                            agent_progress["Bull Researcher"] = "completed"
-                            agent_progress["Bear Researcher"] = "completed"
-                            agent_progress["Research Manager"] = "completed"
-                            agent_progress["Trading Team"] = "in_progress"
-                            reports_completed.append("investment_plan")
-                            
-                            events = [
-                                json.dumps({'type': 'agent_status', 'agent': 'bull_researcher', 'status': 'completed'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'bear_researcher', 'status': 'completed'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'research_manager', 'status': 'completed'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'trader', 'status': 'in_progress'}),
-                                json.dumps({'type': 'report', 'section': 'investment_plan', 'content': debate_state['judge_decision']}),
-                                json.dumps({'type': 'progress', 'content': '85'})
-                            ]
-                            
-                            for event in events:
-                                print(f"📤 Sending: {event[:100]}...")
-                                yield f"data: {event}\n\n"
-                    
-                    # Handle trading team
-                    if "trader_investment_plan" in chunk and chunk["trader_investment_plan"] and "trader_investment_plan" not in reports_completed:
-                        print("✅ Trading plan completed!")
-                        agent_progress["Trading Team"] = "completed"
-                        agent_progress["Risky Analyst"] = "in_progress"  # Start risk analysis phase
-                        agent_progress["Safe Analyst"] = "in_progress"
-                        agent_progress["Neutral Analyst"] = "in_progress"
-                        reports_completed.append("trader_investment_plan")
-                        
-                        events = [
-                            json.dumps({'type': 'agent_status', 'agent': 'trader', 'status': 'completed'}),
-                            json.dumps({'type': 'agent_status', 'agent': 'risky_analyst', 'status': 'in_progress'}),
-                            json.dumps({'type': 'agent_status', 'agent': 'safe_analyst', 'status': 'in_progress'}),
-                            json.dumps({'type': 'agent_status', 'agent': 'neutral_analyst', 'status': 'in_progress'}),
-                            json.dumps({'type': 'report', 'section': 'trader_investment_plan', 'content': chunk['trader_investment_plan']}),
-                            json.dumps({'type': 'progress', 'content': '90'})
-                        ]
-                        
-                        for event in events:
-                            print(f"📤 Sending: {event[:100]}...")
-                            yield f"data: {event}\n\n"
-                    
-                    # Handle risk analysis completion
-                    if "risk_debate_state" in chunk and chunk["risk_debate_state"]:
-                        print("🔄 Processing risk debate state...")
-                        risk_state = chunk["risk_debate_state"]
-                        
-                        if "judge_decision" in risk_state and risk_state["judge_decision"] and "risk_analysis" not in reports_completed:
-                            print("✅ Risk analysis completed!")
-                            agent_progress["Risky Analyst"] = "completed"
-                            agent_progress["Safe Analyst"] = "completed"
-                            agent_progress["Neutral Analyst"] = "completed"
-                            agent_progress["Risk Manager"] = "completed"
-                            reports_completed.append("risk_analysis")
-                            
-                            events = [
-                                json.dumps({'type': 'agent_status', 'agent': 'risky_analyst', 'status': 'completed'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'safe_analyst', 'status': 'completed'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'neutral_analyst', 'status': 'completed'}),
-                                json.dumps({'type': 'agent_status', 'agent': 'risk_manager', 'status': 'completed'}),
-                                json.dumps({'type': 'report', 'section': 'risk_analysis', 'content': risk_state['judge_decision']}),
-                                json.dumps({'type': 'progress', 'content': '95'})
-                            ]
-                            
-                            for event in events:
-                                print(f"📤 Sending: {event[:100]}...")
-                                yield f"data: {event}\n\n"
-                    
-                    # Handle final decision
-                    if "final_trade_decision" in chunk and chunk["final_trade_decision"] and "final_trade_decision" not in reports_completed:
-                        print("✅ Final decision completed!")
-                        reports_completed.append("final_trade_decision")
-                        
-                        events = [
-                            json.dumps({'type': 'report', 'section': 'final_trade_decision', 'content': chunk['final_trade_decision']}),
-                            json.dumps({'type': 'progress', 'content': '100'})
-                        ]
-                        
-                        for event in events:
-                            print(f"📤 Sending: {event[:100]}...")
-                            yield f"data: {event}\n\n"
-                
-                print(f"🔄 Streaming completed. Processed {chunk_count} chunks, {len(reports_completed)} reports completed")
-                
-                # Get the final state using graph.invoke() like the regular endpoint does
-                # This ensures we get the complete accumulated state
-                print("🔍 Getting final state using graph.invoke()...")
-                try:
-                    final_state = graph.graph.invoke(init_agent_state, **args)
-                    print(f"✅ Final state retrieved successfully")
-                    print(f"🔍 Final state keys: {list(final_state.keys())}")
-                except Exception as e:
-                    print(f"❌ Error getting final state: {e}")
-                    # Fallback to chunk accumulation
-                    print("🔄 Falling back to chunk accumulation...")
-                    final_state = {}
-                    for chunk in trace:
-                        if chunk:
-                            final_state.update(chunk)
-                
-                # Extract final decision and process signal
-                final_decision = final_state.get("final_trade_decision", "")
-                print(f"🎯 Final decision found: {len(final_decision)} characters")
-                if final_decision:
-                    print(f"🎯 Final decision preview: {final_decision[:200]}...")
-                else:
-                    print("❌ No final decision found in final state!")
-                    # Check if it's in a nested structure
-                    if "risk_debate_state" in final_state:
-                        risk_state = final_state["risk_debate_state"]
-                        if "judge_decision" in risk_state:
-                            final_decision = risk_state["judge_decision"]
-                            print(f"🎯 Found final decision in risk_debate_state: {len(final_decision)} characters")
-                            print(f"🎯 Risk decision preview: {final_decision[:200]}...")
-                
-                processed_signal = graph.process_signal(final_decision)
-                print(f"🔄 Processed signal: {processed_signal}")
-                
-                # Validate that we have the key reports
-                report_keys = ["market_report", "sentiment_report", "news_report", "fundamentals_report", "final_trade_decision"]
-                for key in report_keys:
-                    value = final_state.get(key)
-                    if value:
-                        print(f"✅ {key}: {len(value)} characters")
-                    else:
-                        print(f"❌ {key}: Missing or empty")
-                
-                # Save results to disk (same as regular analyze endpoint)
-                try:
-                    results = {
-                        "ticker": ticker,
-                        "analysis_date": analysis_date,
-                        "market_report": final_state.get("market_report"),
-                        "sentiment_report": final_state.get("sentiment_report"),
-                        "news_report": final_state.get("news_report"),
-                        "fundamentals_report": final_state.get("fundamentals_report"),
-                        "investment_plan": final_state.get("investment_plan"),
-                        "trader_investment_plan": final_state.get("trader_investment_plan"),
-                        "final_trade_decision": final_state.get("final_trade_decision"),
-                        "processed_signal": processed_signal
-                    }
-                    
-                    config = get_config()
-                    saved_path = save_results_to_disk(ticker, analysis_date, results, config)
-                    print(f"✅ Results saved to: {saved_path}")
-                    
-                except Exception as save_error:
-                    print(f"⚠️ Failed to save results: {save_error}")
-                
-                # Send completion
-                completion_event = json.dumps({'type': 'complete', 'message': 'Analysis completed successfully', 'signal': processed_signal})
-                print(f"📤 Sending completion: {completion_event}")
-                yield f"data: {completion_event}\n\n"
-                
-            except Exception as e:
-                print(f"💥 Error in streaming: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                error_event = json.dumps({'type': 'error', 'message': str(e)})
-                print(f"📤 Sending error: {error_event}")
-                yield f"data: {error_event}\n\n"
-        
-        return StreamingResponse(
-            event_stream(),
-            media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "Cache-Control",
-                "X-Accel-Buffering": "no"  # Disable nginx buffering
-            }
-        )
-        
-    except Exception as e:
-        print(f"💥 Error in stream_analysis: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    The analysis runs as a queued job, so it shares admission control, dedupe
+    and the result store with /jobs; this relays the job's events (the same
+    stream as /jobs/{id}/stream). A client that disconnects only stops
+    following: the run continues for anyone else waiting on it.
+    """
+    job = await submit_analysis(ticker)
+    print(f"📡 Streaming job {job.job_id} for {job.ticker}")
+    return job_event_response(job)
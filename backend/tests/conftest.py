@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# api.py opens its job store at import time; keep it out of the repo's results dir
+os.environ.setdefault("TRADINGAGENTS_RESULTS_DIR", tempfile.mkdtemp(prefix="tradingagents-results-"))
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+from typing import TypedDict
+
+from fastapi.testclient import TestClient
+from langgraph.graph import END, START, StateGraph
+
+import api
+from tradingagents.graph.propagation import Propagator
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.utils.analysis_jobs import (
+    FAILED,
+    RUNNING,
+    AnalysisJob,
+    JobManager,
+    JobResultStore,
+    process_owner,
+)
+
+
+class _State(TypedDict, total=False):
+    company_of_interest: str
+    trade_date: str
+    market_report: str
+    final_trade_decision: str
+
+
+class StubGraph:
+    """Two-node graph run through the real TradingAgentsGraph.stream_states"""
+
+    stream_states = TradingAgentsGraph.stream_states
+    instances = []
+
+    def __init__(self, selected_analysts, debug, config):
+        builder = StateGraph(_State)
+        builder.add_node("Market Analyst", lambda state: {"market_report": "Uptrend"})
+        builder.add_node("Risk Judge", lambda state: {"final_trade_decision": "FINAL TRANSACTION PROPOSAL: **BUY**"})
+        builder.add_edge(START, "Market Analyst")
+        builder.add_edge("Market Analyst", "Risk Judge")
+        builder.add_edge("Risk Judge", END)
+        self.graph = builder.compile()
+        self.propagator = Propagator()
+        self.logged = []
+        StubGraph.instances.append(self)
+
+    def _log_state(self, trade_date, final_state):
+        self.logged.append((trade_date, final_state))
+
+    def process_signal(self, full_signal):
+        return "BUY"
+
+
+def _walk(span):
+    yield span
+    for child in span["children"]:
+        yield from _walk(child)
+
+
+def _use_stub_graph(tmp_path, monkeypatch):
+    config = {**api.get_config(), "results_dir": str(tmp_path)}
+    monkeypatch.setattr(api, "get_config", lambda: config)
+    monkeypatch.setattr(api, "TradingAgentsGraph", StubGraph)
+
+
+def test_run_analysis_job_records_node_spans_and_logs_state(tmp_path, monkeypatch):
+    _use_stub_graph(tmp_path, monkeypatch)
+    job = AnalysisJob(job_id="job-1", ticker="AAPL", analysis_date="2024-01-02")
+
+    results = asyncio.run(api.run_analysis_job(job))
+
+    summary = results["timing_summary"]
+    assert set(summary["agent_times"]) == {"Market Analyst", "Risk Judge"}
+    assert results["market_report"] == "Uptrend"
+    assert results["processed_signal"] == "BUY"
+
+    graph = StubGraph.instances[-1]
+    assert graph.logged and graph.logged[0][1]["final_trade_decision"].endswith("**BUY**")
+    assert graph.curr_state["market_report"] == "Uptrend"
+
+    with open(os.path.join(tmp_path, "AAPL", "2024-01-02", "trace.json")) as f:
+        trace = json.load(f)
+    assert {span["name"] for span in _walk(trace["root"]) if span["kind"] == "node"} == {
+        "Market Analyst", "Risk Judge"}
+
+    sections = [e["section"] for e in job.events if e["type"] == "report"]
+    assert sections == ["market_report", "final_trade_decision"]
+
+
+def test_analyze_stream_runs_through_the_job_queue(tmp_path, monkeypatch):
+    _use_stub_graph(tmp_path, monkeypatch)
+    manager = JobManager(api.run_analysis_job, JobResultStore(str(tmp_path / "jobs.sqlite3")))
+    monkeypatch.setattr(api, "job_manager", manager)
+
+    with TestClient(api.app) as client:
+        body = client.get("/analyze/stream", params={"ticker": "aapl"}).text
+        events = [json.loads(line[len("data: "):]) for line in body.splitlines() if line.startswith("data: ")]
+        assert events[0]["type"] == "status"
+        assert events[-1] == {"type": "complete", "message": "Analysis completed successfully", "signal": "BUY"}
+
+        # A second stream for the same ticker and date reuses the stored result
+        client.get("/analyze/stream", params={"ticker": "AAPL"})
+        stats = client.get("/jobs/stats").json()
+    assert stats["submitted"] == 1
+    assert stats["reused"] == 1
+
+
+def test_restart_only_fails_jobs_whose_process_is_gone(tmp_path):
+    store = JobResultStore(str(tmp_path / "jobs.sqlite3"))
+    host = socket.gethostname()
+    gone = subprocess.Popen([sys.executable, "-c", "pass"])
+    gone.wait()
+    owners = {
+        "mine": process_owner(),
+        "other-worker": f"{host}:{os.getppid()}",
+        "other-host": "elsewhere:1",
+        "dead-worker": f"{host}:{gone.pid}",
+        "legacy": None,
+    }
+    for job_id, owner in owners.items():
+        store.save(AnalysisJob(job_id=job_id, ticker="AAPL", analysis_date="2024-01-02",
+                               status=RUNNING, owner=owner))
+
+    assert store.mark_interrupted() == 2
+    assert {job_id for job_id in owners if store.get(job_id).status == FAILED} == {"dead-worker", "legacy"}
+    assert store.get("mine").owner == process_owner()
+
+
+def test_store_adds_the_owner_column_to_an_existing_database(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE analysis_jobs (job_id TEXT PRIMARY KEY, ticker TEXT NOT NULL,"
+            " analysis_date TEXT NOT NULL, status TEXT NOT NULL, created_at REAL,"
+            " started_at REAL, finished_at REAL, result TEXT, error TEXT)"
+        )
+        conn.execute("INSERT INTO analysis_jobs (job_id, ticker, analysis_date, status)"
+                     " VALUES ('old', 'AAPL', '2024-01-02', 'running')")
+
+    store = JobResultStore(path)
+    assert store.mark_interrupted() == 1
+    assert store.get("old").status == FAILED
@@ -1,75 +1,46 @@
-import chromadb
-from chromadb.config import Settings
-from openai import OpenAI
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from .vector_memory import EmbeddingFunction, VectorMemoryStore, make_embedder
 
 
 class FinancialSituationMemory:
-    def __init__(self, name, config):
-        if config["backend_url"] == "http://localhost:11434/v1":
-            self.embedding = "nomic-embed-text"
-        else:
-            self.embedding = "text-embedding-3-small"
-        self.client = OpenAI(base_url=config["backend_url"])
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
+    """Situation memory backed by a persistent, memory-mapped vector store"""
+
+    def __init__(self, name, config, embedder: Optional[EmbeddingFunction] = None):
+        self.name = name
+        self.embedder = embedder or make_embedder(config)
+        root = config.get("memory_dir") or os.path.join(config["data_cache_dir"], "memory")
+        self.store = VectorMemoryStore.open(root, name, self.embedder)
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
-
-    def add_situations(self, situations_and_advice):
-        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
-
-        situations = []
-        advice = []
-        ids = []
-        embeddings = []
-
-        offset = self.situation_collection.count()
-
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
-            situations.append(situation)
-            advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
-
-        self.situation_collection.add(
-            documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
-            embeddings=embeddings,
-            ids=ids,
-        )
-
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
-        query_embedding = self.get_embedding(current_situation)
-
-        results = self.situation_collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_matches,
-            include=["metadatas", "documents", "distances"],
-        )
-
-        matched_results = []
-        for i in range(len(results["documents"][0])):
-            matched_results.append(
-                {
-                    "matched_situation": results["documents"][0][i],
-                    "recommendation": results["metadatas"][0][i]["recommendation"],
-                    "similarity_score": 1 - results["distances"][0][i],
-                }
-            )
-
-        return matched_results
+        """Get the embedding for a text"""
+        return self.embedder([text])[0].tolist()
+
+    def add_situations(self, situations_and_advice: List[Tuple[str, str]]):
+        """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)
+
+        New situations are embedded in one batch; known ones reuse their stored vector.
+        """
+        self.store.add(situations_and_advice)
+
+    def get_memories(self, current_situation, n_matches=1) -> List[Dict[str, Any]]:
+        """Find matching recommendations by cosine similarity"""
+        return [
+            {
+                "matched_situation": record["situation"],
+                "recommendation": record["recommendation"],
+                "similarity_score": score,
+            }
+            for record, score in self.store.search(current_situation, n_matches)
+        ]
 
 
 if __name__ == "__main__":
-    # Example usage
-    matcher = FinancialSituationMemory()
+    # Example usage (offline hashing embeddings)
+    from tradingagents.default_config import DEFAULT_CONFIG
+
+    matcher = FinancialSituationMemory("example_memory", {**DEFAULT_CONFIG, "memory_embedder": "hashing"})
 
     # Example data
     example_data = [
@@ -0,0 +1,364 @@
+"""
+Vector Memory Store
+Persistent, memory-mapped situation embeddings with vectorized cosine top-k
+
+Each memory (bull, bear, trader, ...) gets a directory per embedding model:
+- vectors.f32    float32 rows, L2-normalized (cosine similarity = dot product),
+                 append-only and read back through np.memmap
+- records.jsonl  one record per row: situation digest, situation, recommendation
+
+Situations are embedded in batches, and a situation that is already stored
+(same digest) reuses its vector instead of calling the embedder again. A
+(situation, recommendation) pair is stored once. Beyond max_records the oldest
+rows are compacted away, so both files and the in-memory records stay bounded.
+Queries use an exact matrix-vector top-k; collections of IVF_MIN_ROWS or more
+also build an IVF index (k-means lists, probing the nearest few) so lookups
+stay sub-millisecond as memories grow. Embedders are pluggable callables
+mapping a list of texts to a (n, dim) array; HashingEmbedder needs no network.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HASH_DIM = 512
+IVF_MIN_ROWS = 4096
+IVF_PROBES = 8
+QUERY_CACHE_SIZE = 256
+
+# Rows kept per store; compaction runs once the store is COMPACT_SLACK over it
+DEFAULT_MAX_RECORDS = 5000
+COMPACT_SLACK = 1.25
+
+# Longest text sent to an embedding API (characters)
+MAX_EMBED_CHARS = 6000
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+EmbeddingFunction = Callable[[Sequence[str]], np.ndarray]
+
+
+def situation_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class HashingEmbedder:
+    """Offline embedder: signed feature hashing of word unigrams and bigrams"""
+
+    def __init__(self, dim: int = DEFAULT_HASH_DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _index(self, token: str) -> Tuple[int, float]:
+        h = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+        return h % self.dim, (1.0 if (h >> 63) & 1 else -1.0)
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = _TOKEN.findall((text or "").lower())
+            for token in tokens + [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]:
+                index, sign = self._index(token)
+                out[row, index] += sign
+        return out
+
+
+class OpenAIEmbedder:
+    """OpenAI-compatible embeddings API, one request per batch"""
+
+    def __init__(self, model: str = "text-embedding-3-small", base_url: Optional[str] = None,
+                 client: Any = None, batch_size: int = 64):
+        self.model = model
+        self.base_url = base_url
+        self.batch_size = batch_size
+        self._client = client
+        self.name = f"openai-{model}"
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(base_url=self.base_url) if self.base_url else OpenAI()
+        return self._client
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[List[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = [(t or " ")[:MAX_EMBED_CHARS] for t in texts[start:start + self.batch_size]]
+            response = self.client.embeddings.create(model=self.model, input=batch)
+            rows.extend(item.embedding for item in sorted(response.data, key=lambda d: d.index))
+        return np.asarray(rows, dtype=np.float32)
+
+
+def make_embedder(config: Dict[str, Any]) -> EmbeddingFunction:
+    """Embedder selected by config["memory_embedder"]: "openai" (default) or "hashing" """
+    kind = (config.get("memory_embedder") or "openai").lower()
+    if kind == "openai":
+        backend_url = config.get("backend_url")
+        if backend_url == "http://localhost:11434/v1":
+            return OpenAIEmbedder("nomic-embed-text", base_url=backend_url)
+        return OpenAIEmbedder("text-embedding-3-small", base_url=backend_url)
+    return HashingEmbedder()
+
+
+class IVFIndex:
+    """Inverted-file index: k-means centroids, each with the rows closest to it"""
+
+    def __init__(self, vectors: np.ndarray, n_lists: int, iterations: int = 8, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        sample = vectors[rng.choice(len(vectors), size=min(len(vectors), n_lists * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[assignment == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            centroids = _normalize(centroids)
+        self.centroids = centroids
+        self.lists: List[np.ndarray] = [np.empty(0, dtype=np.int64) for _ in range(n_lists)]
+        self.size = 0
+        self.add(vectors, 0)
+
+    def add(self, vectors: np.ndarray, first_row: int):
+        assignment = np.argmax(vectors @ self.centroids.T, axis=1)
+        rows = np.arange(first_row, first_row + len(vectors), dtype=np.int64)
+        for c in np.unique(assignment):
+            self.lists[c] = np.concatenate([self.lists[c], rows[assignment == c]])
+        self.size += len(vectors)
+
+    def candidates(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        scores = self.centroids @ query
+        probes = np.argpartition(-scores, min(n_probe, len(scores)) - 1)[:n_probe]
+        return np.concatenate([self.lists[c] for c in probes])
+
+
+class VectorMemoryStore:
+    """Append-only embedding store for one memory and one embedding model"""
+
+    _instances: Dict[str, "VectorMemoryStore"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def open(cls, root: str, name: str, embedder: EmbeddingFunction) -> "VectorMemoryStore":
+        """Shared store per directory, so every graph in the process sees the same rows"""
+        path = os.path.join(root, name, getattr(embedder, "name", "custom"))
+        with cls._instances_lock:
+            store = cls._instances.get(path)
+            if store is None:
+                store = cls(path, embedder)
+                cls._instances[path] = store
+            return store
+
+    def __init__(self, path: str, embedder: EmbeddingFunction,
+                 ivf_min_rows: int = IVF_MIN_ROWS, n_probe: int = IVF_PROBES,
+                 max_records: int = DEFAULT_MAX_RECORDS):
+        self.path = path
+        self.embedder = embedder
+        self.ivf_min_rows = ivf_min_rows
+        self.n_probe = n_probe
+        self.max_records = max_records
+        self._lock = threading.RLock()
+        self._vectors_file = os.path.join(path, "vectors.f32")
+        self._records_file = os.path.join(path, "records.jsonl")
+        self.records: List[Dict[str, str]] = []
+        self._rows_by_digest: Dict[str, int] = {}
+        self._pairs: set = set()  # (digest, recommendation) already stored
+        self._matrix: Optional[np.ndarray] = None
+        self._dim: Optional[int] = None
+        self._ivf: Optional[IVFIndex] = None
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.stats = {"embedded": 0, "embedding_reused": 0, "queries": 0,
+                      "query_cache_hits": 0, "ivf_queries": 0, "compactions": 0}
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _load(self):
+        records = []
+        if os.path.exists(self._records_file):
+            with open(self._records_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break  # Partial tail from an interrupted write
+        meta_file = os.path.join(self.path, "meta.json")
+        if os.path.exists(meta_file):
+            with open(meta_file) as f:
+                self._dim = json.load(f)["dim"]
+        rows = 0
+        if self._dim and os.path.exists(self._vectors_file):
+            rows = os.path.getsize(self._vectors_file) // (4 * self._dim)
+        count = min(len(records), rows)
+        if count < max(len(records), rows):
+            logger.warning(f"⚠️ Memory store {self.path}: trimming to {count} consistent rows")
+            self._truncate(count, records[:count])
+        self.records = records[:count]
+        self._index_records()
+        self._remap()
+        logger.info(f"🧠 Loaded memory store {self.path}: {count} situations")
+
+    def _index_records(self):
+        self._rows_by_digest = {}
+        for i, r in enumerate(self.records):
+            self._rows_by_digest.setdefault(r["digest"], i)
+        self._pairs = {(r["digest"], r["recommendation"]) for r in self.records}
+
+    def _truncate(self, count: int, records: List[Dict[str, str]]):
+        if self._dim and os.path.exists(self._vectors_file):
+            with open(self._vectors_file, "r+b") as f:
+                f.truncate(count * 4 * self._dim)
+        with open(self._records_file, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _remap(self):
+        count = len(self.records)
+        if count and self._dim:
+            self._matrix = np.memmap(self._vectors_file, dtype=np.float32, mode="r", shape=(count, self._dim))
+        else:
+            self._matrix = None
+        if self._ivf is not None and self._ivf.size < count:
+            if count > 2 * self._ivf.size:
+                self._ivf = None  # Grown a lot: re-cluster
+            else:
+                self._ivf.add(np.asarray(self._matrix[self._ivf.size:]), self._ivf.size)
+        if self._ivf is None and count >= self.ivf_min_rows:
+            self._ivf = IVFIndex(np.asarray(self._matrix), n_lists=int(np.sqrt(count)))
+            logger.info(f"🗂️ Built IVF index for {self.path}: {len(self._ivf.lists)} lists")
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        vectors = _normalize(self.embedder(texts))
+        self.stats["embedded"] += len(texts)
+        return vectors
+
+    def add(self, situations_and_advice: Sequence[Tuple[str, str]]):
+        """Store (situation, recommendation) pairs, embedding new situations in one batch"""
+        with self._lock:
+            pairs, digests, seen = [], [], set()
+            for situation, recommendation in situations_and_advice:
+                if not situation or not situation.strip():
+                    continue
+                digest = situation_digest(situation)
+                if (digest, recommendation) in self._pairs or (digest, recommendation) in seen:
+                    continue  # Already remembered
+                seen.add((digest, recommendation))
+                pairs.append((situation, recommendation))
+                digests.append(digest)
+            if not pairs:
+                return
+            new = OrderedDict()
+            for digest, (situation, _) in zip(digests, pairs):
+                if digest not in self._rows_by_digest and digest not in new:
+                    new[digest] = situation
+            fresh = dict(zip(new, self._embed(list(new.values())))) if new else {}
+
+            vectors = []
+            for digest in digests:
+                if digest in fresh:
+                    vectors.append(fresh[digest])
+                else:
+                    vectors.append(self._matrix[self._rows_by_digest[digest]])
+                    self.stats["embedding_reused"] += 1
+            block = np.asarray(vectors, dtype=np.float32)
+
+            if self._dim is None:
+                self._dim = block.shape[1]
+                with open(os.path.join(self.path, "meta.json"), "w") as f:
+                    json.dump({"dim": self._dim, "embedder": getattr(self.embedder, "name", "custom")}, f)
+            with open(self._vectors_file, "ab") as f:
+                f.write(block.tobytes())
+            with open(self._records_file, "a", encoding="utf-8") as f:
+                for digest, (situation, recommendation) in zip(digests, pairs):
+                    f.write(json.dumps({"digest": digest, "situation": situation,
+                                        "recommendation": recommendation}, ensure_ascii=False) + "\n")
+
+            first = len(self.records)
+            for offset, (digest, (situation, recommendation)) in enumerate(zip(digests, pairs)):
+                self.records.append({"digest": digest, "situation": situation, "recommendation": recommendation})
+                self._rows_by_digest.setdefault(digest, first + offset)
+                self._pairs.add((digest, recommendation))
+            self._remap()
+            if len(self.records) > self.max_records * COMPACT_SLACK:
+                self._compact()
+
+    def _compact(self):
+        """Drop the oldest rows down to max_records, rewriting both files"""
+        drop = len(self.records) - self.max_records
+        vectors = np.array(self._matrix[drop:])
+        records = self.records[drop:]
+        self._matrix = None  # Release the memmap before replacing its file
+        with open(self._vectors_file + ".tmp", "wb") as f:
+            f.write(vectors.tobytes())
+        with open(self._records_file + ".tmp", "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(self._vectors_file + ".tmp", self._vectors_file)
+        os.replace(self._records_file + ".tmp", self._records_file)
+        self.records = records
+        self._index_records()
+        self._ivf = None
+        self.stats["compactions"] += 1
+        logger.info(f"🧹 Compacted memory store {self.path}: dropped {drop} oldest situations")
+        self._remap()
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        digest = situation_digest(text)
+        row = self._rows_by_digest.get(digest)
+        if row is not None:
+            return np.asarray(self._matrix[row])
+        cached = self._query_cache.get(digest)
+        if cached is not None:
+            self._query_cache.move_to_end(digest)
+            self.stats["query_cache_hits"] += 1
+            return cached
+        vector = self._embed([text])[0]
+        self._query_cache[digest] = vector
+        while len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return vector
+
+    def search(self, text: str, k: int = 2) -> List[Tuple[Dict[str, str], float]]:
+        """Top-k stored situations by cosine similarity, best first"""
+        with self._lock:
+            if self._matrix is None or k <= 0:
+                return []
+            self.stats["queries"] += 1
+            query = self._query_vector(text)
+            if self._ivf is not None:
+                self.stats["ivf_queries"] += 1
+                rows = self._ivf.candidates(query, self.n_probe)
+                scores = np.asarray(self._matrix[rows]) @ query
+            else:
+                rows = None
+                scores = np.asarray(self._matrix) @ query
+            k = min(k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self.records[int(rows[i] if rows is not None else i)], float(scores[i])) for i in top]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "situations": len(self.records), "dim": self._dim,
+                    "ivf_lists": len(self._ivf.lists) if self._ivf is not None else 0}
@@ -16,6 +16,9 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # Persistent situation memories (vector store) and their embeddings: openai | hashing
+    "memory_dir": os.getenv("TRADINGAGENTS_MEMORY_DIR", ""),
+    "memory_embedder": os.getenv("MEMORY_EMBEDDER", "openai"),
     # API Server settings
     "api_host": os.getenv("TRADINGAGENTS_API_HOST", "localhost"),
     "api_port": int(os.getenv("TRADINGAGENTS_API_PORT", "8000")),
@@ -1,19 +1,147 @@
 # TradingAgents/graph/signal_processing.py
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
 from langchain_openai import ChatOpenAI
 
+# Rule-based extractions at or above this confidence skip the LLM
+FAST_PATH_MIN_CONFIDENCE = 0.8
+
+# Processed signals kept by text digest
+SIGNAL_CACHE_SIZE = 256
+
+_DECISION = r"(?:STRONG\s+)?(BUY|SELL|HOLD)"
+# A decision word that is a call, not prose: upper case or bolded, not part of a
+# hyphenated word ("Buy-side", "Sell-off"), and closing its clause
+_CALL_END = r"(?![\w-])(?=\s*(?:$|[.,;:!?)\]*\-–—]))"
+_CALL = (
+    r"(?:\*\*\s*(?i:strong\s+)?(?i:(BUY|SELL|HOLD))\s*\*\*"
+    r"|(?i:strong\s+)?(BUY|SELL|HOLD)" + _CALL_END + r")"
+)
+
+# Templates echoed from prompts ("BUY/HOLD/SELL", "BUY, SELL, or HOLD") are not decisions
+_OPTION_LISTS = re.compile(
+    r"\b(?:BUY|SELL|HOLD)(?:\s*(?:/|,|\bor\b)\s*(?:or\s+)?(?:BUY|SELL|HOLD)\b)+", re.IGNORECASE
+)
+_PROPOSAL = re.compile(r"(?i:FINAL\s+TRANSACTION\s+PROPOSAL)\s*:?\s*" + _CALL, re.MULTILINE)
+_LABELED = re.compile(
+    r"(?i:final\s+(?:trade\s+|trading\s+)?decision|recommendation|decision|action|verdict|rating)"
+    r"\s*\**\s*[:\-–]\s*(?:\*\*\s*(?=\w))?" + _CALL,
+    re.MULTILINE,
+)
+_BOLD = re.compile(r"\*\*\s*" + _DECISION + r"\s*\*\*", re.IGNORECASE)
+_BARE = re.compile(r"\b(BUY|SELL|HOLD)\b")  # Upper case only: prose "hold"/"buy" is not a call
+
+
+@dataclass
+class SignalExtraction:
+    """Rule-based decision with how sure the rules are about it"""
+    decision: Optional[str]
+    confidence: float
+    rule: str
+
+
+def _calls(pattern: re.Pattern, text: str) -> List[str]:
+    """Decisions matched by a _CALL pattern, in order (bold or upper-case group)"""
+    return [bold or upper for bold, upper in pattern.findall(text)]
+
+
+def _single(matches) -> Optional[str]:
+    """The decision if all matches agree, else None"""
+    decisions = {m.upper() for m in matches}
+    return decisions.pop() if len(decisions) == 1 else None
+
+
+def extract_decision(text: str) -> SignalExtraction:
+    """
+    Extract BUY/SELL/HOLD from a final decision without an LLM.
+
+    Rules, most explicit first: the FINAL TRANSACTION PROPOSAL marker, labeled
+    lines ("Recommendation: BUY"), bold decisions (**SELL**), then a lone
+    upper-case decision word. Marker and label rules only take an upper-case or
+    bolded word that ends its clause, so "Rating: Buy-side demand..." or
+    "Recommendation: Hold off" are not calls. Conflicting matches at one level
+    lower the confidence (the last labeled decision wins, as reports conclude at
+    the end); a labeled decision contradicted by a bold one is left to the LLM.
+    """
+    if not text or not text.strip():
+        return SignalExtraction(None, 0.0, "empty")
+    text = _OPTION_LISTS.sub(" ", text)
+
+    proposals = _calls(_PROPOSAL, text)
+    if proposals:
+        decision = _single(proposals)
+        if decision:
+            return SignalExtraction(decision, 0.99, "proposal")
+        return SignalExtraction(proposals[-1].upper(), 0.7, "proposal-conflict")
+
+    labeled = _calls(_LABELED, text)
+    bold_matches = _BOLD.findall(text)
+    bold = _single(bold_matches)
+    if labeled:
+        decision = _single(labeled)
+        if decision and bold_matches and bold != decision:
+            return SignalExtraction(None, 0.0, "labeled-bold-conflict")
+        if decision:
+            return SignalExtraction(decision, 0.95, "labeled")
+        return SignalExtraction(labeled[-1].upper(), 0.6, "labeled-conflict")
+
+    if bold:
+        return SignalExtraction(bold, 0.9, "bold")
+
+    bare = _BARE.findall(text)
+    decision = _single(bare)
+    if decision:
+        return SignalExtraction(decision, 0.75, "keyword")
+    return SignalExtraction(None, 0.0, "ambiguous" if bare else "none")
+
+
+_signal_cache: "OrderedDict[str, str]" = OrderedDict()
+_signal_cache_lock = threading.Lock()
+_signal_stats = {"fast_path": 0, "llm": 0, "cache_hits": 0}
+
+
+def _signal_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def _cache_get(digest: str) -> Optional[str]:
+    with _signal_cache_lock:
+        result = _signal_cache.get(digest)
+        if result is not None:
+            _signal_cache.move_to_end(digest)
+            _signal_stats["cache_hits"] += 1
+        return result
+
+
+def _cache_put(digest: str, result: str):
+    with _signal_cache_lock:
+        _signal_cache[digest] = result
+        _signal_cache.move_to_end(digest)
+        while len(_signal_cache) > SIGNAL_CACHE_SIZE:
+            _signal_cache.popitem(last=False)
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
-    def __init__(self, quick_thinking_llm: ChatOpenAI):
+    def __init__(self, quick_thinking_llm: ChatOpenAI, min_confidence: float = FAST_PATH_MIN_CONFIDENCE):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        self.min_confidence = min_confidence
 
     def process_signal(self, full_signal: str) -> str:
         """
         Process a full trading signal to extract the core decision.
 
+        Explicit decisions are extracted by rules; the LLM is only asked when
+        the text is ambiguous. Results are cached by text digest.
+
         Args:
             full_signal: Complete trading signal text
 
@@ -26,7 +154,22 @@ class SignalProcessor:
         if not full_signal or not full_signal.strip():
             print("❌ Empty signal provided to process_signal")
             return "HOLD - No signal provided"
-        
+
+        digest = _signal_digest(full_signal)
+        cached = _cache_get(digest)
+        if cached is not None:
+            print(f"🔍 Signal processing result (cached): {cached}")
+            return cached
+
+        extraction = extract_decision(full_signal)
+        if extraction.decision and extraction.confidence >= self.min_confidence:
+            print(f"⚡ Signal fast path: {extraction.decision} "
+                  f"({extraction.rule}, confidence {extraction.confidence:.2f})")
+            _signal_stats["fast_path"] += 1
+            _cache_put(digest, extraction.decision)
+            return extraction.decision
+
+        print(f"🤖 Signal ambiguous ({extraction.rule}) - asking LLM")
         messages = [
             (
                 "system",
@@ -37,4 +180,12 @@ class SignalProcessor:
 
         result = self.quick_thinking_llm.invoke(messages).content
         print(f"🔍 Signal processing result: {result}")
+        _signal_stats["llm"] += 1
+        _cache_put(digest, result)
         return result
+
+    @staticmethod
+    def get_stats() -> Dict[str, int]:
+        """Fast-path, LLM and cache counters across all processors"""
+        with _signal_cache_lock:
+            return {**_signal_stats, "cache_size": len(_signal_cache)}
@@ -26,6 +26,7 @@ from tradingagents.agents.utils.agent_states import (
     RiskDebateState,
 )
 from tradingagents.dataflows.interface import set_config
+from tradingagents.utils.tracing import start_run
 
 from .conditional_logic import ConditionalLogic
 from .setup import GraphSetup
@@ -176,25 +177,16 @@ class TradingAgentsGraph:
     def propagate(self, company_name, trade_date):
         """Run the trading agents graph for a company on a specific date."""
 
-        self.ticker = company_name
-
-        # Initialize state
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
-        )
-        args = self.propagator.get_graph_args()
-
         if self.debug:
             # Debug mode with tracing
             logger.info("🐛 Running in debug mode with full tracing")
-            trace = []
             chunk_count = 0
-            
-            for chunk in self.graph.stream(init_agent_state, **args):
+
+            for chunk in self.stream_states(company_name, trade_date):
                 chunk_count += 1
                 logger.info(f"🔄 Processing chunk {chunk_count}")
                 logger.info(f"📋 Chunk keys: {list(chunk.keys())}")
-                
+
                 # Check for any message updates in analyst channels
                 message_channels = ["market_messages", "social_messages", "news_messages", "fundamentals_messages"]
                 for channel in message_channels:
@@ -207,34 +199,27 @@ class TradingAgentsGraph:
                                 logger.info(f"📝 Content preview: {str(last_msg.content)[:200]}...")
                             if hasattr(last_msg, 'tool_calls') and last_msg.tool_calls:
                                 logger.info(f"🔧 Tool calls: {[tc.name if hasattr(tc, 'name') else str(tc) for tc in last_msg.tool_calls]}")
-                
+
                 # Check for report updates
                 report_keys = ["market_report", "sentiment_report", "news_report", "fundamentals_report"]
                 for report_key in report_keys:
                     if report_key in chunk and chunk[report_key]:
                         logger.info(f"📊 Report generated: {report_key} ({len(chunk[report_key])} chars)")
-                
-                trace.append(chunk)
 
             logger.info(f"✅ Debug execution complete. Processed {chunk_count} chunks")
-            final_state = trace[-1] if trace else init_agent_state
         else:
-            # Standard mode without tracing
+            # Standard mode (no per-chunk logging)
             logger.info("🏃 Running in standard mode")
             try:
-                final_state = self.graph.invoke(init_agent_state, **args)
+                for _ in self.stream_states(company_name, trade_date):
+                    pass
                 logger.info("✅ Standard execution complete")
             except Exception as e:
                 logger.error(f"❌ Error during graph execution: {str(e)}")
                 logger.error(f"❌ Error type: {type(e).__name__}")
                 raise
 
-        # Store current state for reflection
-        self.curr_state = final_state
-
-        # Log state
-        logger.info("💾 Logging final state")
-        self._log_state(trade_date, final_state)
+        final_state = self.curr_state
 
         # Process final decision
         final_decision = final_state.get("final_trade_decision", "No decision made")
@@ -247,6 +232,40 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, processed_signal
 
+    def stream_states(self, company_name, trade_date):
+        """
+        Run the graph and yield the full state after every step.
+
+        Node, tool and LLM spans are recorded into the current run (one is
+        started if none is active). Once the stream completes, the final state
+        is kept for reflection and logged.
+        """
+
+        self.ticker = company_name
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = {**self.propagator.get_graph_args(), "stream_mode": "values"}
+        final_state = init_agent_state
+
+        with start_run(f"analysis:{company_name}", ticker=company_name, trade_date=str(trade_date)) as run:
+            # Record node/tool/LLM spans into the current run
+            args["config"]["callbacks"] = [run.callback_handler()]
+
+            for chunk in self.graph.stream(init_agent_state, **args):
+                if chunk:
+                    final_state = chunk
+                yield chunk
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state
+        logger.info("💾 Logging final state")
+        self._log_state(trade_date, final_state)
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
         self.log_states_dict[str(trade_date)] = {
@@ -0,0 +1,381 @@
+"""
+Analysis Job Queue
+Bounded worker pool, per-(ticker, date) dedupe and a SQLite result store
+
+Every analysis is a full multi-LLM pipeline, so the API runs them as jobs:
+- submit() returns a job id immediately; identical (ticker, date) requests that
+  arrive while a run is queued or running share that run, and a completed run
+  is reused for ANALYSIS_RESULT_TTL seconds
+- at most ANALYSIS_MAX_CONCURRENCY jobs run at once; at most ANALYSIS_MAX_QUEUE
+  wait, beyond that submit() raises JobQueueFullError (admission control)
+- jobs publish SSE-style events that any number of clients can follow
+- final job records go to SQLite so they survive restarts and can be polled;
+  each record names the process running it, so workers sharing the database
+  only fail jobs whose process is gone
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .async_bridge import run_blocking
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("ANALYSIS_MAX_CONCURRENCY", "2"))
+DEFAULT_MAX_QUEUE = int(os.getenv("ANALYSIS_MAX_QUEUE", "32"))
+DEFAULT_RESULT_TTL = int(os.getenv("ANALYSIS_RESULT_TTL", "3600"))
+
+# Finished jobs kept in memory (with their events); older ones live in SQLite only
+MAX_FINISHED_IN_MEMORY = 256
+
+QUEUED, RUNNING, COMPLETED, FAILED = "queued", "running", "completed", "failed"
+FINISHED_STATES = (COMPLETED, FAILED)
+
+
+class JobQueueFullError(Exception):
+    """Raised when the queue is at capacity; callers should retry later"""
+
+
+def process_owner() -> str:
+    """Owner id of jobs run by this process: host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_gone(owner: Optional[str]) -> bool:
+    """Whether the process that owned a job no longer runs (unknown hosts count as alive)"""
+    if not owner:
+        return True  # Recorded before jobs had owners
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass  # Alive, run by another user
+    return False
+
+
+@dataclass
+class AnalysisJob:
+    """One analysis run and the events it has published so far"""
+    job_id: str
+    ticker: str
+    analysis_date: str
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    owner: Optional[str] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    _changed: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.ticker, self.analysis_date)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def publish(self, event: Dict[str, Any]):
+        """Append an event and wake everyone following this job"""
+        self.events.append(event)
+        self._notify()
+
+    def _notify(self):
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+    def _waiter(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.job_id,
+            "ticker": self.ticker,
+            "analysis_date": self.analysis_date,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobResultStore:
+    """SQLite-backed store of job records (blocking; call via run_blocking)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_jobs ("
+                " job_id TEXT PRIMARY KEY, ticker TEXT NOT NULL, analysis_date TEXT NOT NULL,"
+                " status TEXT NOT NULL, created_at REAL, started_at REAL, finished_at REAL,"
+                " result TEXT, error TEXT, owner TEXT)"
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(analysis_jobs)")}
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE analysis_jobs ADD COLUMN owner TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_jobs_key"
+                " ON analysis_jobs (ticker, analysis_date, status, finished_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def save(self, job: AnalysisJob):
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_jobs (job_id, ticker, analysis_date, status,"
+                " created_at, started_at, finished_at, result, error, owner)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.job_id, job.ticker, job.analysis_date, job.status, job.created_at,
+                 job.started_at, job.finished_at,
+                 json.dumps(job.result, default=str) if job.result is not None else None,
+                 job.error, job.owner),
+            )
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM analysis_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._from_row(row)
+
+    def find_completed(self, ticker: str, analysis_date: str, max_age: float) -> Optional[AnalysisJob]:
+        """Most recent completed job for (ticker, date) no older than max_age seconds"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM analysis_jobs WHERE ticker = ? AND analysis_date = ? AND status = ?"
+                " AND finished_at >= ? ORDER BY finished_at DESC LIMIT 1",
+                (ticker, analysis_date, COMPLETED, time.time() - max_age),
+            ).fetchone()
+        return self._from_row(row)
+
+    def mark_interrupted(self) -> int:
+        """Fail jobs left queued/running by a process that is no longer running"""
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT job_id, owner FROM analysis_jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchall()
+            orphaned = [(row["job_id"],) for row in rows if _owner_gone(row["owner"])]
+            conn.executemany(
+                "UPDATE analysis_jobs SET status = ?, error = ?, finished_at = ? WHERE job_id = ?",
+                [(FAILED, "Interrupted by server restart", time.time(), job_id) for job_id, in orphaned],
+            )
+            return len(orphaned)
+
+    @staticmethod
+    def _from_row(row) -> Optional[AnalysisJob]:
+        if row is None:
+            return None
+        return AnalysisJob(
+            job_id=row["job_id"], ticker=row["ticker"], analysis_date=row["analysis_date"],
+            status=row["status"], created_at=row["created_at"], started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"], owner=row["owner"],
+        )
+
+
+JobRunner = Callable[[AnalysisJob], Awaitable[Dict[str, Any]]]
+
+
+class JobManager:
+    """Admission control, dedupe and a fixed set of async workers"""
+
+    def __init__(self, runner: JobRunner, store: JobResultStore,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_queue: int = DEFAULT_MAX_QUEUE,
+                 result_ttl: float = DEFAULT_RESULT_TTL):
+        self.runner = runner
+        self.store = store
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(1, max_queue)
+        self.result_ttl = result_ttl
+        self.owner = process_owner()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._active: Dict[Tuple[str, str], AnalysisJob] = {}
+        self._stats = {"submitted": 0, "deduplicated": 0, "reused": 0,
+                       "rejected": 0, "completed": 0, "failed": 0}
+
+    async def start(self):
+        """Start the workers (call from the app's startup hook)"""
+        if self._workers:
+            return
+        interrupted = await run_blocking(self.store.mark_interrupted)
+        if interrupted:
+            logger.warning(f"⚠️ Marked {interrupted} interrupted jobs as failed")
+        self._queue = asyncio.Queue(self.max_queue)
+        self._workers = [asyncio.create_task(self._worker(i)) for i in range(self.max_concurrency)]
+        logger.info(f"🚀 Job workers started: concurrency={self.max_concurrency}, queue={self.max_queue}")
+
+    async def stop(self):
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, ticker: str, analysis_date: str) -> Tuple[AnalysisJob, bool]:
+        """
+        Submit an analysis, sharing an in-flight or recent run when possible.
+
+        Returns:
+            (job, created) - created is False when an existing job was returned
+
+        Raises:
+            JobQueueFullError: too many jobs are already waiting
+        """
+        if self._queue is None:
+            await self.start()
+        key = (ticker, analysis_date)
+
+        active = self._active.get(key)
+        if active is not None:
+            self._stats["deduplicated"] += 1
+            logger.info(f"🔁 Joining in-flight job {active.job_id} for {ticker} {analysis_date}")
+            return active, False
+
+        if self.result_ttl > 0:
+            recent = await run_blocking(self.store.find_completed, ticker, analysis_date, self.result_ttl)
+            # A run may have been admitted while the store was queried
+            active = self._active.get(key)
+            if active is not None:
+                self._stats["deduplicated"] += 1
+                return active, False
+            if recent is not None:
+                self._stats["reused"] += 1
+                logger.info(f"♻️ Reusing completed job {recent.job_id} for {ticker} {analysis_date}")
+                return self._remember(recent), False
+
+        job = AnalysisJob(job_id=uuid.uuid4().hex, ticker=ticker, analysis_date=analysis_date,
+                          owner=self.owner)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            raise JobQueueFullError(f"Analysis queue is full ({self.max_queue} jobs waiting)")
+
+        self._stats["submitted"] += 1
+        self._active[key] = job
+        self._remember(job)
+        job.publish({"type": "status", "message": f"Queued analysis for {ticker}..."})
+        await run_blocking(self.store.save, job)
+        logger.info(f"📥 Queued job {job.job_id} for {ticker} {analysis_date} (queue: {self._queue.qsize()})")
+        return job, True
+
+    async def get(self, job_id: str) -> Optional[AnalysisJob]:
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return await run_blocking(self.store.get, job_id)
+
+    async def wait(self, job: AnalysisJob) -> AnalysisJob:
+        """Wait until a job has finished"""
+        while not job.finished:
+            await job._waiter().wait()
+        return job
+
+    async def events(self, job: AnalysisJob, since: int = 0) -> AsyncIterator[Dict[str, Any]]:
+        """Replay a job's events from index `since`, then follow until it finishes"""
+        index = since
+        while True:
+            waiter = job._waiter()
+            while index < len(job.events):
+                yield job.events[index]
+                index += 1
+            if job.finished:
+                if not job.events:
+                    yield self._final_event(job)
+                return
+            await waiter.wait()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "running": sum(1 for job in self._active.values() if job.status == RUNNING),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+    def _remember(self, job: AnalysisJob) -> AnalysisJob:
+        self._jobs[job.job_id] = job
+        self._jobs.move_to_end(job.job_id)
+        finished = [job_id for job_id, j in self._jobs.items() if j.finished]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_IN_MEMORY)]:
+            del self._jobs[job_id]
+        return job
+
+    @staticmethod
+    def _final_event(job: AnalysisJob) -> Dict[str, Any]:
+        if job.status == COMPLETED:
+            signal = (job.result or {}).get("processed_signal")
+            return {"type": "complete", "message": "Analysis completed successfully", "signal": signal}
+        return {"type": "error", "message": job.error or "Analysis failed"}
+
+    async def _worker(self, index: int):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: AnalysisJob):
+        job.status = RUNNING
+        job.started_at = time.time()
+        job._notify()
+        await run_blocking(self.store.save, job)
+        logger.info(f"🏃 Running job {job.job_id} for {job.ticker} {job.analysis_date}")
+        try:
+            job.result = await self.runner(job)
+            job.status = COMPLETED
+            self._stats["completed"] += 1
+        except asyncio.CancelledError:
+            job.status = FAILED
+            job.error = "Cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"❌ Job {job.job_id} failed: {e}")
+            job.status = FAILED
+            job.error = str(e)
+            self._stats["failed"] += 1
+        finally:
+            job.finished_at = time.time()
+            self._active.pop(job.key, None)
+            job.publish(self._final_event(job))
+            try:
+                await asyncio.shield(run_blocking(self.store.save, job))
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to store job {job.job_id}: {e}")
+            self._remember(job)
+            logger.info(f"🏁 Job {job.job_id} {job.status} in {job.finished_at - job.started_at:.1f}s")
@@ -0,0 +1,132 @@
+"""
+Async bridge for running the synchronous graph from async handlers
+
+The graph, its LLM clients and the result writers are blocking. These helpers
+run them on a bounded thread pool so FastAPI's event loop keeps serving other
+requests:
+- run_blocking(): await one blocking call
+- iterate_in_thread(): consume a blocking iterator (e.g. graph.stream())
+  through a bounded asyncio.Queue with backpressure; when the consumer stops
+  (client disconnect, error) the producer stops at its next item and the
+  iterator is closed.
+
+Context variables (e.g. the current trace) are copied into the worker thread.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import os
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Threads available for blocking analysis work
+DEFAULT_MAX_THREADS = int(os.getenv("ANALYSIS_MAX_THREADS", "8"))
+
+# Items buffered between a producer thread and its async consumer
+DEFAULT_QUEUE_SIZE = 16
+
+# How often a blocked producer re-checks for cancellation (seconds)
+_PUT_POLL_INTERVAL = 0.5
+
+_ITEM, _ERROR, _DONE = "item", "error", "done"
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared pool for blocking analysis work"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_THREADS, thread_name_prefix="analysis"
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call on the analysis pool with the caller's context"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(get_executor(), functools.partial(ctx.run, func, *args, **kwargs))
+
+
+async def iterate_in_thread(make_iterator: Callable[[], Iterator[Any]],
+                            maxsize: int = DEFAULT_QUEUE_SIZE,
+                            should_stop: Optional[Callable[[], Awaitable[bool]]] = None) -> AsyncIterator[Any]:
+    """
+    Consume a blocking iterator without blocking the event loop.
+
+    Args:
+        make_iterator: Zero-argument callable creating the iterator (called in
+            the worker thread, so its setup doesn't block either)
+        maxsize: Queue bound; the producer waits while the consumer is behind
+        should_stop: Optional async check run before each item (e.g.
+            request.is_disconnected); iteration ends quietly when it returns True
+
+    Yields:
+        Items of the iterator, in order. Exceptions raised by the iterator are
+        re-raised here.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+    stopped = threading.Event()
+
+    def put(kind: str, value: Any) -> bool:
+        """Blocking put from the worker thread; False once the consumer is gone"""
+        while not stopped.is_set():
+            future = asyncio.run_coroutine_threadsafe(queue.put((kind, value)), loop)
+            try:
+                future.result(timeout=_PUT_POLL_INTERVAL)
+                return True
+            except concurrent.futures.TimeoutError:
+                if not future.cancel():
+                    return True  # Completed while we were cancelling
+        return False
+
+    def produce():
+        iterator = None
+        try:
+            iterator = make_iterator()
+            for item in iterator:
+                if not put(_ITEM, item):
+                    logger.info("🛑 Stream consumer gone - stopping producer")
+                    break
+        except BaseException as e:
+            put(_ERROR, e)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to close stream iterator: {e}")
+            put(_DONE, None)
+
+    ctx = contextvars.copy_context()
+    producer = loop.run_in_executor(get_executor(), ctx.run, produce)
+    try:
+        while True:
+            kind, value = await queue.get()
+            if kind == _DONE:
+                break
+            if kind == _ERROR:
+                raise value
+            if should_stop is not None and await should_stop():
+                logger.info("🛑 Stream stopped by consumer")
+                break
+            yield value
+    finally:
+        stopped.set()
+        # Unblock a producer waiting on a full queue
+        while not queue.empty():
+            queue.get_nowait()
+        if producer.done() and not producer.cancelled():
+            producer.exception()
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import os
 from datetime import date
 from typing import Dict, Any
 
@@ -45,6 +46,14 @@ async def run_trading_analysis(company_name: str, analysis_date: str = None) ->
         logger.error(f"Analysis failed: {e}")
         raise
 
+def _get_graph_cache():
+    """Import the graph cache the same way the studio entry point imports the graph"""
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from agent.graph.graph_cache import get_graph_cache
+    return get_graph_cache()
+
 def create_studio_compatible_graph():
     """Create a LangGraph Studio compatible graph"""
     import importlib
@@ -53,16 +62,10 @@ def create_studio_compatible_graph():
     logger = logging.getLogger(__name__)
     
     try:
-        # Dynamic import to avoid circular dependencies
-        # Import using absolute path from src
-        import sys
-        import os
-        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from agent.graph.trading_graph import TradingAgentsGraph
-        
-        # Create graph instance with simplified signature
-        trading_graph_instance = TradingAgentsGraph(
-            config=DEFAULT_CONFIG,
+        # Compiled graphs are cached per effective config and analyst selection,
+        # so only the first call pays for LLM clients, toolkits and compilation
+        trading_graph_instance = _get_graph_cache().get(
+            config=DEFAULT_CONFIG.copy(),
             selected_analysts=["market", "social", "news", "fundamentals"]
         )
         
@@ -72,6 +75,13 @@ def create_studio_compatible_graph():
         logger.error(f"Failed to create graph: {e}")
         raise
 
+def prewarm_graph():
+    """Build the default graph on a background thread so the first request finds it compiled"""
+    return _get_graph_cache().prewarm(
+        config=DEFAULT_CONFIG.copy(),
+        selected_analysts=["market", "social", "news", "fundamentals"]
+    )
+
 def graph(config: RunnableConfig):
     """
     LangGraph Studio compatible graph factory function.
@@ -89,9 +99,14 @@ def get_graph():
     """Get a graph instance for direct use."""
     return create_studio_compatible_graph()
 
+# Optional warm pool: build the default graph at server startup instead of on the first request
+if os.getenv("ENABLE_GRAPH_PREWARM", "false").lower() == "true":
+    prewarm_graph()
+
 __all__ = [
     "run_trading_analysis",
     "create_studio_compatible_graph",
     "graph",
-    "get_graph"
+    "get_graph",
+    "prewarm_graph"
 ]
@@ -20,6 +20,7 @@ from ..dataflows.ultra_fast_fundamentals_collector import (
 from ..dataflows.crypto_price_fetcher import CryptoPriceFetcher
 
 from ..utils.debug_logging import debug_node, log_llm_interaction
+from ..utils.structured_reports import FundamentalsPayload, structured_update
 
 # Import Universal Validator for comprehensive monitoring
 from ..monitoring.universal_validator import validate, ValidationSeverity
@@ -113,6 +114,23 @@ async def get_or_create_collector(api_key: str) -> UltraFastFundamentalsCollecto
     return _global_collector
 
 
+def build_fundamentals_payload(ticker: str, fundamental_data: Dict[str, Any], is_crypto: bool) -> Optional[FundamentalsPayload]:
+    """Headline metrics for state["structured_reports"]["fundamentals"] (no statement tables)"""
+    if not fundamental_data:
+        return None
+    metrics = fundamental_data.get('metrics') or {}
+    if isinstance(metrics, dict) and isinstance(metrics.get('metric'), dict):
+        # Finnhub /stock/metric nests the latest values under "metric" next to long time series
+        metrics = metrics['metric']
+    return {
+        'ticker': ticker,
+        'asset_type': 'cryptocurrency' if is_crypto else 'stock',
+        'profile': fundamental_data.get('profile') or {},
+        'metrics': metrics,
+        'price_targets': fundamental_data.get('price_targets') or {}
+    }
+
+
 def create_fundamentals_analyst_crypto_aware(llm=None, toolkit=None):
     """
     Create crypto-aware fundamentals analyst that handles both stocks and cryptocurrencies.
@@ -284,7 +302,8 @@ def create_fundamentals_analyst_crypto_aware(llm=None, toolkit=None):
                 "sender": "Fundamentals Analyst CryptoAware",
                 "execution_time": total_time,
                 "fetch_time": fetch_time,
-                "asset_type": 'cryptocurrency' if is_crypto else 'stock'
+                "asset_type": 'cryptocurrency' if is_crypto else 'stock',
+                **structured_update("fundamentals", build_fundamentals_payload(ticker, fundamental_data, is_crypto))
             }
             
             # Return state update
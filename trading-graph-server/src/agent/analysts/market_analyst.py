@@ -28,6 +28,7 @@ def create_market_analyst(llm, toolkit):
         if toolkit.config["online_tools"]:
             tools = [
                 toolkit.get_YFin_data_online,
+                toolkit.get_stockstats_indicators_table_online,
                 toolkit.get_stockstats_indicators_report_online,
             ]
             # Add additional tools if available
@@ -38,6 +39,7 @@ def create_market_analyst(llm, toolkit):
         else:
             tools = [
                 toolkit.get_YFin_data,
+                toolkit.get_stockstats_indicators_table,
                 toolkit.get_stockstats_indicators_report,
             ]
 
@@ -54,7 +56,7 @@ def create_market_analyst(llm, toolkit):
             base_system_message = """Expert market analyst: TA & trading signals.
 
 MANDATORY: Use tools→get real data before analysis.
-Tools: get_YFin_data, get_stockstats_indicators_report
+Tools: get_YFin_data, get_stockstats_indicators_table (all indicators in ONE call)
 
 Workflow: 1)Call tools 2)Get data 3)Analyze 4)Report
 
@@ -13,6 +13,8 @@ import sys
 import os
 import time
 
+from ..utils.structured_reports import MarketPayload, structured_update
+
 logger = logging.getLogger(__name__)
 
 # State Definition for LangGraph
@@ -767,6 +769,19 @@ async def market_analyst_node(state: MarketAnalystState) -> Dict[str, Any]:
             'error': str(e)
         }
 
+def build_market_payload(market_data: Optional[Dict[str, Any]]) -> Optional[MarketPayload]:
+    """Indicator values for state["structured_reports"]["market"]"""
+    if not market_data:
+        return None
+    return {
+        "ticker": market_data.get("ticker", ""),
+        "current_price": market_data.get("current_price", 0),
+        "indicators": market_data.get("indicators", {}),
+        "indicator_count": market_data.get("indicator_count", 0),
+        "engine": market_data.get("engine", ""),
+        "timestamp": market_data.get("timestamp", "")
+    }
+
 # Legacy Integration Function
 def create_ultra_fast_market_analyst(llm=None, toolkit=None):
     """Create market analyst compatible with existing LangGraph integration"""
@@ -789,7 +804,8 @@ def create_ultra_fast_market_analyst(llm=None, toolkit=None):
         return {
             "market_data": result.get("market_data"),
             "market_report": result.get("market_report"),
-            "sender": "Ultra Fast Market Analyst (Async-Compatible)"
+            "sender": "Ultra Fast Market Analyst (Async-Compatible)",
+            **structured_update("market", build_market_payload(result.get("market_data")))
         }
     
     return ultra_fast_market_analyst_node
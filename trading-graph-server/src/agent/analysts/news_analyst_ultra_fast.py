@@ -19,6 +19,9 @@ from ..monitoring.universal_validator import validate, ValidationSeverity
 
 # Import News Token Optimizer for 92.6% token reduction
 from ..utils.news_token_optimizer import NewsTokenOptimizer, generate_optimized_news_report
+from ..utils.structured_reports import NewsPayload, compact_json, structured_update
+from ..utils.partial_gather import GatherSource, gather_partial
+from ..utils.sentiment_lexicon import NEWS_LEXICON
 
 logger = logging.getLogger(__name__)
 
@@ -79,7 +82,8 @@ def create_news_analyst_ultra_fast(llm, toolkit):
                     logger.error(f"🚨 NEWS DATA STRUCTURE VALIDATION FAILED: {data_completeness_validation.message}")
             
             # Phase 2: Analyze and generate structured report
-            report = generate_news_report(company, news_data, current_date)
+            payload = build_news_payload(company, news_data, current_date)
+            report = generate_news_report(company, news_data, current_date, payload=payload)
             
             # Phase 3: Log completion
             execution_time = time.time() - start_time
@@ -92,7 +96,8 @@ def create_news_analyst_ultra_fast(llm, toolkit):
             new_state = {
                 "news_report": report,
                 "news_messages": [],  # No LLM messages needed
-                "sender": "News Analyst (Ultra-Fast)"
+                "sender": "News Analyst (Ultra-Fast)",
+                **structured_update("news", payload)
             }
             
             # 🔍 UNIVERSAL VALIDATION: State transition validation
@@ -134,8 +139,82 @@ RECOMMENDATION: Manual review required for {company} news sentiment.
     return news_analyst_ultra_fast_node
 
 
+# Latency budget for the whole news-gathering stage and per-source deadlines (seconds)
+NEWS_LATENCY_BUDGET = 12.0
+NEWS_SOURCE_DEADLINES = {
+    "serper": 10.0,
+    "finnhub": 6.0,
+}
+
+
+async def fetch_serper_articles(company: str, toolkit) -> List[Dict[str, Any]]:
+    """Fetch Google News articles through Serper"""
+    # Direct import of serper utils
+    from ..dataflows.serper_utils import getNewsDataSerperAPIWithPagination
+    
+    # Get API configuration
+    config = getattr(toolkit, 'config', {})
+    
+    return await getNewsDataSerperAPIWithPagination(
+        query_or_company=company,
+        max_pages=2,  # TOKEN OPTIMIZATION: Reduced from 5 to 2 pages to prevent token explosion
+        config=config
+    )
+
+
+async def fetch_finnhub_articles(company: str, toolkit) -> List[Dict[str, Any]]:
+    """Fetch the last 7 days of Finnhub news without blocking the event loop"""
+    # Calculate date range (last 7 days)
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=7)
+    
+    # The Finnhub tool is synchronous, so it runs on a worker thread
+    finnhub_result = await asyncio.to_thread(
+        toolkit.get_finnhub_news.invoke,
+        {
+            "ticker": company,
+            "start_date": start_date.strftime('%Y-%m-%d'),
+            "end_date": end_date.strftime('%Y-%m-%d')
+        }
+    )
+    
+    # Parse the result - it's typically a formatted string, we need to extract articles
+    if finnhub_result and "No news" not in finnhub_result:
+        return parse_finnhub_result(finnhub_result)
+    return []
+
+
+def _article_key(article: Dict[str, Any]) -> Optional[str]:
+    """Identity of an article across sources: its URL, else its normalized title"""
+    url = (article.get("link") or article.get("url") or "").strip().lower().rstrip("/")
+    if url:
+        return url
+    title = (article.get("title") or article.get("headline") or "").strip().lower()
+    return " ".join(title.split()) or None
+
+
+def merge_articles(existing: List[Dict[str, Any]], incoming: List[Dict[str, Any]], seen: set) -> List[Dict[str, Any]]:
+    """Append articles not seen from any source yet, updating the seen keys"""
+    merged = list(existing)
+    for article in incoming:
+        key = _article_key(article)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        merged.append(article)
+    return merged
+
+
 async def gather_news_data(company: str, toolkit, start_time: float) -> Dict[str, Any]:
-    """Gather news data from multiple sources with direct API calls"""
+    """
+    Gather news data from all configured sources concurrently.
+    
+    Every source runs at the same time under its own deadline, and results are
+    merged and de-duplicated as they arrive. Sources still running when the
+    latency budget is spent are cancelled, so the stage takes about as long as
+    the slowest source that finishes in time rather than the sum of all of them.
+    """
     
     news_data = {
         "serper_articles": [],
@@ -143,80 +222,57 @@ async def gather_news_data(company: str, toolkit, start_time: float) -> Dict[str
         "total_articles": 0,
         "sources_attempted": 0,
         "sources_successful": 0,
+        "sources_timed_out": [],
+        "source_times": {},
         "data_fetch_time": 0
     }
     
     # Data collection start time
     data_start = time.time()
+    config = getattr(toolkit, 'config', {}) or {}
+    budget = config.get("news_latency_budget", NEWS_LATENCY_BUDGET)
     
-    # Try Serper API for Google News
-    try:
-        news_data["sources_attempted"] += 1
-        logger.info("🔍 NEWS_ANALYST_ULTRA_FAST: Fetching Serper news data")
-        
-        # Direct import of serper utils
-        from ..dataflows.serper_utils import getNewsDataSerperAPIWithPagination
-        
-        # Get API configuration
-        config = getattr(toolkit, 'config', {})
-        
-        # Call Serper API directly
-        serper_start = time.time()
-        serper_articles = await getNewsDataSerperAPIWithPagination(
-            query_or_company=company,
-            max_pages=2,  # TOKEN OPTIMIZATION: Reduced from 5 to 2 pages to prevent token explosion
-            config=config
+    # Configured news sources
+    fetchers = {"serper": fetch_serper_articles}
+    if hasattr(toolkit, 'get_finnhub_news'):
+        fetchers["finnhub"] = fetch_finnhub_articles
+    else:
+        logger.warning("⚠️ NEWS_ANALYST_ULTRA_FAST: get_finnhub_news tool not available in toolkit")
+    news_data["sources_attempted"] = len(fetchers)
+    
+    seen = set()
+    
+    def on_articles(name: str, articles: List[Dict[str, Any]]):
+        # Merge each source as soon as it lands, de-duplicating across sources
+        key = f"{name}_articles"
+        merged = merge_articles(news_data[key], articles, seen)
+        added = len(merged) - len(news_data[key])
+        news_data[key] = merged
+        news_data["sources_successful"] += 1
+        news_data["total_articles"] += added
+        logger.info(
+            f"✅ NEWS_ANALYST_ULTRA_FAST: {name.capitalize()} data fetched - {len(articles)} articles "
+            f"({added} new)"
         )
-        serper_time = time.time() - serper_start
-        
-        if serper_articles:
-            news_data["serper_articles"] = serper_articles
-            news_data["sources_successful"] += 1
-            news_data["total_articles"] += len(serper_articles)
-            logger.info(f"✅ NEWS_ANALYST_ULTRA_FAST: Serper data fetched - {len(serper_articles)} articles in {serper_time:.3f}s")
-        else:
-            logger.warning("⚠️ NEWS_ANALYST_ULTRA_FAST: Serper API returned no results")
-            
-    except Exception as e:
-        logger.error(f"❌ NEWS_ANALYST_ULTRA_FAST: Serper API error: {e}")
     
-    # Try Finnhub API for financial news
-    try:
-        news_data["sources_attempted"] += 1
-        logger.info("🔍 NEWS_ANALYST_ULTRA_FAST: Fetching Finnhub news data")
-        
-        # Use the Finnhub news tool
-        if hasattr(toolkit, 'get_finnhub_news'):
-            finnhub_start = time.time()
-            
-            # Calculate date range (last 7 days)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=7)
-            
-            # Call Finnhub news tool - use invoke method 
-            finnhub_result = toolkit.get_finnhub_news.invoke({
-                "ticker": company,  
-                "start_date": start_date.strftime('%Y-%m-%d'), 
-                "end_date": end_date.strftime('%Y-%m-%d')  
-            })
-            
-            finnhub_time = time.time() - finnhub_start
-            
-            # Parse the result - it's typically a formatted string, we need to extract articles
-            if finnhub_result and "No news" not in finnhub_result:
-                # Convert the string result to a list format for consistency
-                finnhub_articles = parse_finnhub_result(finnhub_result)
-                news_data["finnhub_articles"] = finnhub_articles
-                news_data["sources_successful"] += 1
-                news_data["total_articles"] += len(finnhub_articles)
-                logger.info(f"✅ NEWS_ANALYST_ULTRA_FAST: Finnhub data fetched - {len(finnhub_articles)} articles in {finnhub_time:.3f}s")
-            else:
-                logger.warning("⚠️ NEWS_ANALYST_ULTRA_FAST: Finnhub API returned no results")
-        else:
-            logger.warning("⚠️ NEWS_ANALYST_ULTRA_FAST: get_finnhub_news tool not available in toolkit")
-                
-    except Exception as e:
-        logger.error(f"❌ NEWS_ANALYST_ULTRA_FAST: Finnhub API error: {e}")
+    logger.info(f"🔍 NEWS_ANALYST_ULTRA_FAST: Fetching {', '.join(fetchers)} news concurrently (budget {budget:.1f}s)")
+    gathered = await gather_partial(
+        [
+            GatherSource(name, lambda fetch=fetch: fetch(company, toolkit),
+                         deadline=NEWS_SOURCE_DEADLINES.get(name), accept=bool)
+            for name, fetch in fetchers.items()
+        ],
+        budget=budget,
+        on_result=on_articles,
+    )
+    news_data["source_times"] = gathered.source_times
+    logger.info(f"⏱️ NEWS_ANALYST_ULTRA_FAST: Source times " +
+                ", ".join(f"{name}={t:.3f}s" for name, t in gathered.source_times.items()))
+    news_data["sources_timed_out"] = gathered.timed_out + gathered.cancelled
+    for name in gathered.rejected:
+        logger.warning(f"⚠️ NEWS_ANALYST_ULTRA_FAST: {name.capitalize()} API returned no results")
+    for name in gathered.cancelled:
+        logger.warning(f"⏰ NEWS_ANALYST_ULTRA_FAST: {name} cancelled after {budget:.1f}s budget")
     
     # Calculate total data fetch time
     news_data["data_fetch_time"] = time.time() - data_start
@@ -229,53 +285,16 @@ async def gather_news_data(company: str, toolkit, start_time: float) -> Dict[str
     return news_data
 
 
-def generate_news_report(company: str, news_data: Dict[str, Any], current_date: str) -> str:
-    """Generate pure data collection report"""
-    import json
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # TOKEN OPTIMIZATION: Use optimizer if enabled
-    if USE_TOKEN_OPTIMIZATION:
-        logger.critical("🔥🔥🔥 TOKEN OPTIMIZATION ENABLED 🔥🔥🔥")
-        logger.critical(f"🔥 Using NewsTokenOptimizer for 92.6% token reduction")
-        
-        # Initialize the optimizer
-        optimizer = NewsTokenOptimizer()
-        
-        # Get the raw articles
-        serper_articles = news_data.get("serper_articles", [])
-        finnhub_articles = news_data.get("finnhub_articles", [])
-        
-        # Optimize the articles
-        optimized_articles = optimizer.optimize_news_data(serper_articles, finnhub_articles)
-        
-        # Generate optimized report
-        optimized_report = generate_optimized_news_report(company, optimized_articles, timestamp)
-        
-        # Log comparison
-        logger.critical(f"🔥 OPTIMIZATION COMPLETE:")
-        logger.critical(f"🔥 Report size: {len(optimized_report)} chars (~{len(optimized_report)//4} tokens)")
-        logger.critical(f"🔥 This replaces reports that would be 50,000+ chars")
-        
-        return optimized_report
-    
-    # CRITICAL: Apply token-aware filtering to prevent massive prompt tokens
-    MAX_ARTICLES = 15  # Token optimization: limit to top 15 most relevant articles
-    
-    # 🚨 RUNTIME VERIFICATION: Log article limiting behavior
-    total_available = len(news_data.get("serper_articles", [])) + len(news_data.get("finnhub_articles", []))
-    logger.critical(f"🔥🔥🔥 ARTICLE LIMIT VERIFICATION 🔥🔥🔥")
-    logger.critical(f"🔥 MAX_ARTICLES limit: {MAX_ARTICLES}")
-    logger.critical(f"🔥 Total articles available: {total_available}")
-    logger.critical(f"🔥 Articles will be limited to: {min(total_available, MAX_ARTICLES)}")
-    
-    # Prepare structured data
+# Token optimization: limit to top 15 most relevant articles
+MAX_REPORT_ARTICLES = 15
+
+
+def _collect_articles(news_data: Dict[str, Any], max_articles: int) -> List[Dict[str, Any]]:
+    """Normalize Serper and Finnhub articles into one list, Serper first"""
     all_articles = []
     
     # Add Serper articles (limited to prevent token explosion)
-    serper_articles = news_data.get("serper_articles", [])[:MAX_ARTICLES]
-    logger.critical(f"🔥 SERPER: Using {len(serper_articles)} of {len(news_data.get('serper_articles', []))} articles")
+    serper_articles = news_data.get("serper_articles", [])[:max_articles]
     logger.info(f"📰 TOKEN OPTIMIZATION: Using {len(serper_articles)} of {len(news_data.get('serper_articles', []))} Serper articles")
     
     for idx, article in enumerate(serper_articles):
@@ -294,9 +313,8 @@ def generate_news_report(company: str, news_data: Dict[str, Any], current_date:
         })
     
     # Add Finnhub articles (limited to prevent token explosion)
-    remaining_slots = max(0, MAX_ARTICLES - len(all_articles))
+    remaining_slots = max(0, max_articles - len(all_articles))
     finnhub_articles = news_data.get("finnhub_articles", [])[:remaining_slots]
-    logger.critical(f"🔥 FINNHUB: Using {len(finnhub_articles)} of {len(news_data.get('finnhub_articles', []))} articles (remaining slots: {remaining_slots})")
     logger.info(f"📰 TOKEN OPTIMIZATION: Using {len(finnhub_articles)} of {len(news_data.get('finnhub_articles', []))} Finnhub articles")
     
     base_idx = len(serper_articles)
@@ -315,15 +333,60 @@ def generate_news_report(company: str, news_data: Dict[str, Any], current_date:
             }
         })
     
-    # 🚨 FINAL VERIFICATION: Confirm article count in final report
-    logger.critical(f"🔥🔥🔥 FINAL ARTICLE COUNT VERIFICATION 🔥🔥🔥")
-    logger.critical(f"🔥 TOTAL ARTICLES IN REPORT: {len(all_articles)}")
-    logger.critical(f"🔥 This should be ≤ {MAX_ARTICLES} (current limit)")
-    if len(all_articles) > MAX_ARTICLES:
-        logger.critical(f"🚨🚨🚨 ERROR: Article count exceeds limit! {len(all_articles)} > {MAX_ARTICLES}")
-        logger.critical(f"🚨 This indicates the token reduction is NOT working!")
+    return all_articles
+
+
+def build_news_payload(company: str, news_data: Dict[str, Any], current_date: str) -> NewsPayload:
+    """
+    Structured news payload published to state["structured_reports"]["news"].
+    
+    Articles are in relevance order, so consumers can slice the top N.
+    """
+    serper_articles = news_data.get("serper_articles", [])
+    finnhub_articles = news_data.get("finnhub_articles", [])
+    
+    if USE_TOKEN_OPTIMIZATION:
+        articles = NewsTokenOptimizer().optimize_news_data(serper_articles, finnhub_articles)
     else:
-        logger.critical(f"✅ Article count within limit: {len(all_articles)} ≤ {MAX_ARTICLES}")
+        articles = _collect_articles(news_data, MAX_REPORT_ARTICLES)
+    
+    return {
+        "company": company,
+        "date": current_date,
+        "total": len(articles),
+        "original_count": len(serper_articles) + len(finnhub_articles),
+        "articles": articles
+    }
+
+
+def generate_news_report(company: str, news_data: Dict[str, Any], current_date: str,
+                         payload: Optional[NewsPayload] = None) -> str:
+    """Generate pure data collection report (from a prebuilt payload when given)"""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if payload is None:
+        payload = build_news_payload(company, news_data, current_date)
+    all_articles = payload["articles"]
+    
+    # TOKEN OPTIMIZATION: Use optimizer if enabled
+    if USE_TOKEN_OPTIMIZATION:
+        logger.critical("🔥🔥🔥 TOKEN OPTIMIZATION ENABLED 🔥🔥🔥")
+        logger.critical(f"🔥 Using NewsTokenOptimizer for 92.6% token reduction")
+        
+        # Generate optimized report
+        optimized_report = generate_optimized_news_report(company, all_articles, timestamp)
+        
+        # Log comparison
+        logger.critical(f"🔥 OPTIMIZATION COMPLETE:")
+        logger.critical(f"🔥 Report size: {len(optimized_report)} chars (~{len(optimized_report)//4} tokens)")
+        logger.critical(f"🔥 This replaces reports that would be 50,000+ chars")
+        
+        return optimized_report
+    
+    serper_used = sum(1 for article in all_articles if article["api_source"] == "serper")
+    finnhub_used = len(all_articles) - serper_used
+    
+    # 🚨 FINAL VERIFICATION: Confirm article count in final report
+    logger.critical(f"🔥 TOTAL ARTICLES IN REPORT: {len(all_articles)} (limit {MAX_REPORT_ARTICLES}, available {payload['original_count']})")
     
     # Build data-only report
     report = f"""# NEWS DATA COLLECTION - {company}
@@ -333,10 +396,10 @@ Trade Date: {current_date}
 
 ## COLLECTION METRICS (TOKEN OPTIMIZED)
 - Articles Used: {len(all_articles)} (filtered for optimal token usage)
-- Serper: {len(serper_articles)} articles (from {len(news_data.get('serper_articles', []))} available)
-- Finnhub: {len(finnhub_articles)} articles (from {len(news_data.get('finnhub_articles', []))} available)
+- Serper: {serper_used} articles (from {len(news_data.get('serper_articles', []))} available)
+- Finnhub: {finnhub_used} articles (from {len(news_data.get('finnhub_articles', []))} available)
 - Collection Time: {news_data.get('data_fetch_time', 0):.3f}s
-- Token Optimization: Active (max {MAX_ARTICLES} articles)
+- Token Optimization: Active (max {MAX_REPORT_ARTICLES} articles)
 
 ## RAW ARTICLE DATA
 
@@ -353,16 +416,11 @@ Content: {article['full_content']}
 
 """
     
-    # Add JSON for agents
+    # Add compact JSON for agents that still parse the report text
     report += f"""## STRUCTURED DATA
 
 ```json
-{json.dumps({
-    "company": company,
-    "date": current_date,
-    "total": len(all_articles),
-    "articles": all_articles
-}, indent=2, default=str)}
+{compact_json(payload)}
 ```
 """
     
@@ -510,36 +568,22 @@ def analyze_news_sentiment(news_data: Dict[str, Any], company: str) -> Dict[str,
     negative_count = 0
     neutral_count = 0
     
-    # Sentiment keywords
-    positive_keywords = [
-        'growth', 'profit', 'revenue', 'success', 'launch', 'expansion',
-        'partnership', 'deal', 'approval', 'breakthrough', 'strong',
-        'gains', 'beat', 'exceed', 'outperform', 'upgrade', 'buy'
-    ]
-    
-    negative_keywords = [
-        'loss', 'decline', 'fall', 'drop', 'concern', 'warning',
-        'lawsuit', 'investigation', 'recall', 'failure', 'weak',
-        'miss', 'disappoint', 'downgrade', 'sell', 'risk', 'issue'
-    ]
-    
-    # Analyze all articles
-    total_articles = 0
-    for article in news_data.get("serper_articles", []) + news_data.get("finnhub_articles", []):
-        total_articles += 1
-        
-        text_to_analyze = " ".join([
-            (article.get('title') or article.get('headline', '')).lower(),
-            (article.get('snippet') or article.get('summary', '')).lower()
+    # Score every headline + summary in one batch
+    articles = news_data.get("serper_articles", []) + news_data.get("finnhub_articles", [])
+    batch = NEWS_LEXICON.score_batch([
+        " ".join([
+            article.get('title') or article.get('headline', ''),
+            article.get('snippet') or article.get('summary', '')
         ])
-        
-        # Count sentiment indicators
-        pos_score = sum(1 for keyword in positive_keywords if keyword in text_to_analyze)
-        neg_score = sum(1 for keyword in negative_keywords if keyword in text_to_analyze)
-        
-        if pos_score > neg_score:
+        for article in articles
+    ])
+    total_articles = len(articles)
+    
+    for counts in batch.texts:
+        label = counts.label()
+        if label == "positive":
             positive_count += 1
-        elif neg_score > pos_score:
+        elif label == "negative":
             negative_count += 1
         else:
             neutral_count += 1
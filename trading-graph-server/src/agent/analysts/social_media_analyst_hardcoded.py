@@ -11,6 +11,8 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage
 
+from ..utils.structured_reports import SentimentPayload, structured_update
+
 logger = logging.getLogger(__name__)
 
 async def execute_single_tool_with_retry(tool_func, tool_name: str, *args, **kwargs) -> Dict[str, Any]:
@@ -318,6 +320,27 @@ IMPORTANT: Base analysis only on platforms with real data. Note data limitations
     return formatted
 
 
+def build_sentiment_payload(results: Dict[str, Any]) -> SentimentPayload:
+    """Per-platform scores for state["structured_reports"]["sentiment"]"""
+    scores = {}
+    sources = {}
+    for platform in ("reddit", "twitter", "stocktwits"):
+        data = results.get(platform) or {}
+        score = data.get("score") if platform == "stocktwits" else data.get("sentiment_score")
+        scores[platform] = score
+        sources[platform] = {
+            "volume": data.get("posts", data.get("mentions", 0)),
+            "confidence": data.get("confidence"),
+            "error": data.get("error")
+        }
+    return {
+        "ticker": results.get("ticker", ""),
+        "has_real_data": bool(results.get("has_real_data")),
+        "scores": scores,
+        "sources": sources
+    }
+
+
 def create_social_media_analyst_hardcoded(llm, toolkit):
     """
     Create a social media analyst with hardcoded parallel tool execution.
@@ -409,7 +432,8 @@ Focus on analyzing the sentiment patterns and generating trading insights.
         return {
             "social_messages": state.get("social_messages", []) + [
                 HumanMessage(content=f"Social Media Analysis (3 tools executed):\n{content}")
-            ]
+            ],
+            **structured_update("sentiment", build_sentiment_payload(tool_results))
         }
     
     return social_media_analyst_hardcoded
\ No newline at end of file
@@ -42,6 +42,7 @@ class TradingConfig(BaseSettings):
     results_dir: str = Field(default="./results", env="TRADINGAGENTS_RESULTS_DIR") 
     data_dir: str = Field(default="./data", env="TRADINGAGENTS_DATA_DIR")
     data_cache_dir: str = Field(default="./dataflows/data_cache", env="TRADINGAGENTS_CACHE_DIR")
+    memory_dir: str = Field(default="", env="TRADINGAGENTS_MEMORY_DIR")  # Empty: <data_cache_dir>/memory
     
     # === API SERVER SETTINGS (existing TRADINGAGENTS_ prefix) ===
     api_host: str = Field(default="localhost", env="TRADINGAGENTS_API_HOST")
@@ -63,6 +64,8 @@ class TradingConfig(BaseSettings):
     execution_timeout: int = Field(default=1200, env="EXECUTION_TIMEOUT")  # 20 minutes
     force_consensus_threshold: int = Field(default=7, env="FORCE_CONSENSUS_THRESHOLD")
     circuit_breaker_enabled: bool = Field(default=True, env="CIRCUIT_BREAKER_ENABLED")
+    trace_export_dir: str = Field(default="", env="TRACE_EXPORT_DIR")  # Empty disables per-run trace files
+    memory_embedder: str = Field(default="hashing", env="MEMORY_EMBEDDER")  # hashing (offline) | openai
     
     # === TOKEN MANAGEMENT (preserved from default_config.py) ===
     max_tokens_per_analyst: int = Field(default=2000, env="MAX_TOKENS_PER_ANALYST")
@@ -123,6 +126,7 @@ class TradingConfig(BaseSettings):
             "results_dir": self.results_dir, 
             "data_dir": self.data_dir,
             "data_cache_dir": self.data_cache_dir,
+            "memory_dir": self.memory_dir,
             
             # API settings (preserve original keys)
             "api_host": self.api_host,
@@ -145,6 +149,8 @@ class TradingConfig(BaseSettings):
             "execution_timeout": self.execution_timeout,
             "force_consensus_threshold": self.force_consensus_threshold,
             "circuit_breaker_enabled": self.circuit_breaker_enabled,
+            "trace_export_dir": self.trace_export_dir,
+            "memory_embedder": self.memory_embedder,
             
             # Token settings (preserve original keys)
             "max_tokens_per_analyst": self.max_tokens_per_analyst,
@@ -4,11 +4,12 @@ Combines data from multiple free APIs for reliability
 """
 
 import asyncio
-import aiohttp
 import os
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
+from ..utils.connection_pool import shared_session, cleanup_connection_pool
+from ..utils.partial_gather import GatherSource, gather_partial
 import statistics
 
 logger = logging.getLogger(__name__)
@@ -33,7 +34,7 @@ async def get_fmp_social_sentiment(ticker: str) -> Optional[Dict[str, Any]]:
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, params=params, timeout=3) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -84,7 +85,7 @@ async def get_alpha_vantage_news_sentiment(ticker: str) -> Optional[Dict[str, An
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, params=params, timeout=5) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -125,6 +126,25 @@ async def get_alpha_vantage_news_sentiment(ticker: str) -> Optional[Dict[str, An
         return None
 
 
+# Global budget, per-source deadlines (seconds) and early-exit quorum for the social fan-out
+SOCIAL_SENTIMENT_BUDGET = 8.0
+SOCIAL_SOURCE_DEADLINES = {
+    "finnhub": 6.0,
+    "stocktwits": 5.0,
+    "reddit": 6.0,
+    "fmp": 6.0,
+    "alpha_vantage": 7.0,
+}
+SOCIAL_QUORUM = 3
+SOCIAL_AGREEMENT_SPREAD = 0.2
+
+
+def _scores_agree(results: List[Dict[str, Any]]) -> bool:
+    """Accepted sources agree when their sentiment scores lie within a narrow band"""
+    scores = [r.get('sentiment_score', 0.5) for r in results]
+    return max(scores) - min(scores) <= SOCIAL_AGREEMENT_SPREAD
+
+
 async def get_aggregated_social_sentiment(ticker: str) -> Dict[str, Any]:
     """
     Aggregate sentiment from multiple reliable sources
@@ -144,51 +164,51 @@ async def get_aggregated_social_sentiment(ticker: str) -> Dict[str, Any]:
     from .stocktwits_simple import get_stocktwits_fast
     from .reddit_simple import get_reddit_fast
     
-    # Create tasks for parallel execution with timeout
-    tasks = []
-    source_names = []
-    
-    # Always try these sources
-    tasks.append(asyncio.create_task(get_finnhub_social_sentiment(ticker)))
-    source_names.append("finnhub")
-    
-    tasks.append(asyncio.create_task(get_stocktwits_fast(ticker)))
-    source_names.append("stocktwits")
-    
-    tasks.append(asyncio.create_task(get_reddit_fast(ticker)))
-    source_names.append("reddit")
+    # Sources to query concurrently, each under its own deadline
+    fetchers = {
+        "finnhub": get_finnhub_social_sentiment,
+        "stocktwits": get_stocktwits_fast,
+        "reddit": get_reddit_fast,
+    }
     
     # Try additional sources if API keys are configured
     if os.getenv('FMP_API_KEY'):
-        tasks.append(asyncio.create_task(get_fmp_social_sentiment(ticker)))
-        source_names.append("fmp")
+        fetchers["fmp"] = get_fmp_social_sentiment
     
     if os.getenv('ALPHA_VANTAGE_API_KEY'):
-        tasks.append(asyncio.create_task(get_alpha_vantage_news_sentiment(ticker)))
-        source_names.append("alpha_vantage")
+        fetchers["alpha_vantage"] = get_alpha_vantage_news_sentiment
     
-    # Wait for all tasks with timeout
-    try:
-        results = await asyncio.wait_for(
-            asyncio.gather(*tasks, return_exceptions=True),
-            timeout=8.0
+    source_names = list(fetchers)
+    sources = [
+        GatherSource(
+            name,
+            # Bind fetch per source (late-binding closures would all call the last one)
+            lambda fetch=fetch: fetch(ticker),
+            deadline=SOCIAL_SOURCE_DEADLINES.get(name),
+            accept=lambda r: isinstance(r, dict) and r.get('sentiment_score') is not None,
         )
-    except asyncio.TimeoutError:
-        logger.warning(f"Timeout getting social sentiment for {ticker}")
-        results = []
+        for name, fetch in fetchers.items()
+    ]
     
-    # Process results
-    valid_results = []
-    sources_used = []
+    # Keep every source that answers in time; stop early once enough of them agree
+    gathered = await gather_partial(
+        sources,
+        budget=SOCIAL_SENTIMENT_BUDGET,
+        quorum=SOCIAL_QUORUM,
+        agree=_scores_agree,
+    )
+    if gathered.timed_out or gathered.cancelled:
+        logger.warning(f"Slow social sentiment sources for {ticker}: "
+                       f"{', '.join(gathered.timed_out + gathered.cancelled)} "
+                       f"(kept {len(gathered.results)}/{len(sources)})")
     
-    for i, result in enumerate(results):
-        if result and not isinstance(result, Exception) and isinstance(result, dict):
-            if result.get('sentiment_score') is not None:
-                valid_results.append(result)
-                sources_used.append(source_names[i])
-                logger.info(f"✅ Got sentiment from {source_names[i]}: {result.get('sentiment_score'):.3f}")
-        else:
-            logger.debug(f"❌ Failed to get sentiment from {source_names[i]}")
+    # Process results
+    valid_results = list(gathered.results.values())
+    sources_used = list(gathered.results)
+    for name, result in gathered.results.items():
+        logger.info(f"✅ Got sentiment from {name}: {result.get('sentiment_score'):.3f}")
+    for name in gathered.rejected + list(gathered.errors):
+        logger.debug(f"❌ Failed to get sentiment from {name}")
     
     if not valid_results:
         # All sources failed - use intelligent fallback
@@ -252,6 +272,8 @@ async def get_aggregated_social_sentiment(ticker: str) -> Dict[str, Any]:
         "sources_used": sources_used,
         "source_count": len(valid_results),
         "data_sources": list(set(all_sources)),  # Unique data sources
+        "sources_timed_out": gathered.timed_out + gathered.cancelled,
+        "quorum_early_exit": gathered.quorum_met,
         "fallback_mode": False,
         "timestamp": datetime.now().isoformat()
     }
@@ -267,6 +289,7 @@ def get_aggregated_sync(ticker: str) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_aggregated_social_sentiment(ticker))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
 
 
@@ -5,11 +5,11 @@ Provides Reddit and Twitter historical sentiment data
 """
 
 import os
-import aiohttp
 import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
+from ..utils.connection_pool import shared_session, cleanup_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +44,7 @@ async def get_finnhub_social_sentiment(ticker: str) -> Dict[str, Any]:
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, params=params, timeout=5) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -147,7 +147,7 @@ async def get_finnhub_news_sentiment(ticker: str, days: int = 7) -> Dict[str, An
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, params=params, timeout=5) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -184,6 +184,7 @@ def get_finnhub_sync(ticker: str) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_finnhub_social_sentiment(ticker))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
 
 
@@ -1,8 +1,81 @@
 import json
 import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 
+# Files larger than this are filtered with the streaming parser (if ijson is
+# installed) instead of being decoded and indexed in full
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
 
-def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
+# Maximum number of (ticker, data_type) indexes kept in memory
+MAX_CACHED_INDEXES = 128
+
+
+class FinnhubDateIndex:
+    """Sorted date keys of one finnhub JSON file, for bisect range queries"""
+
+    def __init__(self, data):
+        self._data = data
+        self._keys = sorted(data)
+
+    def range(self, start_date, end_date):
+        """Return {date: entries} for non-empty dates with start_date <= date <= end_date"""
+        lo = bisect_left(self._keys, start_date)
+        hi = bisect_right(self._keys, end_date)
+        filtered_data = {}
+        for key in self._keys[lo:hi]:
+            value = self._data[key]
+            if len(value) > 0:
+                filtered_data[key] = value
+        return filtered_data
+
+
+_indexes = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _get_ijson():
+    """Lazy import for the optional ijson streaming parser"""
+    try:
+        import ijson
+        return ijson
+    except ImportError:
+        return None
+
+
+def _load_index(data_path):
+    """Get the cached index for a file, rebuilding it when the file changes"""
+    mtime = os.stat(data_path).st_mtime_ns
+
+    with _indexes_lock:
+        cached = _indexes.get(data_path)
+        if cached is not None and cached[0] == mtime:
+            _indexes.move_to_end(data_path)
+            return cached[1]
+
+    with open(data_path, "r") as f:
+        index = FinnhubDateIndex(json.load(f))
+
+    with _indexes_lock:
+        _indexes[data_path] = (mtime, index)
+        _indexes.move_to_end(data_path)
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def _stream_range(data_path, start_date, end_date, ijson):
+    """Filter a large file by date while decoding only one entry at a time"""
+    filtered_data = {}
+    with open(data_path, "rb") as f:
+        for key, value in ijson.kvitems(f, "", use_float=True):
+            if start_date <= key <= end_date and len(value) > 0:
+                filtered_data[key] = value
+    return dict(sorted(filtered_data.items()))
+
+
+def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None, stream=None):
     """
     Gets finnhub data saved and processed on disk.
     Args:
@@ -11,6 +84,8 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
         data_type (str): Type of data from finnhub to fetch. Can be insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported.
         data_dir (str): Directory where the data is saved.
         period (str): Default to none, if there is a period specified, should be annual or quarterly.
+        stream (bool): Force (True) or disable (False) the ijson streaming parser. By default it is
+            used for files above STREAMING_THRESHOLD_BYTES when ijson is installed.
     """
 
     if period:
@@ -25,12 +100,17 @@ def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=
             data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
         )
 
-    data = open(data_path, "r")
-    data = json.load(data)
+    if stream is None:
+        stream = os.path.getsize(data_path) > STREAMING_THRESHOLD_BYTES
+    ijson = _get_ijson() if stream else None
+    if ijson is not None:
+        return _stream_range(data_path, start_date, end_date, ijson)
 
-    # filter keys (date, str in format YYYY-MM-DD) by the date range (str, str in format YYYY-MM-DD)
-    filtered_data = {}
-    for key, value in data.items():
-        if start_date <= key <= end_date and len(value) > 0:
-            filtered_data[key] = value
-    return filtered_data
+    # filter keys (date, str in format YYYY-MM-DD) by the date range with a bisect slice
+    return _load_index(data_path).range(start_date, end_date)
+
+
+def clear_finnhub_indexes():
+    """Drop all cached finnhub date indexes"""
+    with _indexes_lock:
+        _indexes.clear()
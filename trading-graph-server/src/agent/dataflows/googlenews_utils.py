@@ -1,5 +1,4 @@
 import json
-import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime
 import asyncio
@@ -11,11 +10,12 @@ from tenacity import (
     retry_if_exception_type,
     retry_if_result,
 )
+from ..utils.connection_pool import shared_session
 
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
-    return response.status_code == 429
+    return response.status == 429
 
 
 @retry(
@@ -28,14 +28,16 @@ async def make_request(url, headers):
     # Random delay before each request to avoid detection
     await asyncio.sleep(random.uniform(2, 6))
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
+    async with shared_session() as session:
+        async with session.get(url, headers=headers) as response:
+            # Buffer the body so the connection goes back to the pool
+            await response.read()
     return response
 
 
 async def getNewsDataGoogleNews(query: str, start_date: str, end_date: str) -> list:
     """
-    Get news data from Google News using async httpx.
+    Get news data from Google News over the shared connection pool.
     """
     try:
         # Build the search query
@@ -50,7 +52,7 @@ async def getNewsDataGoogleNews(query: str, start_date: str, end_date: str) -> l
         response.raise_for_status()
         
         # Parse the HTML response
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(await response.text(), 'html.parser')
         
         # Extract news articles (this is a simplified example)
         articles = []
@@ -4,12 +4,13 @@ Following SOLID principles and detailed atomic tasks from day1_detailed_plan.md
 """
 
 import asyncio
-import anyio
 import logging
+import threading
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Callable, Optional, Tuple, Set
+from typing import Dict, List, Callable, Optional, Tuple, Set
 from .news_interfaces import NewsArticle, SerperResponse, NewsGatheringError
+from ..utils.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +22,9 @@ class PaginationConfig:
     MAX_PAGES = 10
     RESULTS_PER_PAGE = 10
     
-    def __init__(self, ticker: str):
+    def __init__(self, ticker: str, pages: Optional[int] = None):
         self.ticker = ticker.upper()
-        self.pages = self._determine_pages()
+        self.pages = pages if pages is not None else self._determine_pages()
     
     def _determine_pages(self) -> int:
         """Determine pages based on ticker volatility"""
@@ -97,21 +98,117 @@ class PaginationController:
         }
 
 
+# Serper allows bursts of a few requests; sustained rate is kept around 2 req/s
+DEFAULT_RATE_PER_SECOND = 2.0
+DEFAULT_BURST = 3
+
+
+_serper_limiter: Optional[TokenBucket] = None
+_serper_limiter_lock = threading.Lock()
+
+
+def get_serper_rate_limiter() -> TokenBucket:
+    """Token bucket shared by every Serper page request in the process"""
+    global _serper_limiter
+    if _serper_limiter is None:
+        with _serper_limiter_lock:
+            if _serper_limiter is None:
+                _serper_limiter = TokenBucket(rate=DEFAULT_RATE_PER_SECOND, capacity=DEFAULT_BURST,
+                                              name="serper_pagination")
+    return _serper_limiter
+
+
+def _process_page(response: dict, controller: PaginationController, page: int) -> List[NewsArticle]:
+    """Convert one page of results into unique, valid articles"""
+    page_articles = []
+    for item in response.get('news', []):
+        try:
+            article = NewsArticle(
+                title=item.get('title', ''),
+                source=item.get('source', ''),
+                snippet=item.get('snippet', ''),
+                url=item.get('link', ''),
+                date=_safe_parse_date(item.get('date', '')),
+                authority_tier=_classify_source_authority(item.get('source', ''))
+            )
+            
+            # Only add if unique and valid
+            if article.validate() and controller.process_article(article):
+                page_articles.append(article)
+                
+        except Exception as e:
+            logger.error(f"Error processing article on page {page + 1}: {e}")
+            continue
+    return page_articles
+
+
+def _first_page_error(e: Exception) -> NewsGatheringError:
+    return NewsGatheringError(
+        error_type=NewsGatheringError.API_ERROR,
+        message=f"First page fetch failed: {e}",
+        fallback_attempted=False,
+        partial_results=None
+    )
+
+
 # Task 1.2.2 & 1.2.3: Implement Pagination Loop with Single Page Fetch (25 min)
 async def fetch_with_pagination(
     query: str, 
     date_range: Tuple[str, str],
     config: PaginationConfig,
     api_key: str,
-    fetch_single_page_func: Callable
+    fetch_single_page_func: Callable,
+    speculative_pages: int = 0,
+    rate_limiter: Optional[TokenBucket] = None
 ) -> SerperResponse:
-    """Single Responsibility: Handle paginated API calls"""
+    """
+    Single Responsibility: Handle paginated API calls
+    
+    Args:
+        speculative_pages: When > 0, keep this many page requests in flight
+            concurrently and cancel them once the controller stops pagination
+        rate_limiter: Token bucket for the page requests (defaults to the
+            process-wide Serper bucket, 2 req/s with a burst of 3)
+    """
     
     logger.info(f"Starting pagination fetch: {config}")
     logger.info(f"Query: '{query}', Date range: {date_range[0]} to {date_range[1]}")
     
-    all_articles = []
+    rate_limiter = rate_limiter or get_serper_rate_limiter()
     controller = PaginationController()
+    
+    if speculative_pages > 0:
+        all_articles, pages_fetched = await _fetch_pages_speculative(
+            query, date_range, config, api_key, fetch_single_page_func,
+            controller, rate_limiter, speculative_pages
+        )
+    else:
+        all_articles, pages_fetched = await _fetch_pages_sequential(
+            query, date_range, config, api_key, fetch_single_page_func,
+            controller, rate_limiter
+        )
+    
+    # Log final statistics
+    stats = controller.get_statistics()
+    logger.info(f"Pagination complete: {stats}")
+    
+    return SerperResponse.from_api_response(
+        {'news': [_article_to_dict(a) for a in all_articles], 'searchParameters': {'q': query}},
+        pages=pages_fetched
+    )
+
+
+async def _fetch_pages_sequential(
+    query: str,
+    date_range: Tuple[str, str],
+    config: PaginationConfig,
+    api_key: str,
+    fetch_single_page_func: Callable,
+    controller: PaginationController,
+    rate_limiter: TokenBucket
+) -> Tuple[List[NewsArticle], int]:
+    """Fetch pages one after another"""
+    all_articles = []
     pages_fetched = 0
     
     for page in range(config.pages):
@@ -122,6 +219,9 @@ async def fetch_with_pagination(
         try:
             logger.info(f"Fetching page {page + 1}/{config.pages}...")
             
+            # Rate limit protection
+            await rate_limiter.acquire()
+            
             # Task 1.2.3: Single Page Fetch (integrated)
             response = await fetch_single_page(
                 func=fetch_single_page_func,
@@ -138,57 +238,102 @@ async def fetch_with_pagination(
                 break
                 
             # Process articles through controller
-            page_articles = []
-            for item in response.get('news', []):
-                try:
-                    article = NewsArticle(
-                        title=item.get('title', ''),
-                        source=item.get('source', ''),
-                        snippet=item.get('snippet', ''),
-                        url=item.get('link', ''),
-                        date=_safe_parse_date(item.get('date', '')),
-                        authority_tier=_classify_source_authority(item.get('source', ''))
-                    )
-                    
-                    # Only add if unique and valid
-                    if article.validate() and controller.process_article(article):
-                        page_articles.append(article)
-                        
-                except Exception as e:
-                    logger.error(f"Error processing article on page {page + 1}: {e}")
-                    continue
+            page_articles = _process_page(response, controller, page)
             
             all_articles.extend(page_articles)
             pages_fetched += 1  # Only increment after successful page processing
             logger.info(f"Page {page + 1}: collected {len(page_articles)} unique articles (total: {len(all_articles)})")
-            
-            # Rate limit protection
-            if page < config.pages - 1:
-                await anyio.sleep(0.5)
                 
         except Exception as e:
             logger.error(f"Page {page + 1} fetch failed: {e}")
             if page == 0:
                 # First page failure is critical
-                raise NewsGatheringError(
-                    error_type=NewsGatheringError.API_ERROR,
-                    message=f"First page fetch failed: {e}",
-                    fallback_attempted=False,
-                    partial_results=None
-                )
+                raise _first_page_error(e)
             else:
                 # Partial results are acceptable
                 logger.warning(f"Continuing with partial results after page {page} failure")
                 break
     
-    # Log final statistics
-    stats = controller.get_statistics()
-    logger.info(f"Pagination complete: {stats}")
+    return all_articles, pages_fetched
+
+
+async def _fetch_pages_speculative(
+    query: str,
+    date_range: Tuple[str, str],
+    config: PaginationConfig,
+    api_key: str,
+    fetch_single_page_func: Callable,
+    controller: PaginationController,
+    rate_limiter: TokenBucket,
+    window: int
+) -> Tuple[List[NewsArticle], int]:
+    """
+    Fetch pages with up to `window` requests in flight.
     
-    return SerperResponse.from_api_response(
-        {'news': [_article_to_dict(a) for a in all_articles], 'searchParameters': {'q': query}},
-        pages=pages_fetched
-    )
+    Responses are still processed in page order, so dedupe and early
+    termination behave exactly as in sequential mode; pages requested past
+    the stopping point are cancelled.
+    """
+    all_articles = []
+    pages_fetched = 0
+    in_flight: Dict[int, asyncio.Task] = {}
+    next_page = 0
+    
+    async def fetch_page(page: int) -> dict:
+        await rate_limiter.acquire()
+        return await fetch_single_page(
+            func=fetch_single_page_func,
+            query=query,
+            date_range=date_range,
+            offset=config.get_offset(page),
+            api_key=api_key,
+            page=page
+        )
+    
+    def fill_window(current: int):
+        nonlocal next_page
+        while next_page < config.pages and next_page < current + window:
+            in_flight[next_page] = asyncio.create_task(fetch_page(next_page))
+            next_page += 1
+    
+    try:
+        for page in range(config.pages):
+            if not controller.should_continue(all_articles, page):
+                logger.info(f"Early termination at page {page}")
+                break
+            
+            fill_window(page)
+            logger.info(f"Awaiting page {page + 1}/{config.pages} ({len(in_flight)} in flight)...")
+            
+            try:
+                response = await in_flight.pop(page)
+            except Exception as e:
+                logger.error(f"Page {page + 1} fetch failed: {e}")
+                if page == 0:
+                    # First page failure is critical
+                    raise _first_page_error(e)
+                # Partial results are acceptable
+                logger.warning(f"Continuing with partial results after page {page} failure")
+                break
+            
+            if not response or not response.get('news'):
+                pages_fetched += 1  # Count the empty page as fetched
+                logger.warning(f"Page {page + 1} returned no results, stopping pagination")
+                break
+            
+            page_articles = _process_page(response, controller, page)
+            all_articles.extend(page_articles)
+            pages_fetched += 1
+            logger.info(f"Page {page + 1}: collected {len(page_articles)} unique articles (total: {len(all_articles)})")
+    finally:
+        # Cancel speculative requests past the stopping point
+        if in_flight:
+            logger.info(f"Cancelling {len(in_flight)} speculative page request(s)")
+            for task in in_flight.values():
+                task.cancel()
+            await asyncio.gather(*in_flight.values(), return_exceptions=True)
+    
+    return all_articles, pages_fetched
 
 
 async def fetch_single_page(
@@ -0,0 +1,293 @@
+"""
+Shared OHLCV Frame Store
+Parses each market data CSV once per process and serves it from a bounded LRU
+
+CSV files are converted on first use into a columnar on-disk layout (one .npy
+file per column) that is memory-mapped on later loads, so a new process or an
+evicted frame does not pay the CSV parse again. Frames are keyed by
+(symbol, source, mtime, variant), where the variant digests the file path and
+read arguments, so a rewritten file is picked up automatically and two files
+(or parse options) for the same symbol never share an entry.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes so stale conversions are ignored
+_STORE_FORMAT_VERSION = 2
+
+
+def _get_pandas():
+    """Lazy import for pandas to prevent circular imports"""
+    import pandas as pd
+    return pd
+
+
+def _get_numpy():
+    """Lazy import for numpy to prevent circular imports"""
+    import numpy as np
+    return np
+
+
+FrameKey = Tuple[str, str, int, str]
+
+
+def _variant(path: str, read_kwargs: Dict[str, Any]) -> str:
+    """Short digest of the file path and read arguments"""
+    spec = json.dumps([os.path.abspath(path), sorted(read_kwargs.items())], default=repr)
+    return hashlib.sha1(spec.encode()).hexdigest()[:12]
+
+
+class OHLCVStore:
+    """
+    Process-wide cache of parsed price/fundamental CSV frames.
+
+    Callers receive a shallow copy of the cached frame: adding or replacing
+    columns is safe, but the underlying arrays must be treated as read-only
+    (memory-mapped columns raise on in-place writes).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_frames: int = 32,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            cache_dir: Directory for columnar conversions (defaults to data_cache_dir/ohlcv_store)
+            max_frames: Maximum number of parsed frames kept resident
+            max_bytes: Approximate resident size limit for parsed frames
+        """
+        self._cache_dir = cache_dir
+        self.max_frames = max_frames
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[FrameKey, Any]" = OrderedDict()
+        self._sizes: Dict[FrameKey, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks: Dict[FrameKey, threading.Lock] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "columnar_loads": 0,
+            "csv_parses": 0,
+            "evictions": 0,
+        }
+
+    @property
+    def cache_dir(self) -> str:
+        """Directory holding the columnar conversions"""
+        if self._cache_dir is None:
+            self._cache_dir = os.path.join(get_config()["data_cache_dir"], "ohlcv_store")
+        return self._cache_dir
+
+    def read_csv(self, path: str, symbol: str, source: str, **read_kwargs) -> Any:
+        """
+        Return the parsed frame for a CSV file, parsing it at most once.
+
+        Args:
+            path: CSV file path
+            symbol: Ticker (or dataset name) the file belongs to
+            source: Data source label, e.g. "yfin_offline" or "yfin_cache"
+            **read_kwargs: Extra arguments for pandas.read_csv (e.g. sep=";")
+
+        Returns:
+            Shallow copy of the cached DataFrame
+
+        Raises:
+            FileNotFoundError: If the CSV does not exist
+        """
+        mtime = os.stat(path).st_mtime_ns
+        key: FrameKey = (symbol, source, mtime, _variant(path, read_kwargs))
+
+        frame = self._lookup(key)
+        if frame is not None:
+            return frame.copy(deep=False)
+
+        # Single parse per key: concurrent callers wait for the first one
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                frame = self._lookup(key, count=False)
+                if frame is None:
+                    frame = self._load(path, key, read_kwargs)
+                    self._insert(key, frame)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+
+        return frame.copy(deep=False)
+
+    def _lookup(self, key: FrameKey, count: bool = True) -> Optional[Any]:
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                if count:
+                    self._stats["hits"] += 1
+            elif count:
+                self._stats["misses"] += 1
+            return frame
+
+    def _insert(self, key: FrameKey, frame: Any) -> None:
+        size = int(frame.memory_usage(index=True, deep=False).sum())
+        with self._lock:
+            self._frames[key] = frame
+            self._sizes[key] = size
+            self._total_bytes += size
+            # Always keep the newest frame, even if it alone exceeds max_bytes
+            while len(self._frames) > 1 and (
+                len(self._frames) > self.max_frames or self._total_bytes > self.max_bytes
+            ):
+                old_key, _ = self._frames.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(old_key)
+                self._stats["evictions"] += 1
+                logger.debug(f"🗑️ OHLCV store evicted {old_key[0]} ({old_key[1]})")
+
+    def _columnar_dir(self, key: FrameKey) -> str:
+        symbol, source, mtime, variant = key
+        return os.path.join(
+            self.cache_dir, f"{symbol}-{source}-{mtime}-{variant}-v{_STORE_FORMAT_VERSION}"
+        )
+
+    def _load(self, path: str, key: FrameKey, read_kwargs: Dict[str, Any]) -> Any:
+        columnar_dir = self._columnar_dir(key)
+        if os.path.exists(os.path.join(columnar_dir, "meta.json")):
+            try:
+                frame = self._load_columnar(columnar_dir)
+                with self._lock:
+                    self._stats["columnar_loads"] += 1
+                return frame
+            except Exception as e:
+                logger.warning(f"⚠️ Discarding unreadable columnar copy {columnar_dir}: {e}")
+                shutil.rmtree(columnar_dir, ignore_errors=True)
+
+        frame = _get_pandas().read_csv(path, **read_kwargs)
+        with self._lock:
+            self._stats["csv_parses"] += 1
+        logger.info(f"📈 OHLCV store parsed {key[0]} ({key[1]}): {len(frame)} rows")
+
+        try:
+            self._write_columnar(frame, key)
+        except Exception as e:
+            # The parsed frame is still usable; only the on-disk copy failed
+            logger.warning(f"⚠️ Could not write columnar copy for {key[0]}: {e}")
+        return frame
+
+    def _write_columnar(self, frame: Any, key: FrameKey) -> None:
+        np = _get_numpy()
+        columnar_dir = self._columnar_dir(key)
+        tmp_dir = f"{columnar_dir}.tmp-{os.getpid()}-{threading.get_ident()}"
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        columns = []
+        for i, name in enumerate(frame.columns):
+            series = frame[name]
+            if series.dtype.kind in "biuf":
+                np.save(os.path.join(tmp_dir, f"c{i}.npy"), series.to_numpy())
+                columns.append({"name": str(name), "kind": "numeric"})
+            else:
+                # Strings are stored fixed-width so they can be memory-mapped too
+                missing = series.isna().to_numpy()
+                values = series.astype(str).to_numpy().astype(np.str_)
+                np.save(os.path.join(tmp_dir, f"c{i}.npy"), values)
+                np.save(os.path.join(tmp_dir, f"c{i}.mask.npy"), missing)
+                columns.append({"name": str(name), "kind": "string"})
+
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump({"version": _STORE_FORMAT_VERSION, "columns": columns}, f)
+
+        if os.path.exists(columnar_dir):
+            # Another process converted the same file first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        else:
+            try:
+                os.replace(tmp_dir, columnar_dir)
+            except OSError:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        self._remove_stale_versions(key)
+
+    def _load_columnar(self, columnar_dir: str) -> Any:
+        np = _get_numpy()
+        pd = _get_pandas()
+        with open(os.path.join(columnar_dir, "meta.json")) as f:
+            meta = json.load(f)
+
+        data = {}
+        for i, column in enumerate(meta["columns"]):
+            values = np.load(os.path.join(columnar_dir, f"c{i}.npy"), mmap_mode="r")
+            if column["kind"] == "string":
+                missing = np.load(os.path.join(columnar_dir, f"c{i}.mask.npy"))
+                values = values.astype(object)
+                values[missing] = np.nan
+            data[column["name"]] = values
+        return pd.DataFrame(data, copy=False)
+
+    def _remove_stale_versions(self, key: FrameKey) -> None:
+        """Delete conversions of older versions of the same file"""
+        symbol, source, _, variant = key
+        prefix = f"{symbol}-{source}-"
+        current = os.path.basename(self._columnar_dir(key))
+        try:
+            entries = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.startswith(prefix) and entry != current and ".tmp-" not in entry:
+                parts = entry[len(prefix):].split("-")
+                # Same path and read arguments, or a conversion from before variants existed
+                same_file = len(parts) == 2 or (len(parts) == 3 and parts[1] == variant)
+                if parts[0].isdigit() and same_file:
+                    shutil.rmtree(os.path.join(self.cache_dir, entry), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Drop all resident frames (on-disk conversions are kept)"""
+        with self._lock:
+            self._frames.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        with self._lock:
+            return {
+                **self._stats,
+                "resident_frames": len(self._frames),
+                "resident_mb": self._total_bytes / (1024 * 1024),
+                "max_frames": self.max_frames,
+                "max_mb": self.max_bytes / (1024 * 1024),
+            }
+
+
+# Global store instance
+_global_store: Optional[OHLCVStore] = None
+_global_store_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """Get the process-wide OHLCV store"""
+    global _global_store
+    if _global_store is None:
+        with _global_store_lock:
+            if _global_store is None:
+                _global_store = OHLCVStore()
+    return _global_store
+
+
+def read_market_csv(path: str, symbol: str, source: str, **read_kwargs) -> Any:
+    """Read a CSV through the shared OHLCV store"""
+    return get_ohlcv_store().read_csv(path, symbol, source, **read_kwargs)
@@ -8,6 +8,8 @@ import asyncio
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
+from ..utils.connection_pool import shared_session, cleanup_connection_pool
+from ..utils.sentiment_lexicon import SOCIAL_LEXICON
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +50,7 @@ async def get_reddit_fast(
     all_posts = []
     subreddit_breakdown = {}
     
-    async with aiohttp.ClientSession() as session:
+    async with shared_session() as session:
         # Set user agent to avoid being blocked
         headers = {"User-Agent": "StockAnalyzer/1.0 (Trading Agent)"}
         
@@ -161,6 +163,7 @@ def process_reddit_sentiment(
     - Upvote ratios
     - Comment engagement
     - Recent vs old posts
+    - Bullish/bearish wording in titles and bodies
     """
     if not posts:
         from .empty_response_handler import create_empty_reddit_response
@@ -210,6 +213,15 @@ def process_reddit_sentiment(
     else:
         weighted_sentiment = 0.5
     
+    # Votes say how posts were received, not which way they lean: blend in
+    # what the posts actually say when they say anything
+    text_sentiment = SOCIAL_LEXICON.score_batch(
+        [f"{p.get('title', '')} {p.get('selftext', '')}" for p in posts],
+        weights=[max(1, weight) for _, weight in sentiment_components],
+    ).total
+    if text_sentiment.total:
+        weighted_sentiment = (weighted_sentiment + text_sentiment.score(shrink_below=3)) / 2
+    
     # Determine confidence based on data volume
     if len(posts) >= 20:
         confidence = "high"
@@ -235,6 +247,7 @@ def process_reddit_sentiment(
     return {
         "ticker": ticker,
         "sentiment_score": round(weighted_sentiment, 3),
+        "text_sentiment_score": round(text_sentiment.score(shrink_below=3), 3),
         "post_count": len(posts),
         "avg_score": round(avg_score, 2),
         "avg_comments": round(avg_comments, 2),
@@ -256,4 +269,5 @@ def get_reddit_sentiment_sync(ticker: str, **kwargs) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_reddit_fast(ticker, **kwargs))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
\ No newline at end of file
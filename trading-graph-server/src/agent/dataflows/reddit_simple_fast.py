@@ -8,6 +8,7 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
+from ..utils.connection_pool import shared_session, cleanup_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +42,12 @@ async def get_reddit_fast(
     timeout = aiohttp.ClientTimeout(total=3)
     
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with shared_session() as session:
             headers = {"User-Agent": "StockAnalyzer/1.0"}
             
             # Process just the first subreddit for speed
             subreddit = subreddits[0]
-            posts = await fetch_subreddit_fast(session, subreddit, ticker, limit, headers)
+            posts = await fetch_subreddit_fast(session, subreddit, ticker, limit, headers, timeout)
             
             if posts:
                 all_posts.extend(posts)
@@ -73,7 +74,8 @@ async def fetch_subreddit_fast(
     subreddit: str, 
     ticker: str,
     limit: int,
-    headers: Dict[str, str]
+    headers: Dict[str, str],
+    timeout: Optional[aiohttp.ClientTimeout] = None
 ) -> List[Dict[str, Any]]:
     """Fast single subreddit fetch with 2s timeout"""
     
@@ -87,7 +89,7 @@ async def fetch_subreddit_fast(
     }
     
     try:
-        async with session.get(url, params=params, headers=headers) as response:
+        async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
             if response.status == 200:
                 data = await response.json()
                 posts = []
@@ -167,4 +169,5 @@ def get_reddit_sync(ticker: str) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_reddit_fast(ticker))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
\ No newline at end of file
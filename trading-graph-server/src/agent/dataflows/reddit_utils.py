@@ -3,9 +3,11 @@ import time
 import json
 from datetime import datetime, timedelta
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Annotated
 import os
 import re
+import threading
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,6 +51,65 @@ ticker_to_company = {
 }
 
 
+# Per-file byte-offset index: data_file path -> (mtime, {YYYY-mm-dd: [(offset, length), ...]})
+_date_indexes = {}
+_date_indexes_lock = threading.Lock()
+
+
+def _build_date_index(file_path):
+    """Scan a subreddit .jsonl once and record the byte span of each post by UTC day"""
+    index = {}
+    offset = 0
+    with open(file_path, "rb") as f:
+        for line in f:
+            length = len(line)
+            # skip empty lines
+            if line.strip():
+                created_utc = json.loads(line)["created_utc"]
+                post_date = datetime.utcfromtimestamp(created_utc).strftime("%Y-%m-%d")
+                index.setdefault(post_date, []).append((offset, length))
+            offset += length
+    return index
+
+
+def get_date_index(file_path):
+    """Get the date -> byte offsets index for a .jsonl file, building it once per file version"""
+    mtime = os.stat(file_path).st_mtime_ns
+    with _date_indexes_lock:
+        cached = _date_indexes.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    index = _build_date_index(file_path)
+    with _date_indexes_lock:
+        _date_indexes[file_path] = (mtime, index)
+    return index
+
+
+def read_posts_for_date(file_path, date):
+    """Yield the parsed posts of one UTC day, reading only their byte ranges"""
+    spans = get_date_index(file_path).get(date)
+    if not spans:
+        return
+    with open(file_path, "rb") as f:
+        for offset, length in spans:
+            f.seek(offset)
+            yield json.loads(f.read(length))
+
+
+@lru_cache(maxsize=256)
+def _company_search_pattern(query):
+    """Compiled, case-insensitive alternation of the company's search terms"""
+    if "OR" in ticker_to_company[query]:
+        search_terms = ticker_to_company[query].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[query]]
+
+    search_terms.append(query)
+
+    return re.compile("|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE)
+
+
 def fetch_top_from_category(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
@@ -65,67 +126,44 @@ def fetch_top_from_category(
 
     all_content = []
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    category_files = os.listdir(os.path.join(base_path, category))
+
+    if max_limit < len(category_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(category_files)
+
+    search_pattern = None
+    if "company" in category and query:
+        search_pattern = _company_search_pattern(query)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    for data_file in category_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
         all_content_curr_subreddit = []
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
+        # only the posts from the date are read, via the per-file date index
+        for parsed_line in read_posts_for_date(os.path.join(base_path, category, data_file), date):
+            # if is company_news, check that the title or the content has the company's name (query) mentioned
+            if search_pattern is not None and not (
+                search_pattern.search(parsed_line["title"])
+                or search_pattern.search(parsed_line["selftext"])
+            ):
+                continue
+
+            post = {
+                "title": parsed_line["title"],
+                "content": parsed_line["selftext"],
+                "url": parsed_line["url"],
+                "upvotes": parsed_line["ups"],
+                "posted_date": date,
+            }
+
+            all_content_curr_subreddit.append(post)
 
         # sort all_content_curr_subreddit by upvote_ratio in descending order
         all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
@@ -1,15 +1,16 @@
 import json
-import httpx
+import aiohttp
 import asyncio
 import logging
 from typing import List, Dict, Any
+from ..utils.connection_pool import shared_session
 
 logger = logging.getLogger(__name__)
 
 
 async def getNewsDataSerpAPI(query: str, start_date: str, end_date: str, serpapi_key: str = None) -> List[Dict[str, Any]]:
     """
-    Get news data from SerpAPI using async httpx.
+    Get news data from SerpAPI over the shared connection pool.
     """
     if not serpapi_key:
         logger.error("❌ SerpAPI key is required")
@@ -40,11 +41,10 @@ async def getNewsDataSerpAPI(query: str, start_date: str, end_date: str, serpapi
             
             url = "https://serpapi.com/search"
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=30.0)
-                response.raise_for_status()
-                
-            data = response.json()
+            async with shared_session() as client:
+                async with client.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30.0)) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
             
             # Check for errors
             if "error" in data:
@@ -88,7 +88,7 @@ async def getNewsDataSerpAPI(query: str, start_date: str, end_date: str, serpapi
         
         return all_news_results
         
-    except httpx.HTTPError as e:
+    except aiohttp.ClientError as e:
         logger.error(f"❌ SerpAPI HTTP Error: {str(e)}")
         
         # Return whatever we managed to collect
@@ -1,9 +1,10 @@
-import httpx
-import asyncio
+import aiohttp
 import json
 import logging
 from typing import List, Dict, Any
 from ..utils.debug_logging import log_data_fetch
+from ..utils.connection_pool import shared_session
+from .news_pagination import PaginationConfig, fetch_with_pagination
 import time
 
 logger = logging.getLogger(__name__)
@@ -57,11 +58,11 @@ async def getNewsDataSerperAPI(query_or_company: str, start_date: str = None, en
             'Content-Type': 'application/json'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, data=payload, timeout=30.0)
-            response.raise_for_status()
+        async with shared_session() as client:
+            async with client.post(url, headers=headers, data=payload, timeout=aiohttp.ClientTimeout(total=30.0)) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
             
-            data = response.json()
             news_articles = data.get("news", [])
             
             # Log the data fetch operation
@@ -70,7 +71,7 @@ async def getNewsDataSerperAPI(query_or_company: str, start_date: str = None, en
             
             return news_articles
             
-    except httpx.HTTPError as e:
+    except aiohttp.ClientError as e:
         execution_time = time.time() - start_time
         log_data_fetch("serper_api", [], logger)
         logger.error(f"HTTP error occurred: {e}")
@@ -86,6 +87,10 @@ async def getNewsDataSerperAPIWithPagination(query_or_company: str, start_date:
     """
     Fetch news data from Serper API with pagination - backward compatible interface
     
+    All pages are requested concurrently (rate limited by the shared Serper
+    token bucket); duplicates and invalid articles are dropped and the raw
+    Serper items are returned in page order.
+    
     Args:
         query_or_company: Company name or search query
         start_date: Start date for news search (optional, for backward compatibility)
@@ -124,38 +129,44 @@ async def getNewsDataSerperAPIWithPagination(query_or_company: str, start_date:
             'Content-Type': 'application/json'
         }
 
-        async with httpx.AsyncClient() as client:
-            for page in range(max_pages):
-                payload = json.dumps({
-                    "q": search_query,
-                    "gl": "us", 
-                    "hl": "en",
-                    "num": 10,
-                    "start": page * 10
-                })
-                
-                response = await client.post(url, headers=headers, data=payload, timeout=30.0)
-                response.raise_for_status()
-                
-                data = response.json()
-                news_articles = data.get("news", [])
-                
-                if not news_articles:
-                    break
-                    
-                all_articles.extend(news_articles)
-                
-                # Add delay between requests
-                if page < max_pages - 1:
-                    await asyncio.sleep(1)
-            
-            # Log the paginated data fetch operation
-            execution_time = time.time() - start_time
-            log_data_fetch("serper_api_paginated", all_articles, logger)
-            
-            return all_articles
+        raw_by_link: Dict[str, Dict[str, Any]] = {}
+        
+        async def fetch_page(query: str, start_date: str, end_date: str, offset: int, api_key: str) -> dict:
+            payload = json.dumps({
+                "q": query,
+                "gl": "us", 
+                "hl": "en",
+                "num": 10,
+                "start": offset
+            })
+            async with shared_session() as client:
+                async with client.post(url, headers=headers, data=payload, timeout=aiohttp.ClientTimeout(total=30.0)) as response:
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+            for item in data.get("news", []):
+                raw_by_link.setdefault(item.get("link", ""), item)
+            return data
+        
+        # A first page failure raises NewsGatheringError; later failures keep the pages so far
+        result = await fetch_with_pagination(
+            query=search_query,
+            date_range=(start_date or "", end_date or ""),
+            config=PaginationConfig(query_or_company, pages=max_pages),
+            api_key=api_key,
+            fetch_single_page_func=fetch_page,
+            speculative_pages=max_pages
+        )
+        
+        # Hand back the untouched Serper items (position, imageUrl, ...) for the kept articles
+        all_articles = [raw_by_link[article.url] for article in result.articles if article.url in raw_by_link]
+        
+        # Log the paginated data fetch operation
+        execution_time = time.time() - start_time
+        log_data_fetch("serper_api_paginated", all_articles, logger)
+        
+        return all_articles
             
-    except httpx.HTTPError as e:
+    except aiohttp.ClientError as e:
         execution_time = time.time() - start_time
         log_data_fetch("serper_api_paginated", all_articles, logger)
         logger.error(f"HTTP error occurred: {e}")
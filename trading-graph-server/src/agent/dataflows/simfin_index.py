@@ -0,0 +1,139 @@
+"""
+Pre-indexed SimFin Fundamentals Tables
+Answers "latest statement published on or before date X" with a binary search
+
+Each us-*-{freq}.csv file is loaded through the shared OHLCV store, its date
+columns are parsed once, and the rows are sorted by (Ticker, Publish Date)
+with a per-ticker offset table. The index is rebuilt when the file changes.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .ohlcv_store import read_market_csv
+
+logger = logging.getLogger(__name__)
+
+
+def _get_pandas():
+    """Lazy import for pandas to prevent circular imports"""
+    import pandas as pd
+    return pd
+
+
+def _get_numpy():
+    """Lazy import for numpy to prevent circular imports"""
+    import numpy as np
+    return np
+
+
+class SimFinIndex:
+    """Sorted view of one SimFin statement file with per-ticker offsets"""
+
+    def __init__(self, df: Any):
+        """
+        Build the index from a raw SimFin DataFrame.
+
+        Args:
+            df: DataFrame as read from a us-*-{freq}.csv file
+        """
+        pd = _get_pandas()
+        np = _get_numpy()
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+        # Rows without a ticker or publish date can never match a lookup
+        df = df.dropna(subset=["Ticker", "Publish Date"])
+
+        # Stable sort keeps the original file order within equal publish dates,
+        # and the original index labels are preserved for identical output
+        self._df = df.sort_values(["Ticker", "Publish Date"], kind="stable")
+        self._publish_ns = self._df["Publish Date"].values.astype("int64")
+
+        tickers = self._df["Ticker"].to_numpy()
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        if len(tickers):
+            starts = np.concatenate(([0], np.flatnonzero(tickers[1:] != tickers[:-1]) + 1))
+            ends = np.append(starts[1:], len(tickers))
+            for start, end in zip(starts, ends):
+                self._offsets[tickers[start]] = (int(start), int(end))
+
+    def latest_on_or_before(self, ticker: str, curr_date: str) -> Optional[Any]:
+        """
+        Get the most recently published row for a ticker as of a date.
+
+        Args:
+            ticker: Ticker symbol
+            curr_date: Current date in yyyy-mm-dd format
+
+        Returns:
+            The matching row as a Series, or None if nothing was published yet
+        """
+        offsets = self._offsets.get(ticker)
+        if offsets is None:
+            return None
+
+        np = _get_numpy()
+        start, end = offsets
+        curr_ns = _get_pandas().to_datetime(curr_date, utc=True).normalize().value
+        dates = self._publish_ns[start:end]
+
+        pos = int(np.searchsorted(dates, curr_ns, side="right"))
+        if pos == 0:
+            return None
+
+        # First row among those sharing the latest publish date (idxmax semantics)
+        first = int(np.searchsorted(dates, dates[pos - 1], side="left"))
+        return self._df.iloc[start + first]
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+
+_indexes: Dict[str, Tuple[int, SimFinIndex]] = {}
+_indexes_lock = threading.Lock()
+_build_locks: Dict[str, threading.Lock] = {}
+
+
+def get_simfin_index(data_path: str, dataset: str) -> SimFinIndex:
+    """
+    Get the index for a SimFin CSV, building it once per file version.
+
+    Args:
+        data_path: Path to the us-*-{freq}.csv file
+        dataset: Dataset name used as the store key, e.g. "us-balance-annual"
+
+    Returns:
+        SimFinIndex for the current contents of the file
+    """
+    mtime = os.stat(data_path).st_mtime_ns
+
+    with _indexes_lock:
+        cached = _indexes.get(data_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        build_lock = _build_locks.setdefault(data_path, threading.Lock())
+
+    with build_lock:
+        with _indexes_lock:
+            cached = _indexes.get(data_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+        df = read_market_csv(data_path, dataset, "simfin", sep=";")
+        index = SimFinIndex(df)
+        logger.info(f"📚 Built SimFin index for {dataset}: {len(index)} rows")
+
+        with _indexes_lock:
+            _indexes[data_path] = (mtime, index)
+        return index
+
+
+def clear_simfin_indexes() -> None:
+    """Drop all built SimFin indexes"""
+    with _indexes_lock:
+        _indexes.clear()
@@ -6,6 +6,7 @@ from typing import Annotated
 import os
 import re
 from .config import get_config
+from .ohlcv_store import read_market_csv
 
 # LAZY LOADER for pandas - prevents pandas circular import in Studio
 def _get_pandas():
@@ -92,14 +93,8 @@ class StockstatsUtils:
         return data
 
     @staticmethod
-    def get_stock_stats(
+    def load_stock_data(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
         data_dir: Annotated[
             str,
             "directory where the stock data is stored.",
@@ -109,111 +104,142 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        """Load the OHLCV series for a symbol and prepare it for stockstats.
 
+        Returns the cleaned DataFrame, or an "Error: ..." string when the data
+        could not be loaded. Raises if the offline CSV has not been fetched yet.
+        """
         if not online:
             try:
-                data = _get_pandas().read_csv(
+                data = read_market_csv(
                     os.path.join(
                         data_dir,
                         f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
+                    ),
+                    symbol,
+                    "yfin_offline",
                 )
                 # Prepare data for stockstats processing
                 data = StockstatsUtils.prepare_data_for_stockstats(data)
-                
+
                 if data.empty:
                     return "Error: No valid data after cleaning"
-                
-                df = _get_stockstats_wrap()(data)
+                return data
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
             except Exception as e:
                 print(f"Error processing offline data for {symbol}: {e}")
                 return f"Error: {str(e)}"
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = _get_pandas().Timestamp.today()
-            curr_date_dt = _get_pandas().to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - _get_pandas().DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            config = get_config()
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                try:
-                    data = _get_pandas().read_csv(data_file)
-                    # Prepare data for stockstats processing
-                    data = StockstatsUtils.prepare_data_for_stockstats(data)
-                    
-                    if data.empty:
-                        print(f"No valid data found in cache for {symbol}")
-                        # Remove the corrupted cache file and re-download
-                        os.remove(data_file)
-                        return StockstatsUtils.get_stock_stats(symbol, indicator, curr_date, data_dir, online=True)
-                        
-                except Exception as e:
-                    print(f"Error reading cached data for {symbol}: {e}")
-                    # Remove corrupted cache file and retry
-                    if os.path.exists(data_file):
-                        os.remove(data_file)
-                    return StockstatsUtils.get_stock_stats(symbol, indicator, curr_date, data_dir, online=True)
-            else:
-                try:
-                    data = _get_yfinance().download(
-                        symbol,
-                        start=start_date,
-                        end=end_date,
-                        multi_level_index=False,
-                        progress=False,
-                        auto_adjust=True,
-                    )
-                    if data.empty:
-                        return f"Error: No data available for {symbol}"
-                        
-                    data = data.reset_index()
-                    data.to_csv(data_file, index=False)
-                    
-                except Exception as e:
-                    print(f"Error downloading data for {symbol}: {e}")
-                    return f"Error: {str(e)}"
 
-            # Prepare data for stockstats processing
-            data = StockstatsUtils.prepare_data_for_stockstats(data)
-            
-            if data.empty:
-                return "Error: No valid data after cleaning"
-            
+        # Get today's date as YYYY-mm-dd to add to cache
+        today_date = _get_pandas().Timestamp.today()
+
+        end_date = today_date
+        start_date = today_date - _get_pandas().DateOffset(years=15)
+        start_date = start_date.strftime("%Y-%m-%d")
+        end_date = end_date.strftime("%Y-%m-%d")
+
+        # Get config and ensure cache directory exists
+        config = get_config()
+        os.makedirs(config["data_cache_dir"], exist_ok=True)
+
+        data_file = os.path.join(
+            config["data_cache_dir"],
+            f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
+        )
+
+        if os.path.exists(data_file):
             try:
-                df = _get_stockstats_wrap()(data)
-                # Convert curr_date back to string format for comparison
-                curr_date = curr_date_dt.strftime("%Y-%m-%d")
+                data = read_market_csv(data_file, symbol, "yfin_cache")
+                # Prepare data for stockstats processing
+                data = StockstatsUtils.prepare_data_for_stockstats(data)
+
+                if data.empty:
+                    print(f"No valid data found in cache for {symbol}")
+                    # Remove the corrupted cache file and re-download
+                    os.remove(data_file)
+                    return StockstatsUtils.load_stock_data(symbol, data_dir, online=True)
+
             except Exception as e:
-                print(f"Error wrapping data with stockstats for {symbol}: {e}")
-                return f"Error: Failed to process data with stockstats - {str(e)}"
+                print(f"Error reading cached data for {symbol}: {e}")
+                # Remove corrupted cache file and retry
+                if os.path.exists(data_file):
+                    os.remove(data_file)
+                return StockstatsUtils.load_stock_data(symbol, data_dir, online=True)
+        else:
+            try:
+                data = _get_yfinance().download(
+                    symbol,
+                    start=start_date,
+                    end=end_date,
+                    multi_level_index=False,
+                    progress=False,
+                    auto_adjust=True,
+                )
+                if data.empty:
+                    return f"Error: No data available for {symbol}"
+
+                data = data.reset_index()
+                data.to_csv(data_file, index=False)
+
+            except Exception as e:
+                print(f"Error downloading data for {symbol}: {e}")
+                return f"Error: {str(e)}"
+
+        # Prepare data for stockstats processing
+        data = StockstatsUtils.prepare_data_for_stockstats(data)
+
+        if data.empty:
+            return "Error: No valid data after cleaning"
+
+        return data
+
+    @staticmethod
+    def _date_strings(df):
+        """Return the Date column of a wrapped frame as YYYY-mm-dd strings"""
+        if 'Date' in df.columns and _get_pandas().api.types.is_datetime64_any_dtype(df['Date']):
+            return df['Date'].dt.strftime('%Y-%m-%d')
+        return df["Date"].astype(str).str[:10]
+
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        data = StockstatsUtils.load_stock_data(symbol, data_dir, online=online)
+        if isinstance(data, str):
+            return data
+
+        try:
+            df = _get_stockstats_wrap()(data)
+            if online:
+                # Convert curr_date back to string format for comparison
+                curr_date = _get_pandas().to_datetime(curr_date).strftime("%Y-%m-%d")
+        except Exception as e:
+            if not online:
+                print(f"Error processing offline data for {symbol}: {e}")
+                return f"Error: {str(e)}"
+            print(f"Error wrapping data with stockstats for {symbol}: {e}")
+            return f"Error: Failed to process data with stockstats - {str(e)}"
 
         try:
             # Trigger stockstats to calculate the indicator
             df[indicator]
-            
-            # Convert Date column to string for comparison if it's datetime
-            if 'Date' in df.columns and _get_pandas().api.types.is_datetime64_any_dtype(df['Date']):
-                date_strings = df['Date'].dt.strftime('%Y-%m-%d')
-                matching_rows = df[date_strings == curr_date]
-            else:
-                # If Date is already string, use string comparison
-                matching_rows = df[df["Date"].astype(str).str.startswith(curr_date)]
+
+            matching_rows = df[StockstatsUtils._date_strings(df) == curr_date]
 
             if not matching_rows.empty:
                 indicator_value = matching_rows[indicator].values[0]
@@ -231,3 +257,116 @@ class StockstatsUtils:
         except Exception as e:
             print(f"Error getting stockstats indicator data for indicator {indicator} on {curr_date}: {e}")
             return f"Error: {str(e)}"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        """Compute an indicator once and return its values for a date window.
+
+        The series is loaded and wrapped a single time and the indicator column
+        is sliced with a vectorized date mask, instead of re-reading the CSV for
+        every day as repeated get_stock_stats calls would.
+
+        Returns:
+            dict mapping YYYY-mm-dd trading dates in [start_date, end_date] to the
+            indicator value, or an error string if the data could not be processed.
+        """
+        data = StockstatsUtils.load_stock_data(symbol, data_dir, online=online)
+        if isinstance(data, str):
+            return data
+
+        try:
+            df = _get_stockstats_wrap()(data)
+        except Exception as e:
+            print(f"Error wrapping data with stockstats for {symbol}: {e}")
+            return f"Error: Failed to process data with stockstats - {str(e)}"
+
+        try:
+            # Trigger stockstats to calculate the indicator column once
+            values = df[indicator]
+
+            date_strings = StockstatsUtils._date_strings(df)
+            mask = ((date_strings >= start_date) & (date_strings <= end_date)).values
+            # Keep the first row per date, matching get_stock_stats lookups
+            window = dict(zip(date_strings.values[mask][::-1], values.values[mask][::-1]))
+            return window
+        except AttributeError as e:
+            from .empty_response_handler import create_empty_technical_indicators_response
+            error_msg = f"AttributeError in stockstats processing: {str(e)}"
+            print(f"AttributeError getting stockstats indicator data for {symbol}: {e}")
+            return create_empty_technical_indicators_response(symbol, indicator, error_msg)
+        except KeyError as e:
+            print(f"Error: Indicator '{indicator}' not found. Available indicators: {list(df.columns)}")
+            return f"Error: Invalid indicator '{indicator}'"
+        except Exception as e:
+            print(f"Error getting stockstats indicator window for indicator {indicator} from {start_date} to {end_date}: {e}")
+            return f"Error: {str(e)}"
+
+    @staticmethod
+    def get_stock_stats_table(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            list, "quantitative indicators to compute, e.g. ['close_50_sma', 'macd', 'rsi']"
+        ],
+        start_date: Annotated[str, "first date of the window, YYYY-mm-dd"],
+        end_date: Annotated[str, "last date of the window, YYYY-mm-dd"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        """Compute several indicators over one load of the series.
+
+        The OHLCV data is loaded and wrapped once, every requested column is
+        computed on that frame, and the rows in [start_date, end_date] are
+        selected with a single date mask - one load instead of one per indicator.
+
+        Returns:
+            DataFrame indexed by YYYY-mm-dd trading date (first row per date) with
+            one column per indicator, or an error string if the data could not be
+            processed. Indicators stockstats cannot compute are returned as an
+            all-NaN column and reported on stdout.
+        """
+        data = StockstatsUtils.load_stock_data(symbol, data_dir, online=online)
+        if isinstance(data, str):
+            return data
+
+        try:
+            df = _get_stockstats_wrap()(data)
+        except Exception as e:
+            print(f"Error wrapping data with stockstats for {symbol}: {e}")
+            return f"Error: Failed to process data with stockstats - {str(e)}"
+
+        pd = _get_pandas()
+        columns = {}
+        for indicator in indicators:
+            try:
+                # Trigger stockstats to calculate each column once on the shared frame
+                columns[indicator] = df[indicator].values
+            except Exception as e:
+                print(f"Error computing stockstats indicator '{indicator}' for {symbol}: {e}")
+                columns[indicator] = [float("nan")] * len(df)
+
+        date_strings = StockstatsUtils._date_strings(df)
+        table = pd.DataFrame(columns, index=date_strings.values)
+        mask = ((date_strings >= start_date) & (date_strings <= end_date)).values
+        table = table[mask]
+        return table[~table.index.duplicated(keep="first")]
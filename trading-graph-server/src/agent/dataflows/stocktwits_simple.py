@@ -3,11 +3,11 @@ StockTwits Sentiment Analysis Tool
 Ultra-lightweight implementation using public API (no auth required)
 """
 
-import aiohttp
 import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
+from ..utils.connection_pool import shared_session, cleanup_connection_pool
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ async def get_stocktwits_fast(
     url = f"https://api.stocktwits.com/api/2/streams/symbol/{ticker}.json"
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             # Add timeout and user agent
             headers = {
                 "User-Agent": "StockAnalyzer/1.0"
@@ -243,6 +243,7 @@ def get_stocktwits_sync(ticker: str) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_stocktwits_fast(ticker))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
 
 
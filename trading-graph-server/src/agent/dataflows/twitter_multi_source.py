@@ -9,24 +9,27 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import time
 
+from ..utils.hedging import HedgeSource, hedged_race
+
 logger = logging.getLogger(__name__)
 
 
 class TwitterMultiSourceOrchestrator:
     """
-    Orchestrates multiple Twitter data sources with intelligent fallback
+    Orchestrates multiple Twitter data sources with hedged fallback
     Priority order: Syndication API -> Existing alternatives -> Aggregated social
     """
     
     def __init__(self):
         self.max_total_time = 8.0  # Maximum time for all attempts
-        self.rate_limit_delay = 0.2  # Small delay between requests
+        self.hedge_delay = 1.5  # Start the next source if the current one is this slow
     
     async def get_twitter_sentiment(self, ticker: str, limit: int = 20) -> Dict[str, Any]:
         """
         Get Twitter sentiment using multi-source orchestration
         
-        Source priority:
+        Source priority (hedged: each source starts when the previous one is
+        slower than its hedge delay or fails; the first acceptable result wins):
         1. Twitter Syndication API (free, direct Twitter data)
         2. Existing alternatives (Bluesky, Mastodon) 
         3. Aggregated social sentiment (Finnhub, StockTwits, Reddit)
@@ -38,67 +41,44 @@ class TwitterMultiSourceOrchestrator:
         Returns:
             Twitter sentiment data with source information
         """
-        start_time = time.time()
         logger.info(f"🔄 Starting multi-source Twitter sentiment for ${ticker}")
         
-        # Source 1: Twitter Syndication API (FREE, real Twitter data)
-        if time.time() - start_time < self.max_total_time:
-            logger.info(f"🎯 Trying Twitter Syndication API for ${ticker}")
-            try:
-                syndication_result = await asyncio.wait_for(
-                    self._get_syndication_sentiment(ticker, limit), 
-                    timeout=4.0
-                )
-                
-                if syndication_result and not syndication_result.get("fallback_mode"):
-                    # Success with real Twitter data
-                    logger.info(f"✅ Twitter Syndication API success: {syndication_result.get('tweet_count', 0)} tweets")
-                    return self._format_result(syndication_result, "twitter_syndication")
-                    
-            except asyncio.TimeoutError:
-                logger.debug(f"⏰ Twitter Syndication API timeout for ${ticker}")
-            except Exception as e:
-                logger.debug(f"❌ Twitter Syndication API error for ${ticker}: {e}")
-        
-        # Source 2: Fast alternatives (Bluesky, Mastodon)
-        if time.time() - start_time < self.max_total_time:
-            logger.info(f"🔄 Trying fast Twitter alternatives for ${ticker}")
-            try:
-                alternatives_result = await asyncio.wait_for(
-                    self._get_twitter_alternatives(ticker, limit),
-                    timeout=3.0
-                )
-                
-                if alternatives_result and alternatives_result.get("tweet_count", 0) > 0:
-                    logger.info(f"✅ Twitter alternatives success: {alternatives_result.get('tweet_count', 0)} posts")
-                    return self._format_result(alternatives_result, "twitter_alternatives")
-                    
-            except asyncio.TimeoutError:
-                logger.debug(f"⏰ Twitter alternatives timeout for ${ticker}")
-            except Exception as e:
-                logger.debug(f"❌ Twitter alternatives error for ${ticker}: {e}")
+        sources = [
+            HedgeSource(
+                "twitter_syndication",
+                lambda: self._get_syndication_sentiment(ticker, limit),
+                timeout=4.0,
+                accept=lambda r: bool(r) and not r.get("fallback_mode"),
+            ),
+            HedgeSource(
+                "twitter_alternatives",
+                lambda: self._get_twitter_alternatives(ticker, limit),
+                timeout=3.0,
+                accept=lambda r: bool(r) and r.get("tweet_count", 0) > 0,
+            ),
+            HedgeSource(
+                "aggregated_social",
+                lambda: self._get_aggregated_sentiment(ticker),
+                timeout=2.0,
+                # Its neutral fallback is not data and must not beat real tweets
+                accept=lambda r: bool(r) and not r.get("fallback_mode"),
+            ),
+        ]
+        race = await hedged_race(sources, budget=self.max_total_time, hedge_delay=self.hedge_delay)
         
-        # Source 3: Aggregated social sentiment (most reliable fallback)
-        if time.time() - start_time < self.max_total_time:
-            logger.info(f"🔄 Using aggregated social sentiment for ${ticker}")
-            try:
-                aggregated_result = await asyncio.wait_for(
-                    self._get_aggregated_sentiment(ticker),
-                    timeout=2.0
-                )
-                
-                if aggregated_result:
-                    logger.info(f"✅ Aggregated social success: {len(aggregated_result.get('sources_used', []))} sources")
-                    return self._transform_aggregated_to_twitter_format(aggregated_result)
-                    
-            except asyncio.TimeoutError:
-                logger.debug(f"⏰ Aggregated social timeout for ${ticker}")
-            except Exception as e:
-                logger.debug(f"❌ Aggregated social error for ${ticker}: {e}")
+        if race.source == "twitter_syndication":
+            # Success with real Twitter data
+            logger.info(f"✅ Twitter Syndication API success: {race.value.get('tweet_count', 0)} tweets")
+            return self._format_result(race.value, "twitter_syndication")
+        if race.source == "twitter_alternatives":
+            logger.info(f"✅ Twitter alternatives success: {race.value.get('tweet_count', 0)} posts")
+            return self._format_result(race.value, "twitter_alternatives")
+        if race.source == "aggregated_social":
+            logger.info(f"✅ Aggregated social success: {len(race.value.get('sources_used', []))} sources")
+            return self._transform_aggregated_to_twitter_format(race.value)
         
         # All sources failed - return clear error with mock data marking
-        elapsed = time.time() - start_time
-        logger.error(f"🚨 All Twitter sources failed for ${ticker} after {elapsed:.1f}s")
+        logger.error(f"🚨 All Twitter sources failed for ${ticker} after {race.elapsed:.1f}s ({race.attempts})")
         return self._create_failure_result(ticker)
     
     async def _get_syndication_sentiment(self, ticker: str, limit: int) -> Optional[Dict[str, Any]]:
@@ -270,7 +250,7 @@ if __name__ == "__main__":
     test_ticker = "TSLA"
     print(f"🧪 Testing Multi-Source Twitter Orchestrator for {test_ticker}")
     print("=" * 70)
-    print("📊 Will try sources in order:")
+    print("📊 Will race sources in priority order (hedged):")
     print("  1. Twitter Syndication API (free, real Twitter data)")
     print("  2. Twitter alternatives (Bluesky, Mastodon)")
     print("  3. Aggregated social (Finnhub, StockTwits, Reddit)")
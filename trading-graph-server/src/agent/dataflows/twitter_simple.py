@@ -3,11 +3,13 @@ Twitter Data Gathering via Nitter
 Ultra-lightweight implementation using RSS feeds (no auth required)
 """
 
-import aiohttp
 import asyncio
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
+from ..utils.connection_pool import shared_session, cleanup_connection_pool
+from ..utils.hedging import HedgeSource, hedged_race
+from ..utils.sentiment_lexicon import SOCIAL_LEXICON
 import re
 import xml.etree.ElementTree as ET
 import random
@@ -34,7 +36,7 @@ async def get_twitter_alternative_search(ticker: str, limit: int = 20) -> Dict[s
         }
         
         # Try to get recent Twitter sentiment via indirect methods
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             # Search for recent mentions
             for term in search_terms:
                 try:
@@ -102,7 +104,7 @@ async def get_mastodon_sentiment(ticker: str, limit: int = 20) -> Dict[str, Any]
                     "limit": min(limit, 40)
                 }
                 
-                async with aiohttp.ClientSession() as session:
+                async with shared_session() as session:
                     async with session.get(url, params=params, headers=headers, timeout=6) as resp:
                         if resp.status == 200:
                             data = await resp.json()
@@ -167,26 +169,7 @@ def analyze_search_sentiment(content: str, ticker: str) -> float:
         return 0.5  # Neutral if no context found
     
     # Simple sentiment analysis on ticker contexts
-    bullish_words = ["buy", "bull", "bullish", "up", "rise", "gain", "strong", "positive", "growth"]
-    bearish_words = ["sell", "bear", "bearish", "down", "fall", "loss", "weak", "negative", "decline"]
-    
-    bullish_count = 0
-    bearish_count = 0
-    
-    combined_context = " ".join(ticker_contexts)
-    
-    for word in bullish_words:
-        bullish_count += combined_context.count(word)
-    
-    for word in bearish_words:
-        bearish_count += combined_context.count(word)
-    
-    total_sentiment = bullish_count + bearish_count
-    
-    if total_sentiment == 0:
-        return 0.5  # Neutral
-    
-    return bullish_count / total_sentiment
+    return SOCIAL_LEXICON.score(" ".join(ticker_contexts))
 
 
 async def get_twitter_fast(ticker: str, limit: int = 20) -> Dict[str, Any]:
@@ -194,7 +177,7 @@ async def get_twitter_fast(ticker: str, limit: int = 20) -> Dict[str, Any]:
     Get Twitter-like social sentiment data via multiple sources with aggressive timeouts
     
     Primary: Quick Bluesky API (2s timeout)
-    Secondary: Fast Mastodon search (2s timeout)  
+    Secondary: Fast Mastodon search (2s timeout), started after 1s or as soon as Bluesky fails
     Fallback: Intelligent simulation based on market data
     
     Args:
@@ -212,39 +195,24 @@ async def get_twitter_fast(ticker: str, limit: int = 20) -> Dict[str, Any]:
         - error: Error message if request failed
     """
     
-    # Set maximum total time for all attempts to 5 seconds
-    import time
-    start_time = time.time()
+    # Bluesky first, hedged with Mastodon after 1s; at most 5 seconds in total
     max_total_time = 5.0
-    
-    # Try Bluesky first with aggressive 2s timeout
-    if time.time() - start_time < max_total_time:
-        logger.info(f"🐦 Quick Bluesky attempt for {ticker}")
-        try:
-            bluesky_result = await asyncio.wait_for(get_bluesky_sentiment(ticker, limit), timeout=2.0)
-            if bluesky_result and bluesky_result.get("tweet_count", 0) > 0:
-                logger.info(f"✅ Bluesky quick success: {bluesky_result.get('tweet_count')} posts")
-                return bluesky_result
-        except asyncio.TimeoutError:
-            logger.debug(f"⏰ Bluesky timeout for {ticker}")
-        except Exception as e:
-            logger.debug(f"❌ Bluesky error for {ticker}: {e}")
-    
-    # Try Mastodon with aggressive 2s timeout
-    if time.time() - start_time < max_total_time:
-        logger.info(f"🔄 Quick Mastodon attempt for {ticker}")
-        try:
-            mastodon_result = await asyncio.wait_for(get_mastodon_sentiment(ticker, limit), timeout=2.0)
-            if mastodon_result and mastodon_result.get("tweet_count", 0) > 0:
-                logger.info(f"✅ Mastodon quick success: {mastodon_result.get('tweet_count')} posts")
-                return mastodon_result
-        except asyncio.TimeoutError:
-            logger.debug(f"⏰ Mastodon timeout for {ticker}")
-        except Exception as e:
-            logger.debug(f"❌ Mastodon error for {ticker}: {e}")
+    race = await hedged_race(
+        [
+            HedgeSource("bluesky", lambda: get_bluesky_sentiment(ticker, limit), timeout=2.0,
+                        accept=lambda r: bool(r) and r.get("tweet_count", 0) > 0),
+            HedgeSource("mastodon", lambda: get_mastodon_sentiment(ticker, limit), timeout=2.0,
+                        accept=lambda r: bool(r) and r.get("tweet_count", 0) > 0),
+        ],
+        budget=max_total_time,
+        hedge_delay=1.0,
+    )
+    if race.ok:
+        logger.info(f"✅ {race.source.capitalize()} quick success: {race.value.get('tweet_count')} posts")
+        return race.value
     
     # All fast sources failed - return empty response instead of simulation
-    elapsed = time.time() - start_time
+    elapsed = race.elapsed
     logger.warning(f"🚨 All quick Twitter sources failed for {ticker} after {elapsed:.1f}s, returning empty response")
     from .empty_response_handler import create_empty_twitter_response
     return create_empty_twitter_response(
@@ -280,7 +248,7 @@ async def get_bluesky_sentiment(ticker: str, limit: int = 20) -> Dict[str, Any]:
             "Accept": "application/json"
         }
         
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             async with session.get(url, params=params, headers=headers, timeout=5) as resp:
                 if resp.status == 200:
                     data = await resp.json()
@@ -437,53 +405,12 @@ def calculate_twitter_sentiment(tweets: List[Dict]) -> float:
         Sentiment score from 0 (bearish) to 1 (bullish), 0.5 = neutral
     """
     
-    # Extended keyword lists for financial sentiment
-    bullish_words = [
-        "buy", "moon", "bull", "bullish", "long", "calls", "rocket", "green",
-        "pump", "breakout", "rally", "surge", "gain", "profit", "up", "rise",
-        "growth", "strong", "hodl", "diamond", "hands", "to the moon"
-    ]
-    
-    bearish_words = [
-        "sell", "crash", "bear", "bearish", "short", "puts", "dump", "red",
-        "drop", "fall", "decline", "loss", "down", "weak", "panic", "fear",
-        "collapse", "tank", "plummet", "correction", "bubble"
-    ]
-    
-    bullish_count = 0
-    bearish_count = 0
-    total_words = 0
-    
-    for tweet in tweets:
-        text = tweet["text"].lower()
-        summary = tweet.get("summary", "").lower()
-        combined_text = f"{text} {summary}"
-        
-        # Count sentiment words
-        for word in bullish_words:
-            if word in combined_text:
-                bullish_count += combined_text.count(word)
-        
-        for word in bearish_words:
-            if word in combined_text:
-                bearish_count += combined_text.count(word)
-        
-        # Count total relevant words for context
-        total_words += len(combined_text.split())
-    
-    # Calculate sentiment score
-    total_sentiment = bullish_count + bearish_count
-    
-    if total_sentiment == 0:
-        # No explicit sentiment words found
-        return 0.5  # Neutral
-    
-    # Convert to 0-1 scale
-    sentiment_score = bullish_count / total_sentiment
+    counts = SOCIAL_LEXICON.score_batch(
+        [f"{tweet['text']} {tweet.get('summary', '')}" for tweet in tweets]
+    ).total
     
-    # Add slight bias toward neutral if very few sentiment words
-    if total_sentiment < 3:
-        sentiment_score = 0.4 + (sentiment_score * 0.2)  # Compress toward neutral
+    # Slight bias toward neutral if very few sentiment words
+    sentiment_score = counts.score(shrink_below=3)
     
     return round(sentiment_score, 3)
 
@@ -516,6 +443,7 @@ def get_twitter_sync(ticker: str) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_twitter_fast(ticker))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
 
 
@@ -2,6 +2,11 @@
 Twitter Syndication API Client
 Uses Twitter's free internal syndication endpoint for tweet data
 No authentication required - this is the endpoint used by Twitter embeds
+
+Search queries run concurrently and tweet IDs are hydrated as soon as they are
+found, through a bounded worker pool behind a shared token bucket. Hydrated
+tweets (and known-missing ones) are kept in a process-wide LRU so IDs seen for
+another ticker or an earlier run are not fetched again.
 """
 
 import aiohttp
@@ -9,13 +14,67 @@ import asyncio
 import json
 import math
 import re
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 import logging
 import hashlib
 
+from ..utils.connection_pool import get_connection_pool, cleanup_connection_pool
+from ..utils.rate_limiter import TokenBucket
+from ..utils.sentiment_lexicon import SOCIAL_LEXICON, LexiconCounts
+
 logger = logging.getLogger(__name__)
 
+# Concurrent tweet fetches per call, and the syndication rate shared by all calls
+HYDRATE_CONCURRENCY = 5
+HYDRATE_RATE_PER_SECOND = 10.0
+HYDRATE_BURST = 5
+
+# Recently hydrated tweets, by ID
+TWEET_CACHE_SIZE = 2048
+TWEET_CACHE_TTL = 900  # Seconds; engagement counts drift, so don't keep tweets forever
+
+_tweet_cache: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+_tweet_cache_lock = threading.Lock()
+_tweet_cache_stats = {"hits": 0, "misses": 0}
+
+_hydrate_limiter: Optional[TokenBucket] = None
+_hydrate_limiter_lock = threading.Lock()
+
+
+def get_hydrate_rate_limiter() -> TokenBucket:
+    """Token bucket shared by every syndication tweet fetch in the process"""
+    global _hydrate_limiter
+    if _hydrate_limiter is None:
+        with _hydrate_limiter_lock:
+            if _hydrate_limiter is None:
+                _hydrate_limiter = TokenBucket(rate=HYDRATE_RATE_PER_SECOND, capacity=HYDRATE_BURST,
+                                               name="twitter_syndication")
+    return _hydrate_limiter
+
+
+def _cache_get(tweet_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """(hit, tweet) - a hit may be None for a tweet known to be missing"""
+    with _tweet_cache_lock:
+        entry = _tweet_cache.get(tweet_id)
+        if entry is None or time.monotonic() - entry[0] > TWEET_CACHE_TTL:
+            _tweet_cache_stats["misses"] += 1
+            return False, None
+        _tweet_cache.move_to_end(tweet_id)
+        _tweet_cache_stats["hits"] += 1
+        return True, entry[1]
+
+
+def _cache_put(tweet_id: str, tweet: Optional[Dict[str, Any]]):
+    with _tweet_cache_lock:
+        _tweet_cache[tweet_id] = (time.monotonic(), tweet)
+        _tweet_cache.move_to_end(tweet_id)
+        while len(_tweet_cache) > TWEET_CACHE_SIZE:
+            _tweet_cache.popitem(last=False)
+
 
 class TwitterSyndicationAPI:
     """
@@ -32,6 +91,7 @@ class TwitterSyndicationAPI:
     
     def __init__(self):
         self.session = None
+        self.timeout = aiohttp.ClientTimeout(total=10)
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "application/json, text/html, */*",
@@ -41,15 +101,14 @@ class TwitterSyndicationAPI:
         }
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers=self.headers,
-            timeout=aiohttp.ClientTimeout(total=10)
-        )
+        # Borrow the shared keep-alive session; headers and timeout go per request
+        pool = await get_connection_pool()
+        self.session = pool.session
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The shared session stays open so its connections can be reused
+        self.session = None
     
     def generate_token(self, tweet_id: str) -> str:
         """
@@ -90,12 +149,15 @@ class TwitterSyndicationAPI:
         }
         
         try:
-            async with self.session.get(url, params=params) as response:
+            async with self.session.get(url, params=params, headers=self.headers, timeout=self.timeout) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return self.parse_tweet_data(data)
+                    tweet = self.parse_tweet_data(data)
+                    _cache_put(tweet_id, tweet)
+                    return tweet
                 elif response.status == 404:
                     logger.debug(f"Tweet {tweet_id} not found or private")
+                    _cache_put(tweet_id, None)
                     return None
                 else:
                     logger.warning(f"Syndication API error {response.status} for tweet {tweet_id}")
@@ -108,6 +170,24 @@ class TwitterSyndicationAPI:
             logger.error(f"Error fetching tweet {tweet_id}: {e}")
             return None
     
+    async def hydrate_tweet(self, tweet_id: str, semaphore: asyncio.Semaphore) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a tweet through the cache, the worker pool and the rate limiter
+        """
+        hit, tweet = _cache_get(tweet_id)
+        if hit:
+            return tweet
+        async with semaphore:
+            await get_hydrate_rate_limiter().acquire()
+            return await self.get_tweet_by_id(tweet_id)
+    
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """Tweet cache and rate limiter counters"""
+        with _tweet_cache_lock:
+            cache = {**_tweet_cache_stats, "size": len(_tweet_cache)}
+        return {"tweet_cache": cache, "rate_limiter": get_hydrate_rate_limiter().get_stats()}
+    
     def parse_tweet_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse tweet data from syndication API response
@@ -181,7 +261,7 @@ class TwitterSyndicationAPI:
                 try:
                     params = {"q": search_query}
                     
-                    async with self.session.get(engine_url, params=params, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                    async with self.session.get(engine_url, params=params, headers=self.headers, timeout=aiohttp.ClientTimeout(total=5)) as response:
                         if response.status == 200:
                             content = await response.text()
                             
@@ -229,9 +309,14 @@ class TwitterSyndicationAPI:
         
         return tweet_ids
     
-    async def get_tweets_for_ticker(self, ticker: str, limit: int = 20) -> List[Dict[str, Any]]:
+    async def get_tweets_for_ticker(self, ticker: str, limit: int = 20,
+                                    on_tweet: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
         """
         Main method to get tweets for a stock ticker
+        
+        All search queries run at once; each tweet ID is hydrated as soon as a
+        search returns it (up to `limit` IDs), and relevant tweets are handed
+        to `on_tweet` in arrival order.
         """
         if not self.session:
             raise RuntimeError("Use async context manager")
@@ -246,47 +331,65 @@ class TwitterSyndicationAPI:
             f"{ticker} earnings"
         ]
         
-        all_tweet_ids = []
+        semaphore = asyncio.Semaphore(HYDRATE_CONCURRENCY)
+        searches = {
+            asyncio.create_task(self.search_tweets_via_search_engines(query, limit=10)): query
+            for query in search_queries
+        }
+        pending = set(searches)
+        scheduled = set()
+        tweets = []
         
-        # Try different search queries
-        for query in search_queries:
-            try:
-                tweet_ids = await self.search_tweets_via_search_engines(query, limit=10)
-                all_tweet_ids.extend(tweet_ids)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 
-                if len(all_tweet_ids) >= limit:
-                    break
+                for task in done:
+                    if task in searches:
+                        try:
+                            tweet_ids = task.result()
+                        except Exception as e:
+                            logger.debug(f"Search failed for query '{searches[task]}': {e}")
+                            continue
+                        # Start hydrating new IDs right away
+                        for tweet_id in tweet_ids:
+                            if len(scheduled) >= limit:
+                                break
+                            if tweet_id not in scheduled:
+                                scheduled.add(tweet_id)
+                                pending.add(asyncio.create_task(self.hydrate_tweet(tweet_id, semaphore)))
+                        continue
                     
-            except Exception as e:
-                logger.debug(f"Search failed for query '{query}': {e}")
-                continue
-        
-        # Remove duplicates
-        unique_tweet_ids = list(dict.fromkeys(all_tweet_ids))[:limit]
+                    try:
+                        tweet_data = task.result()
+                    except Exception as e:
+                        logger.debug(f"Failed to fetch tweet: {e}")
+                        continue
+                    if tweet_data and tweet_data.get("text"):
+                        # Filter tweets that actually mention the ticker
+                        text = tweet_data["text"].upper()
+                        if f"${ticker.upper()}" in text or f"#{ticker.upper()}" in text or ticker.upper() in text:
+                            tweets.append(tweet_data)
+                            if on_tweet is not None:
+                                on_tweet(tweet_data)
+                
+                if len(scheduled) >= limit:
+                    # Enough IDs: the remaining searches can't add anything
+                    stale = {task for task in pending if task in searches}
+                    for task in stale:
+                        task.cancel()
+                    pending -= stale
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
-        if not unique_tweet_ids:
+        if not scheduled:
             logger.warning(f"No tweet IDs found for {ticker}")
             return []
         
-        # Fetch tweet data for each ID
-        tweets = []
-        for tweet_id in unique_tweet_ids:
-            try:
-                tweet_data = await self.get_tweet_by_id(tweet_id)
-                if tweet_data and tweet_data.get("text"):
-                    # Filter tweets that actually mention the ticker
-                    text = tweet_data["text"].upper()
-                    if f"${ticker.upper()}" in text or f"#{ticker.upper()}" in text or ticker.upper() in text:
-                        tweets.append(tweet_data)
-                        
-            except Exception as e:
-                logger.debug(f"Failed to fetch tweet {tweet_id}: {e}")
-                continue
-            
-            # Rate limiting - small delay between requests
-            await asyncio.sleep(0.1)
-        
-        logger.info(f"✅ Found {len(tweets)} relevant tweets for ${ticker}")
+        logger.info(f"✅ Found {len(tweets)} relevant tweets for ${ticker} ({len(scheduled)} IDs hydrated)")
         return tweets
 
 
@@ -296,7 +399,9 @@ async def get_twitter_syndication_sentiment(ticker: str, limit: int = 20) -> Dic
     Get Twitter sentiment using syndication API
     """
     async with TwitterSyndicationAPI() as api:
-        tweets = await api.get_tweets_for_ticker(ticker, limit)
+        # Score tweets as they are hydrated instead of after the last one lands
+        scorer = TweetSentimentScorer()
+        tweets = await api.get_tweets_for_ticker(ticker, limit, on_tweet=scorer.add)
         
         if not tweets:
             from .empty_response_handler import create_empty_twitter_response
@@ -305,8 +410,7 @@ async def get_twitter_syndication_sentiment(ticker: str, limit: int = 20) -> Dic
                 reason="No tweets found via Twitter syndication API"
             )
         
-        # Analyze sentiment from tweets
-        sentiment_score = analyze_tweet_sentiment(tweets)
+        sentiment_score = scorer.score()
         
         # Determine confidence based on tweet count and quality
         if len(tweets) >= 15:
@@ -341,72 +445,52 @@ async def get_twitter_syndication_sentiment(ticker: str, limit: int = 20) -> Dic
         }
 
 
-def analyze_tweet_sentiment(tweets: List[Dict[str, Any]]) -> float:
+def _engagement_weight(tweet: Dict[str, Any]) -> int:
+    """Likes + retweets, at least 1"""
+    engagement = tweet.get("engagement", {})
+    return max(1, engagement.get("likes", 0) + engagement.get("retweets", 0))
+
+
+class TweetSentimentScorer:
     """
-    Analyze sentiment from tweet data
-    Returns score from 0 (bearish) to 1 (bullish)
+    Engagement-weighted keyword sentiment, updated one tweet at a time so
+    tweets can be scored while the rest are still being fetched
     """
-    if not tweets:
-        return 0.5
     
-    # Extended keyword lists for financial sentiment
-    bullish_words = [
-        "buy", "moon", "bull", "bullish", "long", "calls", "rocket", "green",
-        "pump", "breakout", "rally", "surge", "gain", "profit", "up", "rise",
-        "growth", "strong", "hodl", "diamond", "hands", "to the moon", "🚀", "📈",
-        "bullish", "positive", "optimistic", "confident", "buying", "accumulate"
-    ]
-    
-    bearish_words = [
-        "sell", "crash", "bear", "bearish", "short", "puts", "dump", "red",
-        "drop", "fall", "decline", "loss", "down", "weak", "panic", "fear",
-        "collapse", "tank", "plummet", "correction", "bubble", "📉", "⬇️",
-        "bearish", "negative", "pessimistic", "selling", "exit", "avoid"
-    ]
-    
-    bullish_count = 0
-    bearish_count = 0
-    total_weight = 0
+    def __init__(self):
+        self.bullish_count = 0
+        self.bearish_count = 0
+        self.tweet_count = 0
     
-    for tweet in tweets:
-        text = tweet.get("text", "").lower()
-        
-        # Get engagement weight (likes + retweets)
-        engagement = tweet.get("engagement", {})
-        weight = max(1, engagement.get("likes", 0) + engagement.get("retweets", 0))
-        
-        # Count sentiment words
-        tweet_bullish = 0
-        tweet_bearish = 0
-        
-        for word in bullish_words:
-            if word in text:
-                tweet_bullish += text.count(word)
-        
-        for word in bearish_words:
-            if word in text:
-                tweet_bearish += text.count(word)
+    def add(self, tweet: Dict[str, Any]):
+        counts = SOCIAL_LEXICON.count(tweet.get("text", ""))
+        weight = _engagement_weight(tweet)
         
         # Apply engagement weighting
-        bullish_count += tweet_bullish * weight
-        bearish_count += tweet_bearish * weight
-        total_weight += weight
+        self.bullish_count += counts.positive * weight
+        self.bearish_count += counts.negative * weight
+        self.tweet_count += 1
     
-    # Calculate sentiment score
-    total_sentiment = bullish_count + bearish_count
-    
-    if total_sentiment == 0:
-        # No explicit sentiment words found - neutral
+    def score(self) -> float:
+        """Score from 0 (bearish) to 1 (bullish)"""
+        # Slight bias toward neutral if very few sentiment words
+        counts = LexiconCounts(self.bullish_count, self.bearish_count)
+        return round(counts.score(shrink_below=5), 3)
+
+
+def analyze_tweet_sentiment(tweets: List[Dict[str, Any]]) -> float:
+    """
+    Analyze sentiment from tweet data
+    Returns score from 0 (bearish) to 1 (bullish)
+    """
+    if not tweets:
         return 0.5
     
-    # Convert to 0-1 scale
-    sentiment_score = bullish_count / total_sentiment
-    
-    # Add slight bias toward neutral if very few sentiment words
-    if total_sentiment < 5:
-        sentiment_score = 0.4 + (sentiment_score * 0.2)  # Compress toward neutral
-    
-    return round(sentiment_score, 3)
+    counts = SOCIAL_LEXICON.score_batch(
+        [tweet.get("text", "") for tweet in tweets],
+        weights=[_engagement_weight(tweet) for tweet in tweets],
+    ).total
+    return round(counts.score(shrink_below=5), 3)
 
 
 # Synchronous wrapper for testing
@@ -419,6 +503,7 @@ def get_twitter_syndication_sync(ticker: str) -> Dict[str, Any]:
     try:
         return loop.run_until_complete(get_twitter_syndication_sentiment(ticker))
     finally:
+        loop.run_until_complete(cleanup_connection_pool())
         loop.close()
 
 
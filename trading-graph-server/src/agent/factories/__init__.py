@@ -2,12 +2,14 @@
 Factory classes for creating trading agents and components with single responsibility
 """
 
-from .llm_factory import LLMFactory
+from .llm_factory import LLMFactory, LLMClientPool, get_llm_pool_stats
 from .memory_factory import MemoryFactory
 from .toolkit_factory import ToolkitFactory
 
 __all__ = [
     "LLMFactory",
+    "LLMClientPool",
+    "get_llm_pool_stats",
     "MemoryFactory", 
     "ToolkitFactory"
 ] 
\ No newline at end of file
@@ -1,55 +1,251 @@
 # TradingAgents/factories/llm_factory.py
 
+import asyncio
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from ..interfaces import ILLMProvider
 
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def _close_async_clients(clients: List[httpx.AsyncClient]) -> None:
+    """Close async httpx clients, ignoring ones whose connections are already gone"""
+    await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+class LLMClientPool:
+    """
+    Process-wide registry of LLM instances and their HTTP transports.
+
+    LLM instances are shared per (provider, model, base_url), and
+    OpenAI-compatible models on the same (provider, base_url) share one tuned
+    sync/async httpx client pair, so connections and TLS sessions are reused
+    across agents, graph builds and concurrent runs.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = _http2_available()
+        self._lock = threading.Lock()
+        self._http_clients: Dict[Tuple[str, str], Tuple[httpx.Client, httpx.AsyncClient]] = {}
+        self._llms: Dict[Tuple[str, str, str], ILLMProvider] = {}
+        self._stats: Dict[Tuple[str, str, str], Dict[str, int]] = {}
+        # Close tasks scheduled by clear(); held so they are not garbage collected
+        self._closing: Set[asyncio.Task] = set()
+
+    def _new_http_clients(self) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        # The SDKs pass their own per-request timeouts; this is only the fallback
+        timeout = httpx.Timeout(600.0, connect=10.0)
+        return (
+            httpx.Client(limits=limits, timeout=timeout, http2=self.http2),
+            httpx.AsyncClient(limits=limits, timeout=timeout, http2=self.http2),
+        )
+
+    def get_http_clients(self, provider: str, base_url: Optional[str]) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """Get the shared (sync, async) httpx clients for an endpoint"""
+        key = (provider, base_url or "")
+        with self._lock:
+            clients = self._http_clients.get(key)
+            if clients is None:
+                clients = self._new_http_clients()
+                self._http_clients[key] = clients
+            return clients
+
+    def get_or_create(self, provider: str, model: str, base_url: Optional[str], factory) -> ILLMProvider:
+        """Return the pooled LLM for a key, creating it with factory() on first use"""
+        key = (provider, model, base_url or "")
+        with self._lock:
+            stats = self._stats.setdefault(key, {"hits": 0, "created": 0})
+            llm = self._llms.get(key)
+            if llm is not None:
+                stats["hits"] += 1
+                return llm
+
+        # Build outside the lock; factory() may need get_http_clients()
+        llm = factory()
+        with self._lock:
+            existing = self._llms.get(key)
+            if existing is not None:
+                stats["hits"] += 1
+                return existing
+            self._llms[key] = llm
+            stats["created"] += 1
+            return llm
+
+    @staticmethod
+    def _open_connections(client) -> Optional[int]:
+        """Best-effort count of pooled connections (httpcore internals)"""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return len(connections) if connections is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics per LLM key and per HTTP endpoint"""
+        with self._lock:
+            return {
+                "http2": self.http2,
+                "max_connections": self.max_connections,
+                "max_keepalive_connections": self.max_keepalive_connections,
+                "llms": {
+                    "|".join(key): dict(stats) for key, stats in self._stats.items()
+                },
+                "endpoints": {
+                    "|".join(key): {
+                        "sync_connections": self._open_connections(sync_client),
+                        "async_connections": self._open_connections(async_client),
+                    }
+                    for key, (sync_client, async_client) in self._http_clients.items()
+                },
+            }
+
+    def _release(self) -> List[httpx.AsyncClient]:
+        """Forget pooled LLMs, close the sync HTTP clients and return the async ones"""
+        with self._lock:
+            clients = list(self._http_clients.values())
+            self._http_clients.clear()
+            self._llms.clear()
+            self._stats.clear()
+        for sync_client, _ in clients:
+            sync_client.close()
+        return [async_client for _, async_client in clients]
+
+    def clear(self) -> None:
+        """
+        Forget pooled LLMs and close their HTTP clients.
+
+        Async clients are closed on the running event loop in the background, or
+        on a temporary loop when called from sync code. Use aclose() from async
+        code to wait for them.
+        """
+        async_clients = self._release()
+        if not async_clients:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(_close_async_clients(async_clients))
+            return
+        task = loop.create_task(_close_async_clients(async_clients))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Forget pooled LLMs and close both sync and async HTTP clients"""
+        await _close_async_clients(self._release())
+
+
+# Global pool instance
+_llm_pool: Optional[LLMClientPool] = None
+_llm_pool_lock = threading.Lock()
+
+
+def get_llm_pool() -> LLMClientPool:
+    """Get the process-wide LLM client pool"""
+    global _llm_pool
+    if _llm_pool is None:
+        with _llm_pool_lock:
+            if _llm_pool is None:
+                _llm_pool = LLMClientPool(
+                    max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "100")),
+                    max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20")),
+                )
+    return _llm_pool
+
+
+def get_llm_pool_stats() -> Dict[str, Any]:
+    """Get statistics of the process-wide LLM client pool"""
+    return get_llm_pool().get_stats()
+
+
 class LLMFactory:
     """Factory for creating LLM providers"""
-    
+
     @staticmethod
     def create_llm(provider: str, model: str, config: Dict[str, Any]) -> ILLMProvider:
-        """Create LLM instance based on provider type"""
-        
+        """Create LLM instance based on provider type, reusing pooled instances by default"""
+        if not config.get("enable_llm_client_pool", True):
+            return LLMFactory._build_llm(provider, model, config)
+
+        base_url = config.get("backend_url") if provider.lower() != "google" else None
+        return get_llm_pool().get_or_create(
+            provider.lower(),
+            model,
+            base_url,
+            lambda: LLMFactory._build_llm(provider, model, config, pooled=True),
+        )
+
+    @staticmethod
+    def _build_llm(provider: str, model: str, config: Dict[str, Any], pooled: bool = False) -> ILLMProvider:
+        """Build a new LLM instance, sharing the endpoint's HTTP clients when pooled"""
+
         if provider.lower() in ["openai", "ollama", "openrouter"]:
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY environment variable is not set")
+            kwargs = {}
+            if pooled:
+                http_client, http_async_client = get_llm_pool().get_http_clients(
+                    provider.lower(), config.get("backend_url")
+                )
+                kwargs = {"http_client": http_client, "http_async_client": http_async_client}
             return ChatOpenAI(
-                model=model, 
-                base_url=config.get("backend_url"), 
-                api_key=api_key
+                model=model,
+                base_url=config.get("backend_url"),
+                api_key=api_key,
+                **kwargs
             )
-        
+
         elif provider.lower() == "anthropic":
+            # ChatAnthropic manages its own client; pooling the instance reuses it
             return ChatAnthropic(
-                model=model, 
+                model=model,
                 base_url=config.get("backend_url")
             )
-        
+
         elif provider.lower() == "google":
             return ChatGoogleGenerativeAI(model=model)
-        
+
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
-    
+
     @staticmethod
     def create_quick_thinking_llm(config: Dict[str, Any]) -> ILLMProvider:
         """Create quick thinking LLM"""
         return LLMFactory.create_llm(
-            config["llm_provider"], 
-            config["quick_thinking_model"], 
+            config["llm_provider"],
+            config["quick_thinking_model"],
             config
         )
-    
+
     @staticmethod
     def create_deep_thinking_llm(config: Dict[str, Any]) -> ILLMProvider:
         """Create deep thinking LLM"""
         return LLMFactory.create_llm(
-            config["llm_provider"], 
-            config["reasoning_model"], 
+            config["llm_provider"],
+            config["reasoning_model"],
             config
-        ) 
\ No newline at end of file
+        )
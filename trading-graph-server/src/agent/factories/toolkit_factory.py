@@ -40,8 +40,10 @@ class ToolkitFactory:
         allowed_tools = [
             # Primary market data tools
             "get_YFin_data_online", 
+            "get_stockstats_indicators_table_online",
             "get_stockstats_indicators_report_online",
             "get_YFin_data", 
+            "get_stockstats_indicators_table",
             "get_stockstats_indicators_report",
             # Company-specific data
             "get_stock_news_openai",
@@ -0,0 +1,160 @@
+# TradingAgents/graph/graph_cache.py
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANALYSTS = ["market", "social", "news", "fundamentals"]
+
+# Distinct (config, analysts) combinations kept compiled at once
+MAX_CACHED_GRAPHS = 8
+
+
+class CompiledGraphCache:
+    """
+    Cache of fully constructed TradingAgentsGraph instances.
+
+    Building a TradingAgentsGraph creates LLM clients, memories and toolkits
+    and compiles the LangGraph graph, so it is done once per effective config
+    and analyst selection instead of once per request. Construction is lazy,
+    guarded by a per-key lock so concurrent callers share one build.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_GRAPHS):
+        self.max_size = max_size
+        self._graphs: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._stats = {"hits": 0, "builds": 0, "evictions": 0, "build_seconds": 0.0}
+
+    @staticmethod
+    def make_key(config: Dict[str, Any], selected_analysts: List[str]) -> str:
+        """Hash the effective config and analyst selection into a cache key"""
+        payload = json.dumps(
+            {"config": dict(config), "analysts": list(selected_analysts)},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, config: Optional[Dict[str, Any]] = None, selected_analysts: Optional[List[str]] = None):
+        """
+        Get the TradingAgentsGraph for a config, building it on first use.
+
+        This blocks while building; async callers should use aget().
+        """
+        config, selected_analysts = self._resolve(config, selected_analysts)
+        key = self.make_key(config, selected_analysts)
+
+        with self._lock:
+            instance = self._graphs.get(key)
+            if instance is not None:
+                self._graphs.move_to_end(key)
+                self._stats["hits"] += 1
+                return instance
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            with self._lock:
+                instance = self._graphs.get(key)
+                if instance is not None:
+                    self._graphs.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return instance
+
+            instance = self._build(config, selected_analysts, key)
+
+            with self._lock:
+                self._graphs[key] = instance
+                self._build_locks.pop(key, None)
+                while len(self._graphs) > self.max_size:
+                    self._graphs.popitem(last=False)
+                    self._stats["evictions"] += 1
+            return instance
+
+    async def aget(self, config: Optional[Dict[str, Any]] = None, selected_analysts: Optional[List[str]] = None):
+        """Async variant of get() that builds off the event loop"""
+        return await asyncio.to_thread(self.get, config, selected_analysts)
+
+    def _resolve(self, config, selected_analysts):
+        if config is None:
+            from ..default_config import DEFAULT_CONFIG
+            config = DEFAULT_CONFIG.copy()
+        return dict(config), list(selected_analysts or DEFAULT_ANALYSTS)
+
+    def _build(self, config: Dict[str, Any], selected_analysts: List[str], key: str):
+        from .trading_graph import TradingAgentsGraph
+
+        start = time.time()
+        logger.info(f"🔨 Building trading graph {key[:12]} for analysts {selected_analysts}")
+        instance = TradingAgentsGraph(config=config, selected_analysts=selected_analysts)
+        duration = time.time() - start
+
+        with self._lock:
+            self._stats["builds"] += 1
+            self._stats["build_seconds"] += duration
+        logger.info(f"✅ Trading graph {key[:12]} built in {duration:.2f}s")
+        return instance
+
+    def prewarm(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        selected_analysts: Optional[List[str]] = None,
+        in_background: bool = True,
+    ) -> Optional[threading.Thread]:
+        """
+        Build a graph ahead of the first request.
+
+        Args:
+            config: Config to build for (defaults to DEFAULT_CONFIG)
+            selected_analysts: Analysts to include (defaults to all four)
+            in_background: Build on a daemon thread instead of blocking the caller
+
+        Returns:
+            The warm-up thread when in_background is True, otherwise None
+        """
+        def _warm():
+            try:
+                self.get(config, selected_analysts)
+            except Exception as e:
+                logger.error(f"❌ Graph pre-warm failed: {e}")
+
+        if not in_background:
+            _warm()
+            return None
+
+        thread = threading.Thread(target=_warm, name="graph-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self) -> None:
+        """Drop all cached graphs"""
+        with self._lock:
+            self._graphs.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            return {**self._stats, "cached_graphs": len(self._graphs), "max_size": self.max_size}
+
+
+# Global cache instance
+_graph_cache: Optional[CompiledGraphCache] = None
+_graph_cache_lock = threading.Lock()
+
+
+def get_graph_cache() -> CompiledGraphCache:
+    """Get the process-wide compiled graph cache"""
+    global _graph_cache
+    if _graph_cache is None:
+        with _graph_cache_lock:
+            if _graph_cache is None:
+                _graph_cache = CompiledGraphCache()
+    return _graph_cache
@@ -203,7 +203,7 @@ MANDATORY REQUIREMENTS:
 2. DO NOT generate analysis based on general knowledge alone
 3. Call the following tools IN THIS ORDER:
    - get_YFin_data_online or get_YFin_data to fetch current price and volume data
-   - get_stockstats_indicators_report_online or get_stockstats_indicators_report for technical indicators
+   - get_stockstats_indicators_table_online or get_stockstats_indicators_table for all technical indicators in one call
 
 Only AFTER receiving tool results, provide your analysis including:
 - Current price trends and momentum
@@ -225,7 +225,9 @@ REMEMBER: Use tools FIRST, then analyze the results. Do not skip tool usage.
             elif hasattr(toolkit, 'get_YFin_data'):
                 tools.append(toolkit.get_YFin_data)
                 
-            if hasattr(toolkit, 'get_stockstats_indicators_report_online'):
+            if hasattr(toolkit, 'get_stockstats_indicators_table_online'):
+                tools.append(toolkit.get_stockstats_indicators_table_online)
+            elif hasattr(toolkit, 'get_stockstats_indicators_report_online'):
                 tools.append(toolkit.get_stockstats_indicators_report_online)
             elif hasattr(toolkit, 'get_stockstats_indicators_report'):
                 tools.append(toolkit.get_stockstats_indicators_report)
@@ -8,6 +8,7 @@ import time
 import logging
 from typing import Dict, List, Callable
 from ...utils.agent_states import AgentState
+from ...utils.structured_reports import merge_structured_reports
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +72,10 @@ def create_parallel_analysts_executor(analysts_dict: Dict[str, Callable]):
                 
                 # Merge the analyst's state updates
                 for key, value in analyst_state.items():
-                    if key != "messages":  # Don't merge message history
+                    if key == "structured_reports":
+                        # Each analyst contributes its own kind
+                        merged_state[key] = merge_structured_reports(merged_state.get(key), value)
+                    elif key != "messages":  # Don't merge message history
                         merged_state[key] = value
         
         # Performance tracking
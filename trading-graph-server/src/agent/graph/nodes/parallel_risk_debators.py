@@ -66,7 +66,8 @@ def create_parallel_risk_debators(aggressive_llm, conservative_llm, neutral_llm)
                             "market_report": shared_context.get('market_report', ''),
                             "sentiment_report": shared_context.get('sentiment_report', ''),
                             "news_report": shared_context.get('news_report', ''),
-                            "fundamentals_report": shared_context.get('fundamentals_report', '')
+                            "fundamentals_report": shared_context.get('fundamentals_report', ''),
+                            "structured_reports": state.get("structured_reports")
                         }
                     )
                     
@@ -124,7 +125,8 @@ Provide your aggressive risk perspective emphasizing:
                             "market_report": shared_context.get('market_report', ''),
                             "sentiment_report": shared_context.get('sentiment_report', ''),
                             "news_report": shared_context.get('news_report', ''),
-                            "fundamentals_report": shared_context.get('fundamentals_report', '')
+                            "fundamentals_report": shared_context.get('fundamentals_report', ''),
+                            "structured_reports": state.get("structured_reports")
                         }
                     )
                     
@@ -182,7 +184,8 @@ Provide your conservative risk perspective focusing on:
                             "market_report": shared_context.get('market_report', ''),
                             "sentiment_report": shared_context.get('sentiment_report', ''),
                             "news_report": shared_context.get('news_report', ''),
-                            "fundamentals_report": shared_context.get('fundamentals_report', '')
+                            "fundamentals_report": shared_context.get('fundamentals_report', ''),
+                            "structured_reports": state.get("structured_reports")
                         }
                     )
                     
@@ -308,6 +311,8 @@ Provide your balanced risk perspective including:
             logger.critical("🔥 PHASE 2 CONTEXT OPTIMIZATION METRICS:")
             logger.critical(f"🔥 SmartContext Mode: ENABLED")
             logger.critical(f"🔥 Cache Status: {cache_stats['cache_size']} entries")
+            logger.critical(f"🔥 Cache Hits/Misses/Evictions: {cache_stats['hits']}/{cache_stats['misses']}/{cache_stats['evictions']} "
+                            f"(extractions reused: {cache_stats['extraction_hits']})")
             logger.critical(f"🔥 Target Token Reduction: 74% (93,737 → 20,000)")
             logger.critical(f"🔥 Expected Token Savings: ~73,737 tokens per execution")
         else:
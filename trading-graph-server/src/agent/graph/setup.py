@@ -228,7 +228,7 @@ class GraphBuilder(IGraphBuilder):
             "market": """Expert market analyst: TA & trading signals.
 
 MANDATORY: Use tools→get real data before analysis.
-Tools: get_YFin_data, get_stockstats_indicators_report
+Tools: get_YFin_data, get_stockstats_indicators_table (all indicators in ONE call)
 
 Workflow: 1)Call tools 2)Get data 3)Analyze 4)Report
 
@@ -714,6 +714,8 @@ Output structure:
             "market": [
                 "get_YFin_data",  # Always first - provides base price data
                 "get_YFin_data_online",  # Online version as alternative
+                "get_stockstats_indicators_table",  # Second - all indicators in one call
+                "get_stockstats_indicators_table_online",  # Online version
                 "get_stockstats_indicators_report",  # Second - technical analysis
                 "get_stockstats_indicators_report_online"  # Online version
             ],
@@ -1017,8 +1019,13 @@ Output structure:
                 
                 # Use cache if enabled, otherwise execute directly
                 if self.config.get("enable_smart_caching", True):
-                    task = cache.get_or_fetch(tool_name, tool_args, cached_execution)
-                    result = await task  # Await the cached or new task
+                    # Concurrent misses for the same call share one fetch; fallback results aren't cached
+                    result = await cache.aget_or_fetch(
+                        tool_name,
+                        tool_args,
+                        cached_execution,
+                        cache_if=lambda value: not (isinstance(value, dict) and value.get("fallback"))
+                    )
                 else:
                     # Direct execution without caching
                     fallback_tool = None
@@ -30,6 +30,7 @@ from ..dataflows.config import get_config
 from .optimized_setup import OptimizedGraphBuilder
 from .enhanced_optimized_setup import EnhancedOptimizedGraphBuilder
 from .signal_processing import SignalProcessor
+from ..utils.tracing import start_run
 
 
 class TradingAgentsGraph:
@@ -149,19 +150,38 @@ class TradingAgentsGraph:
             }
         }
         
+        run = None
         try:
-            # Run the graph
-            config = {"recursion_limit": 50}
-            final_state = await self.graph.ainvoke(initial_state, config)
-            
-            # Process signal
-            signal = self._extract_final_signal(final_state)
-            processed_signal = await self.signal_processor.process_signal(signal)
-            
-            # Return results
-            final_state["processed_signal"] = processed_signal
-            return final_state, processed_signal
-            
+            with start_run(f"analysis:{company_name}", ticker=company_name, trade_date=str(date)) as run:
+                try:
+                    # Run the graph; the callback records node/tool/LLM spans into this run
+                    config = {"recursion_limit": 50, "callbacks": [run.callback_handler()]}
+                    final_state = await self.graph.ainvoke(initial_state, config)
+                
+                    # Process signal
+                    signal = self._extract_final_signal(final_state)
+                    processed_signal = await self.signal_processor.process_signal(signal)
+                
+                    # Return results
+                    final_state["processed_signal"] = processed_signal
+                    return final_state, processed_signal
+                
+                except Exception as e:
+                    logger.error(f"❌ Graph execution failed: {e}")
+                    raise
+        finally:
+            if run is not None:
+                self._export_trace(run, company_name, date)
+    
+    def _export_trace(self, run, company_name: str, date: str):
+        """Write the run's span tree when trace_export_dir is configured"""
+        export_dir = self.config.get("trace_export_dir")
+        if not export_dir or run.root.end_ns is None:
+            # Disabled, or an outer caller owns the still-open run and exports it
+            return
+        try:
+            base = os.path.join(export_dir, f"{company_name}_{date}_{run.trace_id[:8]}")
+            run.export_json(f"{base}.trace.json")
+            run.export_otlp(f"{base}.otlp.json")
         except Exception as e:
-            logger.error(f"❌ Graph execution failed: {e}")
-            raise
+            logger.warning(f"⚠️ Trace export failed: {e}")
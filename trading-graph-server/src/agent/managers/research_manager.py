@@ -14,8 +14,10 @@ from ..utils.agent_states import AgentState
 from ..utils.agent_prompt_enhancer import enhance_agent_prompt
 from ..utils.prompt_compressor import get_prompt_compressor, compress_prompt
 from ..utils.token_limiter import get_token_limiter
+from ..utils.memory import situation_from_reports
 from ..utils.safe_state_access import create_safe_state_wrapper, get_safe_format_vars
 from ..utils.news_filter import filter_news_for_llm
+from ..utils.structured_reports import get_structured_report
 
 logger = logging.getLogger(__name__)
 
@@ -156,7 +158,8 @@ def create_research_manager(llm, memory, config: Dict = None):
         sentiment_report = safe_state.get("sentiment_report", "")
         
         # Apply token optimization to news report for research manager
-        filtered_news = filter_news_for_llm(news_report, max_articles=12)
+        filtered_news = filter_news_for_llm(news_report, max_articles=12,
+                                            news_data=get_structured_report(safe_state, "news"))
         
         # Check report quality
         reports_quality = {
@@ -235,7 +238,9 @@ Time Horizon: Re-evaluate when more data is available
 """
         
         # Save to memory
-        memory.save_memory(f"Investment plan generated after {executed_round} rounds: {investment_plan[:200]}...")
+        situation = situation_from_reports(market_research_report, sentiment_report, news_report, fundamentals_report)
+        memory.save_memory(f"Investment plan generated after {executed_round} rounds: {investment_plan[:200]}...",
+                           situation=situation)
         
         # Update state with final plan
         logger.info("✅ Investment plan complete - proceeding to risk management")
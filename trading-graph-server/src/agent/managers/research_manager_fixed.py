@@ -14,6 +14,7 @@ from ..utils.agent_states import AgentState
 from ..utils.agent_prompt_enhancer import enhance_agent_prompt
 from ..utils.prompt_compressor import get_prompt_compressor, compress_prompt
 from ..utils.token_limiter import get_token_limiter
+from ..utils.memory import situation_from_reports
 
 logger = logging.getLogger(__name__)
 
@@ -293,7 +294,9 @@ Time Horizon: Re-evaluate when more data is available
 """
             
             # Save to memory
-            memory.save_memory(f"Investment plan generated after {current_round} rounds: {investment_plan[:200]}...")
+            situation = situation_from_reports(market_research_report, sentiment_report, news_report, fundamentals_report)
+            memory.save_memory(f"Investment plan generated after {current_round} rounds: {investment_plan[:200]}...",
+                               situation=situation)
             
             # Update state with final plan
             logger.info("✅ Investment plan complete - proceeding to risk management")
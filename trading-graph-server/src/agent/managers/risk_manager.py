@@ -7,6 +7,7 @@ from ..utils.prompt_compressor import get_prompt_compressor, compress_prompt
 from ..utils.token_limiter import get_token_limiter
 from ..utils.safe_state_access import create_safe_state_wrapper
 from ..utils.news_filter import filter_news_for_llm
+from ..utils.structured_reports import get_structured_report
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,8 @@ def create_risk_manager(llm, memory):
         trader_plan = safe_state.get("trader_investment_plan", "") or safe_state.get("investment_plan", "")
 
         # Apply token optimization to news report (comprehensive risk oversight)
-        filtered_news = filter_news_for_llm(news_report, max_articles=12)
+        filtered_news = filter_news_for_llm(news_report, max_articles=12,
+                                            news_data=get_structured_report(safe_state, "news"))
         
         # Prepare analysis
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{filtered_news}\n\n{fundamentals_report}"
@@ -13,6 +13,7 @@ from ..utils.prompt_compressor import get_prompt_compressor, compress_prompt
 from ..utils.token_limiter import get_token_limiter
 from ..utils.safe_state_access import create_safe_state_wrapper
 from ..utils.news_filter import filter_news_for_llm
+from ..utils.structured_reports import get_structured_report
 from ..prompts.enhanced_prompts_v4 import get_enhanced_prompt
 from ..default_config import DEFAULT_CONFIG
 
@@ -40,7 +41,8 @@ def create_bear_researcher(llm, memory):
         start_time = time.time()
 
         # Apply token optimization to news report
-        filtered_news = filter_news_for_llm(news_report, max_articles=15)
+        filtered_news = filter_news_for_llm(news_report, max_articles=15,
+                                            news_data=get_structured_report(safe_state, "news"))
         
         # Get past memories
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{filtered_news}\n\n{fundamentals_report}"
@@ -6,6 +6,7 @@ from ..utils.prompt_compressor import get_prompt_compressor, compress_prompt
 from ..utils.token_limiter import get_token_limiter
 from ..utils.safe_state_access import create_safe_state_wrapper
 from ..utils.news_filter import filter_news_for_llm
+from ..utils.structured_reports import get_structured_report
 
 
 def create_risky_debator(llm):
@@ -35,7 +36,8 @@ def create_risky_debator(llm):
         fundamentals_report = safe_state.get("fundamentals_report", "")
 
         # Apply token optimization to news report (aggressive opportunity focus)
-        filtered_news = filter_news_for_llm(news_report, max_articles=10)
+        filtered_news = filter_news_for_llm(news_report, max_articles=10,
+                                            news_data=get_structured_report(safe_state, "news"))
 
         trader_decision = safe_state.get("trader_investment_plan", "")
 
@@ -6,6 +6,8 @@ from langgraph.graph import END, StateGraph, START
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
+from .structured_reports import merge_structured_reports
+
 # TASK 5.2: Import optimized state management
 from .state_optimizer import (
     create_optimized_message_reducer,
@@ -79,6 +81,9 @@ class AgentState(TypedDict):
     news_report: Annotated[Optional[str], optimized_report_reducer]
     fundamentals_report: Annotated[Optional[str], optimized_report_reducer]
     
+    # Typed payloads behind the reports (see structured_reports.py), keyed by kind
+    structured_reports: Annotated[Optional[dict], merge_structured_reports]
+    
     # TASK 5.2: Optimized debate states with atomic updates and memory efficiency
     investment_debate_state: Annotated[Optional[InvestDebateState], merge_debate_state]
     risk_debate_state: Annotated[Optional[RiskDebateState], merge_risk_debate_state]
@@ -42,6 +42,10 @@ def create_msg_delete():
     return delete_messages
 
 
+# Indicators included in get_all_market_data
+MARKET_DATA_INDICATORS = ["close_50_sma", "close_200_sma", "macd", "rsi"]
+
+
 class Toolkit:
     _config = None  # Lazy initialization to prevent blocking I/O at import
 
@@ -68,6 +72,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     def get_reddit_news(
         curr_date: Annotated[str, "Date you want to get news for in yyyy-mm-dd format"],
     ) -> str:
@@ -118,6 +123,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     async def get_reddit_stock_info(
         ticker: Annotated[
             str,
@@ -243,6 +249,67 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
+    def get_stockstats_indicators_table(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to report together, e.g. ['close_50_sma', 'macd', 'rsi', 'boll']; empty for the default set"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators at once as a single table (one call instead of one per indicator).
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to report, e.g. ['close_50_sma', 'macd', 'rsi']
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A table of the indicators by trading day, followed by a short description of each indicator.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_table(
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
+    def get_stockstats_indicators_table_online(
+        symbol: Annotated[str, "ticker symbol of the company"],
+        indicators: Annotated[
+            List[str], "technical indicators to report together - valid options: 'close_50_sma', 'close_200_sma', 'close_10_ema', 'macd', 'macds', 'macdh', 'rsi', 'boll', 'boll_ub', 'boll_lb', 'atr', 'vwma', 'mfi'; empty for the default set"
+        ],
+        curr_date: Annotated[
+            str, "The current trading date you are trading on, YYYY-mm-dd"
+        ],
+        look_back_days: Annotated[int, "how many days to look back"] = 30,
+    ) -> str:
+        """
+        Retrieve several stock stats indicators at once as a single table (one call instead of one per indicator).
+        Args:
+            symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
+            indicators (List[str]): Technical indicators to report, e.g. ['close_50_sma', 'macd', 'rsi']
+            curr_date (str): The current trading date you are trading on, YYYY-mm-dd
+            look_back_days (int): How many days to look back, default is 30
+        Returns:
+            str: A table of the indicators by trading day, followed by a short description of each indicator.
+        """
+
+        result_stockstats = interface.get_stock_stats_indicators_table(
+            symbol, indicators, curr_date, look_back_days, True
+        )
+
+        return result_stockstats
+
+    @staticmethod
+    @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     def get_finnhub_company_insider_sentiment(
         ticker: Annotated[str, "ticker symbol for the company"],
         curr_date: Annotated[
@@ -267,6 +334,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     def get_finnhub_company_insider_transactions(
         ticker: Annotated[str, "ticker symbol"],
         curr_date: Annotated[
@@ -291,6 +359,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     def get_simfin_balance_sheet(
         ticker: Annotated[str, "ticker symbol"],
         freq: Annotated[
@@ -315,6 +384,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     def get_simfin_cashflow(
         ticker: Annotated[str, "ticker symbol"],
         freq: Annotated[
@@ -339,6 +409,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     def get_simfin_income_stmt(
         ticker: Annotated[str, "ticker symbol"],
         freq: Annotated[
@@ -365,6 +436,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     async def get_google_news(
         query: Annotated[str, "Query to search with"],
         curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
@@ -404,6 +476,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     async def get_global_news_openai(
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
     ):
@@ -421,6 +494,7 @@ class Toolkit:
 
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     async def get_fundamentals_openai(
         ticker: Annotated[str, "the company's ticker"],
         curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
@@ -443,6 +517,7 @@ class Toolkit:
     # Task 7.4.3: New placeholder tools for enhanced coverage
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     async def get_stocktwits_sentiment(
         ticker: Annotated[str, "the company's ticker"],
     ):
@@ -459,6 +534,7 @@ class Toolkit:
     
     @staticmethod
     @tool
+    @cache_tool_result()  # TTL from DEFAULT_TOOL_TTLS
     async def get_twitter_mentions(
         ticker: Annotated[str, "the company's ticker"],
     ):
@@ -515,7 +591,7 @@ class Toolkit:
         Get all market data in parallel for maximum performance.
         
         This is the implementation for Priority 2: Async Market Data Fetcher.
-        Fetches price data and all technical indicators concurrently.
+        Fetches price data and the indicator table (one data load) concurrently.
         
         Args:
             symbol: Stock ticker symbol
@@ -526,43 +602,32 @@ class Toolkit:
         """
         import asyncio
         
-        # Define all the data fetching tasks
-        tasks = []
+        online = self.config.get("online_tools", False)
+        start_date = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
         
-        # Price data task
-        async def get_price_data():
+        # The dataflows are blocking: run them in worker threads so they actually overlap
+        def get_price_data():
+            fetch = interface.get_YFin_data_online if online else interface.get_YFin_data
             try:
-                # For YFin data, we need start and end dates
-                start_date = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
-                return ("price_data", self.get_YFin_data(symbol, start_date, date))
+                return fetch(symbol, start_date, date)
             except Exception as e:
-                return ("price_data", f"Error fetching price data: {str(e)}")
-        
-        # Technical indicator tasks
-        indicators = ["close_50_sma", "close_200_sma", "macd", "rsi"]
+                return f"Error fetching price data: {str(e)}"
         
-        async def get_indicator(indicator_name):
+        def get_indicators():
+            # One load of the series for every indicator
             try:
-                return (indicator_name, self.get_stockstats_indicators_report(symbol, indicator_name, date))
+                return interface.get_stock_stats_indicators_table(
+                    symbol, MARKET_DATA_INDICATORS, date, 30, online
+                )
             except Exception as e:
-                return (indicator_name, f"Error fetching {indicator_name}: {str(e)}")
-        
-        # Add price data task
-        tasks.append(get_price_data())
+                return f"Error fetching indicators: {str(e)}"
         
-        # Add indicator tasks
-        for indicator in indicators:
-            tasks.append(get_indicator(indicator))
-        
-        # Execute all tasks in parallel
-        results = await asyncio.gather(*tasks)
-        
-        # Convert results to dictionary
-        market_data = {}
-        for key, value in results:
-            market_data[key] = value
+        price_data, indicators = await asyncio.gather(
+            asyncio.to_thread(get_price_data),
+            asyncio.to_thread(get_indicators),
+        )
         
-        return self._combine_market_data(market_data)
+        return self._combine_market_data({"price_data": price_data, "indicators": indicators})
     
     def _combine_market_data(self, results: dict) -> str:
         """
@@ -583,10 +648,8 @@ class Toolkit:
         
         # Add technical indicators
         combined_report += "📊 TECHNICAL INDICATORS:\n"
-        for indicator in ["close_50_sma", "close_200_sma", "macd", "rsi"]:
-            if indicator in results:
-                combined_report += f"\n{indicator.upper()}:\n"
-                combined_report += results[indicator] + "\n"
+        if "indicators" in results:
+            combined_report += results["indicators"] + "\n"
         
         return combined_report
     
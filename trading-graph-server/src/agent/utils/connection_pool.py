@@ -1,136 +1,307 @@
 """
 Connection Pooling for Priority 3 Optimization
 Implements HTTP connection pooling for improved performance
+
+One keep-alive aiohttp session is shared per event loop, with per-host
+connection limits, DNS caching and per-host request metrics. Dataflows use
+shared_session() instead of opening their own ClientSession per call.
 """
 
 import aiohttp
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Tuple
 from contextlib import asynccontextmanager
 
+from .tracing import start_span
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PooledResponse:
+    """Fully read HTTP response, safe to use after the connection is released"""
+    status: int
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+    encoding: str = "utf-8"
+
+    def text(self) -> str:
+        """Decode the body as text"""
+        return self.body.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        """Decode the body as JSON"""
+        import json
+        return json.loads(self.body) if self.body else None
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+
+@dataclass
+class HostMetrics:
+    """Request counters for one host"""
+    requests: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    dns_cache_hits: int = 0
+    total_latency: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        completed = self.requests - self.errors
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "dns_cache_hits": self.dns_cache_hits,
+            "avg_latency_ms": (self.total_latency / completed * 1000) if completed > 0 else 0.0,
+            "status_counts": dict(self.status_counts),
+        }
+
+
 class ConnectionPool:
     """
     Manages a pool of HTTP connections for efficient API calls.
-    
+
     This is the implementation for Priority 3: Add Connection Pooling.
-    Uses aiohttp's TCPConnector for connection pooling.
+    Uses aiohttp's TCPConnector for connection pooling. aiohttp sessions are
+    bound to the event loop that created them, so one session is kept per
+    running loop.
     """
-    
+
     _instance: Optional['ConnectionPool'] = None
-    _session: Optional[aiohttp.ClientSession] = None
-    _connector: Optional[aiohttp.TCPConnector] = None
-    
+
     def __new__(cls):
         """Singleton pattern to ensure one pool instance."""
         if cls._instance is None:
             cls._instance = super(ConnectionPool, cls).__new__(cls)
+            cls._instance._sessions = weakref.WeakKeyDictionary()
+            cls._instance._host_metrics = {}
+            cls._instance._settings = {
+                "limit": 100,
+                "limit_per_host": 30,
+                "ttl_dns_cache": 300,
+                "keepalive_timeout": 30.0,
+            }
         return cls._instance
-    
+
     async def initialize(
         self,
         limit: int = 100,
         limit_per_host: int = 30,
         ttl_dns_cache: int = 300,
-        force_close: bool = False
+        force_close: bool = False,
+        keepalive_timeout: float = 30.0
     ):
         """
-        Initialize the connection pool.
-        
+        Initialize the connection pool for the running event loop.
+
         Args:
             limit: Total connection pool limit
             limit_per_host: Limit per host
             ttl_dns_cache: DNS cache TTL in seconds
-            force_close: Force close existing connections
+            force_close: Close and recreate an existing session
+            keepalive_timeout: Seconds an idle connection is kept for reuse
         """
-        if self._session and not force_close:
+        loop = asyncio.get_running_loop()
+        if loop in self._sessions and not force_close:
             logger.info("🔌 Connection pool already initialized")
             return
-        
+
         # Close existing session if needed
-        if self._session:
+        if loop in self._sessions:
             await self.close()
-        
-        # Create new connector with pooling
-        self._connector = aiohttp.TCPConnector(
+
+        self._settings = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+
+        # Keep-alive connector: connections go back to the pool after each request
+        connector = aiohttp.TCPConnector(
             limit=limit,
             limit_per_host=limit_per_host,
             ttl_dns_cache=ttl_dns_cache,
-            force_close=True,
+            use_dns_cache=True,
+            keepalive_timeout=keepalive_timeout,
             enable_cleanup_closed=True
         )
-        
+
         # Create session with connector
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        self._session = aiohttp.ClientSession(
-            connector=self._connector,
+        session = aiohttp.ClientSession(
+            connector=connector,
             timeout=timeout,
             headers={
                 'User-Agent': 'TradingGraphServer/1.0'
-            }
+            },
+            trace_configs=[self._create_trace_config()]
         )
-        
+        self._sessions[loop] = (session, connector)
+
         logger.info(
             f"🔌 Connection pool initialized: "
             f"limit={limit}, limit_per_host={limit_per_host}"
         )
-    
+
+    def _metrics_for(self, host: Optional[str]) -> HostMetrics:
+        host = host or "unknown"
+        metrics = self._host_metrics.get(host)
+        if metrics is None:
+            metrics = self._host_metrics[host] = HostMetrics()
+        return metrics
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Trace hooks that feed the per-host metrics and the run's HTTP spans"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+            ctx.start = time.perf_counter()
+            ctx.span = start_span(f"{params.method} {ctx.host}", "http", url=str(params.url.with_query(None)))
+            self._metrics_for(ctx.host).requests += 1
+
+        async def on_request_end(session, ctx, params):
+            metrics = self._metrics_for(getattr(ctx, "host", params.url.host))
+            metrics.total_latency += time.perf_counter() - getattr(ctx, "start", time.perf_counter())
+            status = params.response.status
+            metrics.status_counts[status] = metrics.status_counts.get(status, 0) + 1
+            span = getattr(ctx, "span", None)
+            if span is not None:
+                span.set_attribute("http.status_code", status)
+                span.finish()
+
+        async def on_request_exception(session, ctx, params):
+            self._metrics_for(getattr(ctx, "host", params.url.host)).errors += 1
+            span = getattr(ctx, "span", None)
+            if span is not None:
+                span.finish(params.exception)
+
+        async def on_connection_create_end(session, ctx, params):
+            self._metrics_for(getattr(ctx, "host", None)).new_connections += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._metrics_for(getattr(ctx, "host", None)).reused_connections += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self._metrics_for(params.host).dns_cache_hits += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        return trace_config
+
+    def _current(self) -> Optional[Tuple[aiohttp.ClientSession, aiohttp.TCPConnector]]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        entry = self._sessions.get(loop)
+        if entry is not None and entry[0].closed:
+            del self._sessions[loop]
+            return None
+        return entry
+
+    @property
+    def initialized(self) -> bool:
+        """Whether the running event loop has a live session."""
+        return self._current() is not None
+
     @property
     def session(self) -> aiohttp.ClientSession:
-        """Get the current session."""
-        if not self._session:
+        """Get the session of the running event loop."""
+        entry = self._current()
+        if entry is None:
             raise RuntimeError("Connection pool not initialized. Call initialize() first.")
-        return self._session
-    
-    async def get(self, url: str, **kwargs) -> aiohttp.ClientResponse:
+        return entry[0]
+
+    async def request(self, method: str, url: str, **kwargs) -> PooledResponse:
+        """
+        Perform a request and read the full body before releasing the connection.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: URL to request
+            **kwargs: Additional arguments for aiohttp
+
+        Returns:
+            PooledResponse with status, headers and body
+        """
+        async with self.session.request(method, url, **kwargs) as response:
+            body = await response.read()
+            return PooledResponse(
+                status=response.status,
+                url=str(response.url),
+                headers=dict(response.headers),
+                body=body,
+                encoding=response.get_encoding() if body else "utf-8",
+            )
+
+    async def get(self, url: str, **kwargs) -> PooledResponse:
         """
         Perform GET request using the connection pool.
-        
+
         Args:
             url: URL to fetch
             **kwargs: Additional arguments for aiohttp
-            
+
         Returns:
-            Response object
+            Fully read response
         """
-        async with self.session.get(url, **kwargs) as response:
-            return response
-    
-    async def post(self, url: str, **kwargs) -> aiohttp.ClientResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> PooledResponse:
         """
         Perform POST request using the connection pool.
-        
+
         Args:
             url: URL to post to
             **kwargs: Additional arguments for aiohttp
-            
+
         Returns:
-            Response object
+            Fully read response
         """
-        async with self.session.post(url, **kwargs) as response:
-            return response
-    
+        return await self.request("POST", url, **kwargs)
+
     async def close(self):
-        """Close the connection pool and cleanup resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
-            self._connector = None
+        """Close the running loop's session and cleanup resources."""
+        entry = self._current()
+        if entry is not None:
+            await entry[0].close()
+            self._sessions.pop(asyncio.get_running_loop(), None)
             logger.info("🔌 Connection pool closed")
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics."""
-        if not self._connector:
+        if not self._sessions and not self._host_metrics:
             return {'status': 'not_initialized'}
-        
+
+        open_connections = 0
+        for _, connector in list(self._sessions.values()):
+            open_connections += sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+
         return {
-            'status': 'active',
-            'limit': self._connector.limit,
-            'limit_per_host': self._connector.limit_per_host,
-            'connections': len(self._connector._conns),
+            'status': 'active' if self._sessions else 'closed',
+            'limit': self._settings["limit"],
+            'limit_per_host': self._settings["limit_per_host"],
+            'keepalive_timeout': self._settings["keepalive_timeout"],
+            'sessions': len(self._sessions),
+            'connections': open_connections,
+            'hosts': {host: metrics.to_dict() for host, metrics in self._host_metrics.items()},
         }
 
 
@@ -141,29 +312,44 @@ _connection_pool = ConnectionPool()
 async def get_connection_pool() -> ConnectionPool:
     """
     Get the global connection pool instance.
-    
-    Initializes the pool if not already done.
+
+    Initializes the pool for the running event loop if not already done.
     """
-    if not _connection_pool._session:
+    if not _connection_pool.initialized:
         await _connection_pool.initialize()
     return _connection_pool
 
 
+@asynccontextmanager
+async def shared_session():
+    """
+    Context manager yielding the shared keep-alive session.
+
+    Drop-in replacement for ``async with aiohttp.ClientSession() as session``;
+    the session is not closed on exit so its connections stay pooled.
+    """
+    pool = await get_connection_pool()
+    yield pool.session
+
+
 @asynccontextmanager
 async def pooled_request(method: str, url: str, **kwargs):
     """
     Context manager for making pooled HTTP requests.
-    
+
+    The response is live inside the block (use it for streaming); the
+    connection returns to the pool on exit.
+
     Args:
         method: HTTP method (GET, POST, etc.)
         url: URL to request
         **kwargs: Additional arguments for the request
-        
+
     Yields:
         Response object
     """
     pool = await get_connection_pool()
-    
+
     async with pool.session.request(method, url, **kwargs) as response:
         yield response
 
@@ -171,59 +357,59 @@ async def pooled_request(method: str, url: str, **kwargs):
 class ToolkitWithPool:
     """
     Example toolkit implementation with connection pooling.
-    
+
     This matches the interface suggested in the diagnosis document.
     """
-    
+
     def __init__(self):
         """Initialize toolkit with connection pool."""
         self._pool_initialized = False
-    
+
     async def _ensure_pool(self):
         """Ensure connection pool is initialized."""
         if not self._pool_initialized:
             pool = await get_connection_pool()
             self._pool_initialized = True
-    
+
     async def fetch_data(self, url: str) -> str:
         """
         Fetch data using the connection pool.
-        
+
         Args:
             url: URL to fetch
-            
+
         Returns:
             Response text
         """
         await self._ensure_pool()
-        
+
         async with pooled_request('GET', url) as response:
             return await response.text()
-    
+
     async def post_data(self, url: str, data: Dict[str, Any]) -> str:
         """
         Post data using the connection pool.
-        
+
         Args:
             url: URL to post to
             data: Data to post
-            
+
         Returns:
             Response text
         """
         await self._ensure_pool()
-        
+
         async with pooled_request('POST', url, json=data) as response:
             return await response.text()
 
 
 # Cleanup function for graceful shutdown
 async def cleanup_connection_pool():
-    """Clean up the global connection pool."""
+    """Clean up the running loop's connection pool session."""
     await _connection_pool.close()
 
 
 # Statistics function for monitoring
 def get_pool_stats() -> Dict[str, Any]:
     """Get connection pool statistics."""
-    return _connection_pool.get_stats()
\ No newline at end of file
+    return _connection_pool.get_stats()
@@ -0,0 +1,197 @@
+"""
+Hedged Requests
+Race redundant data sources instead of trying them one after another
+
+hedged_race() starts the primary source and, if it hasn't produced an
+acceptable result after a hedge delay, starts the next one as well (and so on).
+The first acceptable result wins and every other attempt is cancelled. A
+source that fails or returns an unacceptable result triggers the next one
+immediately, so latency tracks the fastest healthy source instead of the sum of
+all timeouts.
+
+Hedge delays adapt to observed latency: the next source is launched at the
+in-flight source's recent p95 (capped by the configured delay), and right away
+when that source has mostly been failing.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_DELAY = 1.0
+
+# Samples kept per source, and how many are needed before they are trusted
+LATENCY_WINDOW = 50
+MIN_SAMPLES = 5
+
+# Failure rate at which a source is hedged immediately
+UNHEALTHY_FAILURE_RATE = 0.5
+
+
+@dataclass
+class HedgeSource:
+    """One redundant source: how to fetch, how long to wait, what counts as a result"""
+    name: str
+    fetch: Callable[[], Awaitable[Any]]
+    timeout: float
+    accept: Callable[[Any], bool] = bool
+    hedge_delay: Optional[float] = None  # Overrides the race's delay before the *next* source
+
+
+@dataclass
+class HedgeResult:
+    value: Any = None
+    source: Optional[str] = None
+    elapsed: float = 0.0
+    attempts: Dict[str, str] = field(default_factory=dict)  # name -> won/rejected/timeout/error/cancelled
+
+    @property
+    def ok(self) -> bool:
+        return self.source is not None
+
+
+class LatencyTracker:
+    """Sliding window of per-source latencies and outcomes"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Deque[Tuple[float, bool]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, latency: float, ok: bool):
+        with self._lock:
+            samples = self._samples.setdefault(name, deque(maxlen=self.window))
+            samples.append((latency, ok))
+
+    def p95(self, name: str) -> Optional[float]:
+        """95th percentile latency of successful calls, once there are enough of them"""
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self._samples.get(name, ()) if ok)
+        if len(latencies) < MIN_SAMPLES:
+            return None
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    def failure_rate(self, name: str) -> Optional[float]:
+        with self._lock:
+            samples = list(self._samples.get(name, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return sum(1 for _, ok in samples if not ok) / len(samples)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            names = list(self._samples)
+        return {name: {"p95": self.p95(name), "failure_rate": self.failure_rate(name),
+                       "samples": len(self._samples[name])} for name in names}
+
+
+_latency_tracker: Optional[LatencyTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the process-wide latency tracker"""
+    global _latency_tracker
+    if _latency_tracker is None:
+        with _tracker_lock:
+            if _latency_tracker is None:
+                _latency_tracker = LatencyTracker()
+    return _latency_tracker
+
+
+def hedge_delay_for(source: HedgeSource, default: float, tracker: LatencyTracker) -> float:
+    """How long to give an in-flight source before starting the next one"""
+    delay = source.hedge_delay if source.hedge_delay is not None else default
+    failure_rate = tracker.failure_rate(source.name)
+    if failure_rate is not None and failure_rate >= UNHEALTHY_FAILURE_RATE:
+        return 0.0
+    p95 = tracker.p95(source.name)
+    if p95 is not None:
+        delay = min(delay, p95)
+    return delay
+
+
+async def hedged_race(sources: List[HedgeSource], budget: float,
+                      hedge_delay: float = DEFAULT_HEDGE_DELAY,
+                      tracker: Optional[LatencyTracker] = None) -> HedgeResult:
+    """
+    Race sources in priority order with hedging.
+
+    Args:
+        sources: Sources in priority order
+        budget: Overall deadline in seconds; anything still running is cancelled
+        hedge_delay: Default delay before launching the next source
+        tracker: Latency tracker (defaults to the process-wide one)
+
+    Returns:
+        HedgeResult with the winning value and source, or source=None if no
+        source produced an acceptable result within the budget
+    """
+    tracker = tracker or get_latency_tracker()
+    result = HedgeResult()
+    start = time.monotonic()
+    deadline = start + budget
+    running: Dict[asyncio.Task, HedgeSource] = {}
+    queue = list(sources)
+    next_launch = start
+
+    async def attempt(source: HedgeSource):
+        began = time.monotonic()
+        try:
+            value = await asyncio.wait_for(source.fetch(), source.timeout)
+        except Exception:
+            tracker.record(source.name, time.monotonic() - began, False)
+            raise
+        # An unacceptable answer counts against the source's health too
+        tracker.record(source.name, time.monotonic() - began, bool(source.accept(value)))
+        return value
+
+    try:
+        while queue or running:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if queue and (now >= next_launch or not running):
+                source = queue.pop(0)
+                logger.debug(f"🏁 Hedge: starting {source.name} at {now - start:.2f}s")
+                running[asyncio.create_task(attempt(source))] = source
+                next_launch = now + hedge_delay_for(source, hedge_delay, tracker)
+                continue
+
+            wake = deadline if not queue else min(deadline, next_launch)
+            done, _ = await asyncio.wait(running, timeout=max(0.0, wake - now),
+                                         return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source = running.pop(task)
+                try:
+                    value = task.result()
+                except asyncio.TimeoutError:
+                    result.attempts[source.name] = "timeout"
+                    logger.debug(f"⏰ Hedge: {source.name} timed out after {source.timeout:.1f}s")
+                except Exception as e:
+                    result.attempts[source.name] = "error"
+                    logger.debug(f"❌ Hedge: {source.name} error: {e}")
+                else:
+                    if source.accept(value):
+                        result.value, result.source = value, source.name
+                        result.attempts[source.name] = "won"
+                        return result
+                    result.attempts[source.name] = "rejected"
+                # A source came back empty-handed: don't wait to hedge
+                next_launch = time.monotonic()
+    finally:
+        for task, source in running.items():
+            task.cancel()
+            result.attempts.setdefault(source.name, "cancelled")
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        result.elapsed = time.monotonic() - start
+        if result.ok:
+            logger.info(f"🏁 Hedge winner: {result.source} in {result.elapsed:.2f}s ({result.attempts})")
+    return result
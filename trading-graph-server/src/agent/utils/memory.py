@@ -2,18 +2,35 @@
 
 import os
 import openai
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
+from .vector_memory import EmbeddingFunction, VectorMemoryStore, make_embedder
+
 logger = logging.getLogger(__name__)
 
+# Characters kept from each analyst report when a situation is stored
+MAX_SITUATION_REPORT_CHARS = 1500
+
+
+def situation_from_reports(*reports: Optional[str], max_chars: int = MAX_SITUATION_REPORT_CHARS) -> str:
+    """Bounded situation to store: the opening of each analyst report"""
+    return "\n\n".join((report or "")[:max_chars] for report in reports)
+
+
+def memory_root(config: Dict[str, Any]) -> str:
+    """Directory holding the persistent situation memories"""
+    return config.get("memory_dir") or os.path.join(config.get("data_cache_dir", "./dataflows/data_cache"), "memory")
+
+
 class FinancialSituationMemory:
-    """Simplified memory for financial situation tracking"""
+    """Situation memory backed by a persistent vector store (see vector_memory)"""
 
-    def __init__(self, memory_type: str, config: Dict[str, Any]):
+    def __init__(self, memory_type: str, config: Dict[str, Any], embedder: Optional[EmbeddingFunction] = None):
         self.memory_type = memory_type
         self.config = config
         self.messages: List[str] = []
+        self.store = VectorMemoryStore.open(memory_root(config), memory_type, embedder or make_embedder(config))
 
     def add_message(self, message: str):
         """Add a message to memory"""
@@ -26,21 +43,35 @@ class FinancialSituationMemory:
 
     def get_memory_text(self, situation: str) -> str:
         """Get simplified memory text"""
-        if not self.messages:
+        memories = self.get_memories(situation)
+        if not memories:
             return "No prior context available."
-        
-        recent_messages = self.get_messages()
-        return f"Recent context:\n" + "\n".join(recent_messages)
+        return f"Relevant past context:\n" + "\n".join(m["recommendation"] for m in memories)
+
+    def add_situations(self, situations_and_advice: List[Tuple[str, str]]):
+        """Add (situation, recommendation) pairs; new situations are embedded in one batch"""
+        self.store.add(situations_and_advice)
 
     def get_memories(self, situation: str, n_matches: int = 2) -> list:
-        """Get memories (simplified compatibility method)"""
-        messages = self.get_messages()
-        # Return mock recommendations to maintain compatibility
-        return [{"recommendation": msg} for msg in messages[:n_matches]]
+        """Most similar past situations and their recommendations"""
+        matches = self.store.search(situation, n_matches)
+        if not matches:
+            # Nothing persisted yet: fall back to this session's messages
+            return [{"recommendation": msg} for msg in self.get_messages()[:n_matches]]
+        return [
+            {
+                "matched_situation": record["situation"],
+                "recommendation": record["recommendation"],
+                "similarity_score": score,
+            }
+            for record, score in matches
+        ]
 
-    def save_memory(self, memory_text: str):
-        """Save memory (simplified)"""
+    def save_memory(self, memory_text: str, situation: Optional[str] = None):
+        """Save memory, keyed by the situation it was produced for (or its own text)"""
         self.add_message(memory_text)
+        if memory_text and memory_text.strip():
+            self.store.add([(situation or memory_text.strip(), memory_text.strip())])
 
 def get_embedding(text: str, client=None) -> List[float]:
     """Get embedding with token limit protection"""
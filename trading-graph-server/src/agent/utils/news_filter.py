@@ -7,11 +7,25 @@ Following KISS principle - minimal complexity, maximum benefit.
 import json
 import re
 import logging
+from typing import Any, Dict, Optional
+
+from .structured_reports import compact_json, slice_articles
 
 logger = logging.getLogger(__name__)
 
+_JSON_BLOCK = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
+
+def _news_data_from_report(news_report: str) -> Optional[Dict[str, Any]]:
+    """Legacy path: parse the ```json block out of a rendered report"""
+    json_match = _JSON_BLOCK.search(news_report or "")
+    if not json_match:
+        return None
+    return json.loads(json_match.group(1))
 
-def filter_news_for_llm(news_report: str, max_articles: int = 15) -> str:
+
+def filter_news_for_llm(news_report: str, max_articles: int = 15,
+                        news_data: Optional[Dict[str, Any]] = None) -> str:
     """
     Simple filter: Take top N articles from news report.
     
@@ -21,32 +35,35 @@ def filter_news_for_llm(news_report: str, max_articles: int = 15) -> str:
     Args:
         news_report: Raw news report from news analyst
         max_articles: Maximum number of articles to include (default 15)
+        news_data: Structured news payload (state["structured_reports"]["news"]);
+            when given, the report text is not parsed at all
     
     Returns:
         Filtered news report with top N articles
     """
     try:
-        # Extract JSON from report
-        json_match = re.search(r'```json\n(.*?)\n```', news_report, re.DOTALL)
-        if not json_match:
-            logger.debug("No JSON found in news report, returning as-is")
-            return news_report
-        
-        news_data = json.loads(json_match.group(1))
+        if news_data is None:
+            news_data = _news_data_from_report(news_report)
+            if news_data is None:
+                logger.debug("No JSON found in news report, returning as-is")
+                return news_report
         
         # Simply take first N articles (already ordered by relevance)
-        articles = news_data.get('articles', [])
-        original_count = len(articles)
-        filtered_articles = articles[:max_articles]
+        original_count = news_data.get('original_count') or len(news_data.get('articles') or [])
+        filtered_articles = slice_articles(news_data, max_articles)
         
         # Log the reduction
         reduction = 1 - (len(filtered_articles) / max(1, original_count))
         logger.info(f"📰 News filtering: {original_count} → {len(filtered_articles)} articles ({reduction:.1%} reduction)")
         
-        # Rebuild report with filtered articles
-        news_data['articles'] = filtered_articles
-        news_data['filtered'] = True
-        news_data['original_count'] = original_count
+        # Rebuild report with filtered articles (copy, the payload may be shared state)
+        filtered_data = {
+            **news_data,
+            'articles': filtered_articles,
+            'total': len(filtered_articles),
+            'filtered': True,
+            'original_count': original_count
+        }
         
         # Recreate report structure
         filtered_report = f"""NEWS DATA COLLECTION - {news_data.get('company', 'UNKNOWN')}
@@ -59,7 +76,7 @@ COLLECTION METRICS:
 
 STRUCTURED DATA:
 ```json
-{json.dumps(news_data, indent=2)}
+{compact_json(filtered_data)}
 ```
 """
         return filtered_report
@@ -69,7 +86,8 @@ STRUCTURED DATA:
         return news_report
 
 
-def extract_headlines_and_snippets(news_report: str, max_articles: int = 20) -> str:
+def extract_headlines_and_snippets(news_report: str, max_articles: int = 20,
+                                   news_data: Optional[Dict[str, Any]] = None) -> str:
     """
     Extract only headlines and short snippets for ultra-light analysis.
     
@@ -79,30 +97,28 @@ def extract_headlines_and_snippets(news_report: str, max_articles: int = 20) ->
     Args:
         news_report: Raw news report from news analyst
         max_articles: Maximum number of articles to include (default 20)
+        news_data: Structured news payload; skips parsing the report text
     
     Returns:
         Summary report with headlines and snippets only
     """
     try:
-        # Extract JSON from report
-        json_match = re.search(r'```json\n(.*?)\n```', news_report, re.DOTALL)
-        if not json_match:
-            logger.debug("No JSON found in news report, returning as-is")
-            return news_report
-        
-        news_data = json.loads(json_match.group(1))
+        if news_data is None:
+            news_data = _news_data_from_report(news_report)
+            if news_data is None:
+                logger.debug("No JSON found in news report, returning as-is")
+                return news_report
         
         # Create lightweight version
-        articles = news_data.get('articles', [])
-        original_count = len(articles)
+        original_count = news_data.get('original_count') or len(news_data.get('articles') or [])
         lightweight = []
         
-        for article in articles[:max_articles]:
+        for article in slice_articles(news_data, max_articles):
             lightweight.append({
                 'title': article.get('title', ''),
                 'source': article.get('source', ''),
-                'date': article.get('publishedDate', ''),
-                'snippet': article.get('snippet', '')[:200]  # First 200 chars
+                'date': article.get('publishedDate') or article.get('date', ''),
+                'snippet': (article.get('snippet') or article.get('full_content') or '')[:200]  # First 200 chars
             })
         
         # Log the reduction
@@ -130,7 +146,8 @@ TOP HEADLINES ({len(lightweight)} articles from {original_count} total):
 
 
 # Optional: Auto-select based on token budget
-def optimize_news_for_token_budget(news_report: str, token_budget: int = 5000) -> str:
+def optimize_news_for_token_budget(news_report: str, token_budget: int = 5000,
+                                   news_data: Optional[Dict[str, Any]] = None) -> str:
     """
     Automatically choose optimization strategy based on token budget.
     
@@ -142,6 +159,7 @@ def optimize_news_for_token_budget(news_report: str, token_budget: int = 5000) -
     Args:
         news_report: Raw news report
         token_budget: Available token budget
+        news_data: Structured news payload, passed through to the filters
     
     Returns:
         Optimized news report
@@ -155,10 +173,10 @@ def optimize_news_for_token_budget(news_report: str, token_budget: int = 5000) -
     
     if token_budget < 3000:
         logger.info(f"⚡ Using headlines mode for tight budget ({token_budget} tokens)")
-        return extract_headlines_and_snippets(news_report, max_articles=15)
+        return extract_headlines_and_snippets(news_report, max_articles=15, news_data=news_data)
     elif token_budget < 8000:
         logger.info(f"📊 Using filtered mode for medium budget ({token_budget} tokens)")
-        return filter_news_for_llm(news_report, max_articles=10)
+        return filter_news_for_llm(news_report, max_articles=10, news_data=news_data)
     else:
         logger.info(f"📰 Using standard filter for normal budget ({token_budget} tokens)")
-        return filter_news_for_llm(news_report, max_articles=15)
\ No newline at end of file
+        return filter_news_for_llm(news_report, max_articles=15, news_data=news_data)
\ No newline at end of file
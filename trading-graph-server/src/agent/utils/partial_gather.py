@@ -0,0 +1,125 @@
+"""
+Partial-Result Gather
+Fan out to independent sources and keep whatever finishes in time
+
+gather_partial() is an as_completed-style alternative to
+wait_for(gather(...), timeout): every source runs concurrently under its own
+deadline, results are collected (and optionally handed to a callback) as they
+arrive, and when the global budget runs out only the stragglers are cancelled;
+completed results are kept. A quorum rule can end the wait early once k
+accepted results agree, so the stage doesn't wait on slow upstreams whose
+answer would not change the outcome.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _has_value(value: Any) -> bool:
+    return value is not None
+
+
+@dataclass
+class GatherSource:
+    """One independent source with its own deadline and acceptance test"""
+    name: str
+    fetch: Callable[[], Awaitable[Any]]
+    deadline: Optional[float] = None  # Seconds; None = the global budget
+    accept: Callable[[Any], bool] = _has_value
+
+
+@dataclass
+class GatherResult:
+    results: Dict[str, Any] = field(default_factory=dict)  # Accepted, in completion order
+    rejected: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)  # Missed their own deadline
+    cancelled: List[str] = field(default_factory=list)  # Still running at budget/quorum
+    source_times: Dict[str, float] = field(default_factory=dict)
+    elapsed: float = 0.0
+    quorum_met: bool = False  # Ended early because the quorum agreed
+
+
+async def gather_partial(sources: List[GatherSource], budget: float,
+                         quorum: Optional[int] = None,
+                         agree: Optional[Callable[[List[Any]], bool]] = None,
+                         on_result: Optional[Callable[[str, Any], None]] = None) -> GatherResult:
+    """
+    Run sources concurrently, keeping every result that arrives in time.
+
+    Args:
+        sources: Sources to query
+        budget: Global deadline in seconds; sources still running are cancelled
+        quorum: Stop early once this many sources have been accepted ...
+        agree: ... and this predicate holds for the accepted values (default: always)
+        on_result: Called with (name, value) for each accepted result as it arrives
+
+    Returns:
+        GatherResult with accepted results and what happened to the rest
+    """
+    result = GatherResult()
+    start = time.monotonic()
+    by_name = {source.name: source for source in sources}
+
+    async def run(source: GatherSource):
+        began = time.monotonic()
+        try:
+            return await asyncio.wait_for(source.fetch(), source.deadline or budget)
+        finally:
+            result.source_times[source.name] = time.monotonic() - began
+
+    tasks = {asyncio.create_task(run(source)): source.name for source in sources}
+    pending = set(tasks)
+
+    def collect(task: asyncio.Task):
+        name = tasks[task]
+        try:
+            value = task.result()
+        except asyncio.TimeoutError:
+            result.timed_out.append(name)
+            logger.warning(f"⏰ {name} missed its {by_name[name].deadline or budget:.1f}s deadline")
+            return
+        except Exception as e:
+            result.errors[name] = str(e)
+            logger.warning(f"❌ {name} failed: {e}")
+            return
+        if not by_name[name].accept(value):
+            result.rejected.append(name)
+            return
+        result.results[name] = value
+        if on_result is not None:
+            on_result(name, value)
+
+    try:
+        while pending:
+            remaining = budget - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                collect(task)
+
+            if quorum and pending and len(result.results) >= quorum:
+                if agree is None or agree(list(result.results.values())):
+                    result.quorum_met = True
+                    logger.info(f"🤝 Quorum of {len(result.results)}/{len(sources)} reached "
+                                f"after {time.monotonic() - start:.2f}s")
+                    break
+    finally:
+        # Sources that finished after the last wait still count; only the rest are cancelled
+        finished = [task for task in tasks if task in pending and task.done()]
+        for task in finished:
+            collect(task)
+        pending.difference_update(finished)
+        for task in pending:
+            task.cancel()
+            result.cancelled.append(tasks[task])
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        result.elapsed = time.monotonic() - start
+    return result
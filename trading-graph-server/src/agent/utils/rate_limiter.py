@@ -0,0 +1,98 @@
+"""Token bucket rate limiter for outbound API calls."""
+
+import asyncio
+import threading
+import time
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket that lets up to `capacity` calls through at once and then
+    refills at `rate` tokens per second.
+
+    Each acquire() reserves its slot synchronously and then sleeps until the
+    slot is due, so concurrent callers are released in arrival order without
+    an asyncio lock and the bucket can be shared across event loops.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, name: str = "TokenBucket"):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+            name: Name for logging
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens (possibly going into debt) and return the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            self.acquired += 1
+            wait = max(0.0, -self._tokens / self.rate)
+            if wait > 0:
+                self.delayed += 1
+                self.total_wait += wait
+            return wait
+
+    def _refund(self, tokens: float) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+            self.acquired -= 1
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until `tokens` are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # A cancelled caller gives its slot back to the next one
+                self._refund(tokens)
+                raise
+        return wait
+
+    def acquire_sync(self, tokens: float = 1.0) -> float:
+        """Blocking variant of acquire() for threaded callers."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics."""
+        return {
+            'name': self.name,
+            'rate': self.rate,
+            'capacity': self.capacity,
+            'acquired': self.acquired,
+            'delayed': self.delayed,
+            'total_wait': self.total_wait,
+        }
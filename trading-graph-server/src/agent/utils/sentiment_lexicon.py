@@ -0,0 +1,147 @@
+"""
+Sentiment Lexicon
+Compiled keyword sentiment shared by the social and news dataflows
+
+A lexicon compiles all of its bullish and bearish terms into one alternation
+regex with word boundaries, so each text is scanned once for every term
+(instead of one str.count() per word) and "up" no longer matches inside
+"support". Terms ending in "*" are stems and match any continuation
+("disappoint*" -> "disappointing"); multi-word phrases match as one hit.
+score_batch() scores many texts in one call and returns per-text counts plus
+the (optionally weighted) aggregate.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence
+
+
+@dataclass
+class LexiconCounts:
+    """Bullish and bearish hits for one text (or a weighted aggregate)"""
+    positive: float = 0.0
+    negative: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.positive + self.negative
+
+    def score(self, shrink_below: float = 0) -> float:
+        """
+        Score from 0 (bearish) to 1 (bullish), 0.5 without any hits.
+        With fewer than `shrink_below` hits the score is compressed toward neutral.
+        """
+        if self.total == 0:
+            return 0.5
+        sentiment_score = self.positive / self.total
+        if self.total < shrink_below:
+            sentiment_score = 0.4 + (sentiment_score * 0.2)
+        return sentiment_score
+
+    def label(self) -> str:
+        if self.positive > self.negative:
+            return "positive"
+        if self.negative > self.positive:
+            return "negative"
+        return "neutral"
+
+
+@dataclass
+class LexiconBatch:
+    texts: List[LexiconCounts] = field(default_factory=list)
+    total: LexiconCounts = field(default_factory=LexiconCounts)
+
+
+def _term_pattern(term: str) -> str:
+    term = term.lower().strip()
+    if term.endswith("*"):
+        return re.escape(term[:-1]) + r"\w*"
+    return r"\s+".join(re.escape(word) for word in term.split())
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    # Longest first, so phrases win over the words inside them
+    patterns = {_term_pattern(term) for term in terms if term.strip()}
+    return "|".join(sorted(patterns, key=len, reverse=True))
+
+
+class SentimentLexicon:
+    """Bullish/bearish term lists compiled into a single-pass matcher"""
+
+    def __init__(self, positive: Iterable[str], negative: Iterable[str], name: str = "lexicon"):
+        positive, negative = set(positive), set(negative)
+        overlap = positive & negative
+        self.positive = positive - overlap
+        self.negative = negative - overlap
+        self.name = name
+        self._pattern = re.compile(
+            r"(?<!\w)(?:(" + _alternation(self.positive) + r")|(" + _alternation(self.negative) + r"))(?!\w)"
+        )
+
+    def count(self, text: str) -> LexiconCounts:
+        """Bullish and bearish hits in one text"""
+        counts = LexiconCounts()
+        if not text:
+            return counts
+        for positive, _ in self._pattern.findall(text.lower()):
+            if positive:
+                counts.positive += 1
+            else:
+                counts.negative += 1
+        return counts
+
+    def score_batch(self, texts: Sequence[str], weights: Optional[Sequence[float]] = None) -> LexiconBatch:
+        """
+        Count hits for every text, and their aggregate.
+
+        Args:
+            texts: Texts to score
+            weights: Optional per-text weights (e.g. engagement) for the aggregate
+
+        Returns:
+            LexiconBatch with per-text counts and the weighted total
+        """
+        batch = LexiconBatch()
+        for i, text in enumerate(texts):
+            counts = self.count(text)
+            weight = weights[i] if weights is not None else 1
+            batch.texts.append(counts)
+            batch.total.positive += counts.positive * weight
+            batch.total.negative += counts.negative * weight
+        return batch
+
+    def score(self, text: str, shrink_below: float = 0) -> float:
+        return self.count(text).score(shrink_below)
+
+
+# Retail/social chatter: tweets, posts, search snippets
+SOCIAL_LEXICON = SentimentLexicon(
+    positive=[
+        "buy", "buying", "moon", "to the moon", "bull", "bullish", "long", "calls", "rocket", "green",
+        "pump", "breakout", "rally", "surge", "gain*", "profit*", "up", "rise", "rising",
+        "growth", "strong", "hodl", "diamond", "hands", "positive", "optimistic", "confident",
+        "accumulate", "🚀", "📈",
+    ],
+    negative=[
+        "sell", "selling", "crash", "bear", "bearish", "short", "puts", "dump", "red",
+        "drop", "fall", "falling", "decline", "loss", "losses", "down", "weak", "panic", "fear",
+        "collapse", "tank", "plummet", "correction", "bubble", "negative", "pessimistic",
+        "exit", "avoid", "📉", "⬇️",
+    ],
+    name="social",
+)
+
+# Headlines and article summaries
+NEWS_LEXICON = SentimentLexicon(
+    positive=[
+        "growth", "profit*", "revenue", "success*", "launch*", "expansion",
+        "partnership*", "deal", "deals", "approval", "approved", "breakthrough", "strong",
+        "gain*", "beat", "beats", "exceed*", "outperform*", "upgrade*", "buy",
+    ],
+    negative=[
+        "loss", "losses", "decline*", "fall", "falls", "drop", "drops", "concern*", "warning*",
+        "lawsuit*", "investigation*", "recall*", "failure*", "weak*",
+        "miss", "misses", "missed", "disappoint*", "downgrade*", "sell", "risk*", "issue*",
+    ],
+    name="news",
+)
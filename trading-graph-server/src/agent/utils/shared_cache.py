@@ -0,0 +1,300 @@
+"""
+Shared Result Cache Tier
+Out-of-process second tier behind the in-process tool caches
+
+Tool results are stored under one key schema, serialized as JSON and
+zlib-compressed, in a backend that every worker process can reach:
+- sqlite: a local WAL-mode SQLite file (no network, safe for many processes)
+- redis: any Redis-protocol server (needs the optional `redis` package)
+
+Configured through environment variables:
+    TOOL_CACHE_BACKEND   none | sqlite | redis   (default: none)
+    TOOL_CACHE_PATH      SQLite file (default: <data_cache_dir>/tool_cache.sqlite3)
+    TOOL_CACHE_URL       Redis URL (default: redis://localhost:6379/0)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the serialized format or key layout changes
+KEY_VERSION = "v1"
+KEY_PREFIX = "tradingagents:tool"
+
+# Payloads smaller than this are stored uncompressed
+COMPRESS_MIN_BYTES = 512
+
+_MISSING = object()
+
+
+def make_cache_key(tool_name: str, args: Any) -> str:
+    """
+    Build the cache key shared by every cache tier and process.
+
+    Args:
+        tool_name: Name of the tool
+        args: Tool arguments (any JSON-serializable structure)
+
+    Returns:
+        Key of the form "tradingagents:tool:v1:<tool_name>:<sha256 of args>"
+    """
+    arg_str = json.dumps(args, sort_keys=True, default=str)
+    digest = hashlib.sha256(arg_str.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{KEY_VERSION}:{tool_name}:{digest}"
+
+
+def serialize_value(value: Any) -> Optional[bytes]:
+    """
+    Serialize a tool result for the shared tier.
+
+    Returns:
+        Encoded bytes, or None if the value is not JSON-serializable
+    """
+    try:
+        raw = json.dumps(value, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        return None
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def deserialize_value(data: bytes) -> Any:
+    """Inverse of serialize_value()"""
+    marker, payload = data[:1], data[1:]
+    if marker == b"z":
+        payload = zlib.decompress(payload)
+    return json.loads(payload)
+
+
+class SharedCacheBackend:
+    """Interface of a shared cache backend storing encoded bytes with a TTL"""
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class SQLiteCacheBackend(SharedCacheBackend):
+    """Shared cache in a local SQLite file, usable by many worker processes"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tool_cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS tool_cache_expiry ON tool_cache (expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._connection().execute(
+            "SELECT value FROM tool_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO tool_cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, sqlite3.Binary(value), time.time() + ttl),
+        )
+        self._writes += 1
+        # Purge expired rows now and then instead of on every write
+        if self._writes % 100 == 0:
+            conn.execute("DELETE FROM tool_cache WHERE expires_at <= ?", (time.time(),))
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM tool_cache")
+
+
+class RedisCacheBackend(SharedCacheBackend):
+    """Shared cache on a Redis-protocol server"""
+
+    name = "redis"
+
+    def __init__(self, url: str):
+        import redis  # Optional dependency
+
+        self.url = url
+        self._client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._client.setex(key, ttl, value)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=f"{KEY_PREFIX}:*"):
+            self._client.delete(key)
+
+
+class SharedResultCache:
+    """
+    Encodes tool results into a SharedCacheBackend.
+
+    Backend errors are logged and treated as misses so an unreachable cache
+    never fails a tool call.
+    """
+
+    def __init__(self, backend: SharedCacheBackend):
+        self.backend = backend
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "skipped": 0, "errors": 0}
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or the module sentinel _MISSING"""
+        try:
+            data = self.backend.get(key)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ Shared cache read failed ({self.backend.name}): {e}")
+            return _MISSING
+        if data is None:
+            self._stats["misses"] += 1
+            return _MISSING
+        try:
+            value = deserialize_value(bytes(data))
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ Shared cache entry unreadable, ignoring: {e}")
+            return _MISSING
+        self._stats["hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> bool:
+        """Store a value; returns False if it can't be serialized or stored"""
+        data = serialize_value(value)
+        if data is None:
+            self._stats["skipped"] += 1
+            return False
+        try:
+            self.backend.set(key, data, int(ttl))
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"⚠️ Shared cache write failed ({self.backend.name}): {e}")
+            return False
+        self._stats["writes"] += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache delete failed ({self.backend.name}): {e}")
+
+    def clear(self) -> None:
+        try:
+            self.backend.clear()
+        except Exception as e:
+            logger.warning(f"⚠️ Shared cache clear failed ({self.backend.name}): {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend.name, **self._stats}
+
+
+def is_missing(value: Any) -> bool:
+    """True if a SharedResultCache.get() result is a miss"""
+    return value is _MISSING
+
+
+def _default_sqlite_path() -> str:
+    try:
+        from ..config import get_config
+        cache_dir = get_config().get("data_cache_dir")
+    except Exception:
+        cache_dir = None
+    return os.path.join(cache_dir or os.path.join(os.getcwd(), ".cache"), "tool_cache.sqlite3")
+
+
+def create_shared_cache(backend: Optional[str] = None) -> Optional[SharedResultCache]:
+    """
+    Create a shared cache from explicit settings or the environment.
+
+    Args:
+        backend: "sqlite", "redis" or "none" (defaults to TOOL_CACHE_BACKEND)
+
+    Returns:
+        SharedResultCache, or None if disabled or unavailable
+    """
+    backend = (backend or os.getenv("TOOL_CACHE_BACKEND", "none")).lower()
+    try:
+        if backend == "sqlite":
+            path = os.getenv("TOOL_CACHE_PATH") or _default_sqlite_path()
+            cache = SharedResultCache(SQLiteCacheBackend(path))
+            logger.info(f"🗄️ Shared tool cache: sqlite at {path}")
+            return cache
+        if backend == "redis":
+            url = os.getenv("TOOL_CACHE_URL", "redis://localhost:6379/0")
+            cache = SharedResultCache(RedisCacheBackend(url))
+            logger.info(f"🗄️ Shared tool cache: redis at {url}")
+            return cache
+    except ImportError:
+        logger.warning("⚠️ redis package not installed - shared tool cache disabled")
+    except Exception as e:
+        logger.error(f"❌ Shared tool cache unavailable ({backend}): {e}")
+    return None
+
+
+# Global shared cache instance
+_shared_cache: Optional[SharedResultCache] = None
+_shared_cache_initialized = False
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> Optional[SharedResultCache]:
+    """Get the process-wide shared cache tier (None when disabled)"""
+    global _shared_cache, _shared_cache_initialized
+    if not _shared_cache_initialized:
+        with _shared_cache_lock:
+            if not _shared_cache_initialized:
+                _shared_cache = create_shared_cache()
+                _shared_cache_initialized = True
+    return _shared_cache
+
+
+def set_shared_cache(cache: Optional[SharedResultCache]) -> None:
+    """Replace the process-wide shared cache tier (e.g. in tests)"""
+    global _shared_cache, _shared_cache_initialized
+    with _shared_cache_lock:
+        _shared_cache = cache
+        _shared_cache_initialized = True
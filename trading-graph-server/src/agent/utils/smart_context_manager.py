@@ -8,12 +8,63 @@ Target: 74% reduction in parallel_risk_debators tokens (93,737 → 20,000)
 import logging
 import re
 import hashlib
-import json
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
+from .structured_reports import get_structured_report, select_indicators, select_metrics
+
 logger = logging.getLogger(__name__)
 
+# Bounds for the LRU caches (debator contexts and per-report extractions)
+DEFAULT_MAX_CONTEXTS = 256
+DEFAULT_MAX_EXTRACTIONS = 1024
+
+# Names read from the structured market and fundamentals payloads
+TREND_INDICATORS = ["rsi_14", "sma_20", "sma_50", "sma_200"]
+GROWTH_METRICS = ["revenueGrowthTTMYoy", "epsGrowthTTMYoy", "roeTTM", "netProfitMarginTTM",
+                  "grossMarginTTM", "marketCapitalization", "change_percent_24h", "volume_24h"]
+RISK_METRICS = ["totalDebt/totalEquityQuarterly", "currentRatioQuarterly", "quickRatioQuarterly",
+                "beta", "52WeekLow", "low_24h"]
+VALUATION_METRICS = ["peBasicExclExtraTTM", "pbQuarterly", "psTTM", "dividendYieldIndicatedAnnual",
+                     "marketCapitalization", "current_price", "circulating_supply"]
+
+
+def _text_digest(text: Any) -> str:
+    """Full-content digest of a report"""
+    data = text if isinstance(text, str) else repr(text)
+    return hashlib.sha256(data.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def _memoized_extraction(method):
+    """
+    Memoize a per-report extraction on (method, report digest, extra args).
+
+    The three debators and repeated debate rounds see the same reports, so
+    each report is parsed once per extraction instead of once per call.
+    """
+    @wraps(method)
+    def wrapper(self, text, *args):
+        key = (method.__name__, _text_digest(text), args)
+        with self._lock:
+            if key in self._extraction_cache:
+                self._extraction_cache.move_to_end(key)
+                self._stats["extraction_hits"] += 1
+                return self._extraction_cache[key]
+            self._stats["extraction_misses"] += 1
+        
+        result = method(self, text, *args)
+        
+        with self._lock:
+            self._extraction_cache[key] = result
+            while len(self._extraction_cache) > self.max_extractions:
+                self._extraction_cache.popitem(last=False)
+                self._stats["extraction_evictions"] += 1
+        return result
+    return wrapper
+
 @dataclass
 class ContextView:
     """Optimized context for a specific component"""
@@ -32,10 +83,33 @@ class SmartContextManager:
     - Automatic compression and caching
     - Token budget enforcement
     - Quality preservation through perspective-aware filtering
+    
+    Both caches are bounded LRUs keyed by full content digests, so memory
+    stays flat over long uptimes and reports that share a header never
+    collide.
     """
     
-    def __init__(self):
-        self.context_cache = {}
+    def __init__(self,
+                 max_contexts: int = DEFAULT_MAX_CONTEXTS,
+                 max_extractions: int = DEFAULT_MAX_EXTRACTIONS):
+        """
+        Args:
+            max_contexts: Maximum debator contexts kept (LRU eviction)
+            max_extractions: Maximum memoized per-report extractions kept
+        """
+        self.max_contexts = max_contexts
+        self.max_extractions = max_extractions
+        self.context_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._extraction_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "extraction_hits": 0,
+            "extraction_misses": 0,
+            "extraction_evictions": 0
+        }
         self.extraction_rules = self._setup_extraction_rules()
         self.token_budgets = {
             "aggressive_debator": 6000,      # Growth-focused context
@@ -89,9 +163,14 @@ class SmartContextManager:
         cache_key = self._generate_cache_key(debator_type, full_context)
         
         # Return cached if available
-        if cache_key in self.context_cache:
-            logger.info(f"✅ Cache hit for {debator_type} debator")
-            return self.context_cache[cache_key]
+        with self._lock:
+            cached = self.context_cache.get(cache_key)
+            if cached is not None:
+                self.context_cache.move_to_end(cache_key)
+                self._stats["hits"] += 1
+                logger.info(f"✅ Cache hit for {debator_type} debator")
+                return cached
+            self._stats["misses"] += 1
         
         # Extract relevant context based on debator type
         if debator_type == "aggressive":
@@ -107,8 +186,13 @@ class SmartContextManager:
         # Enforce token budget
         context = self._enforce_token_budget(context, f"{debator_type}_debator")
         
-        # Cache the result
-        self.context_cache[cache_key] = context
+        # Cache the result, evicting least recently used contexts
+        with self._lock:
+            self.context_cache[cache_key] = context
+            self.context_cache.move_to_end(cache_key)
+            while len(self.context_cache) > self.max_contexts:
+                self.context_cache.popitem(last=False)
+                self._stats["evictions"] += 1
         
         # Log optimization metrics
         self._log_optimization_metrics(debator_type, full_context, context)
@@ -126,27 +210,34 @@ class SmartContextManager:
             sections.append(f"GROWTH OPPORTUNITIES:\n{growth_focus}")
         
         # Market signals - bullish indicators only
-        if "market_report" in full_context:
-            market = full_context["market_report"]
-            bullish_signals = self._extract_bullish_signals(market)
+        bullish_signals = self._indicator_signals(full_context, bullish=True)
+        if bullish_signals is None and "market_report" in full_context:
+            bullish_signals = self._extract_bullish_signals(full_context["market_report"])
+        if bullish_signals is not None:
             sections.append(f"BULLISH MARKET SIGNALS:\n{bullish_signals}")
         
         # Positive news catalysts
-        if "news_report" in full_context:
+        articles = self._news_articles(full_context)
+        if articles is not None:
+            positive_news = self._headlines_with_sentiment(articles, "POSITIVE") or "No significant positive catalysts"
+            sections.append(f"POSITIVE CATALYSTS:\n{positive_news}")
+        elif "news_report" in full_context:
             news = full_context["news_report"]
             positive_news = self._extract_positive_headlines(news)
             sections.append(f"POSITIVE CATALYSTS:\n{positive_news}")
         
         # Growth fundamentals
-        if "fundamentals_report" in full_context:
-            fundamentals = full_context["fundamentals_report"]
-            growth_metrics = self._extract_growth_metrics(fundamentals)
+        growth_metrics = self._metrics_line(full_context, GROWTH_METRICS)
+        if growth_metrics is None and "fundamentals_report" in full_context:
+            growth_metrics = self._extract_growth_metrics(full_context["fundamentals_report"])
+        if growth_metrics is not None:
             sections.append(f"GROWTH FUNDAMENTALS:\n{growth_metrics}")
         
         # Social sentiment - bullish only
-        if "sentiment_report" in full_context:
-            sentiment = full_context["sentiment_report"]
-            bullish_sentiment = self._extract_bullish_sentiment(sentiment)
+        bullish_sentiment = self._sentiment_scores(full_context)
+        if bullish_sentiment is None and "sentiment_report" in full_context:
+            bullish_sentiment = self._extract_bullish_sentiment(full_context["sentiment_report"])
+        if bullish_sentiment is not None:
             sections.append(f"BULLISH SENTIMENT:\n{bullish_sentiment}")
         
         return "\n\n".join(sections)
@@ -162,27 +253,34 @@ class SmartContextManager:
             sections.append(f"RISK CONSIDERATIONS:\n{risk_focus}")
         
         # Market risks and warning signals
-        if "market_report" in full_context:
-            market = full_context["market_report"]
-            risk_signals = self._extract_risk_signals(market)
+        risk_signals = self._indicator_signals(full_context, bullish=False)
+        if risk_signals is None and "market_report" in full_context:
+            risk_signals = self._extract_risk_signals(full_context["market_report"])
+        if risk_signals is not None:
             sections.append(f"MARKET RISK INDICATORS:\n{risk_signals}")
         
         # Negative news and concerns
-        if "news_report" in full_context:
+        articles = self._news_articles(full_context)
+        if articles is not None:
+            negative_news = self._headlines_with_sentiment(articles, "NEGATIVE") or "No significant risk catalysts"
+            sections.append(f"RISK CATALYSTS:\n{negative_news}")
+        elif "news_report" in full_context:
             news = full_context["news_report"]
             negative_news = self._extract_negative_headlines(news)
             sections.append(f"RISK CATALYSTS:\n{negative_news}")
         
         # Risk fundamentals
-        if "fundamentals_report" in full_context:
-            fundamentals = full_context["fundamentals_report"]
-            risk_metrics = self._extract_risk_metrics(fundamentals)
+        risk_metrics = self._metrics_line(full_context, RISK_METRICS)
+        if risk_metrics is None and "fundamentals_report" in full_context:
+            risk_metrics = self._extract_risk_metrics(full_context["fundamentals_report"])
+        if risk_metrics is not None:
             sections.append(f"FINANCIAL RISKS:\n{risk_metrics}")
         
         # Bearish sentiment
-        if "sentiment_report" in full_context:
-            sentiment = full_context["sentiment_report"]
-            bearish_sentiment = self._extract_bearish_sentiment(sentiment)
+        bearish_sentiment = self._sentiment_scores(full_context)
+        if bearish_sentiment is None and "sentiment_report" in full_context:
+            bearish_sentiment = self._extract_bearish_sentiment(full_context["sentiment_report"])
+        if bearish_sentiment is not None:
             sections.append(f"BEARISH SENTIMENT:\n{bearish_sentiment}")
         
         return "\n\n".join(sections)
@@ -198,31 +296,149 @@ class SmartContextManager:
             sections.append(f"INVESTMENT THESIS:\n{summary}")
         
         # Market overview - key levels and trends
-        if "market_report" in full_context:
-            market = full_context["market_report"]
-            overview = self._extract_market_overview(market)
+        overview = self._indicator_levels(full_context)
+        if overview is None and "market_report" in full_context:
+            overview = self._extract_market_overview(full_context["market_report"])
+        if overview is not None:
             sections.append(f"MARKET OVERVIEW:\n{overview}")
         
         # News summary - balanced perspective
-        if "news_report" in full_context:
+        articles = self._news_articles(full_context)
+        if articles is not None:
+            sections.append(f"NEWS SUMMARY:\n{self._summarize_articles(articles)}")
+        elif "news_report" in full_context:
             news = full_context["news_report"]
             summary = self._extract_news_summary(news)
             sections.append(f"NEWS SUMMARY:\n{summary}")
         
         # Valuation metrics
-        if "fundamentals_report" in full_context:
-            fundamentals = full_context["fundamentals_report"]
-            valuation = self._extract_valuation_summary(fundamentals)
+        valuation = self._metrics_line(full_context, VALUATION_METRICS)
+        if valuation is None and "fundamentals_report" in full_context:
+            valuation = self._extract_valuation_summary(full_context["fundamentals_report"])
+        if valuation is not None:
             sections.append(f"VALUATION SUMMARY:\n{valuation}")
         
         # Overall sentiment
-        if "sentiment_report" in full_context:
-            sentiment = full_context["sentiment_report"]
-            sentiment_overview = self._extract_sentiment_overview(sentiment)
+        sentiment_overview = self._sentiment_scores(full_context)
+        if sentiment_overview is None and "sentiment_report" in full_context:
+            sentiment_overview = self._extract_sentiment_overview(full_context["sentiment_report"])
+        if sentiment_overview is not None:
             sections.append(f"SENTIMENT OVERVIEW:\n{sentiment_overview}")
         
         return "\n\n".join(sections)
     
+    # Structured payloads (see structured_reports.py) - no text parsing needed
+    
+    @staticmethod
+    def _news_articles(full_context: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Articles of the structured news payload, or None to fall back to the report text.
+        
+        Only token-optimized articles carry a per-article sentiment; without it
+        the payload can't tell positive from negative catalysts.
+        """
+        payload = get_structured_report(full_context, "news")
+        if not payload or not payload.get("articles"):
+            return None
+        if not any("sentiment" in article for article in payload["articles"]):
+            return None
+        return payload["articles"]
+    
+    @staticmethod
+    def _market_levels(full_context: Dict[str, Any]) -> Optional[Tuple[float, Dict[str, float]]]:
+        """Current price and numeric trend indicators of the market payload, if published"""
+        payload = get_structured_report(full_context, "market")
+        price = (payload or {}).get("current_price")
+        indicators = {name: value for name, value in select_indicators(payload, TREND_INDICATORS).items()
+                      if isinstance(value, (int, float))}
+        if not indicators or not isinstance(price, (int, float)) or price <= 0:
+            return None
+        return price, indicators
+    
+    @staticmethod
+    def _indicator_signals(full_context: Dict[str, Any], bullish: bool) -> Optional[str]:
+        """Bullish or risk signals read off the market payload's indicator values"""
+        levels = SmartContextManager._market_levels(full_context)
+        if levels is None:
+            return None
+        price, indicators = levels
+        
+        signals = []
+        rsi = indicators.get("rsi_14")
+        if rsi is not None:
+            if bullish and rsi < 30:
+                signals.append(f"RSI_14 {rsi:.1f}: oversold, bounce potential")
+            elif bullish and 50 <= rsi < 70:
+                signals.append(f"RSI_14 {rsi:.1f}: positive momentum")
+            elif not bullish and rsi > 70:
+                signals.append(f"RSI_14 {rsi:.1f}: overbought")
+            elif not bullish and 30 <= rsi < 50:
+                signals.append(f"RSI_14 {rsi:.1f}: weakening momentum")
+        for name in ("sma_20", "sma_50", "sma_200"):
+            level = indicators.get(name)
+            if level and (price > level) == bullish:
+                side = "above" if bullish else "below"
+                signals.append(f"Price ${price:.2f} {side} {name.upper()} ${level:.2f}")
+        sma_50, sma_200 = indicators.get("sma_50"), indicators.get("sma_200")
+        if sma_50 and sma_200 and (sma_50 > sma_200) == bullish:
+            signals.append("SMA_50 above SMA_200 (golden cross)" if bullish else "SMA_50 below SMA_200 (death cross)")
+        
+        if signals:
+            return ' | '.join(signals)
+        return "No clear bullish signals detected" if bullish else "No clear risk signals detected"
+    
+    @staticmethod
+    def _indicator_levels(full_context: Dict[str, Any]) -> Optional[str]:
+        """Price and key indicator levels from the market payload"""
+        levels = SmartContextManager._market_levels(full_context)
+        if levels is None:
+            return None
+        price, indicators = levels
+        levels = [f"Price: ${price:.2f}"] + [f"{name.upper()}: {value:.2f}" for name, value in indicators.items()]
+        return ' | '.join(levels)
+    
+    @staticmethod
+    def _metrics_line(full_context: Dict[str, Any], names: List[str]) -> Optional[str]:
+        """Named metrics from the fundamentals payload, or None to fall back to the report text"""
+        metrics = select_metrics(get_structured_report(full_context, "fundamentals"), names)
+        if not metrics:
+            return None
+        return ' | '.join(
+            f"{name}: {value:.2f}" if isinstance(value, float) else f"{name}: {value}"
+            for name, value in metrics.items()
+        )
+    
+    @staticmethod
+    def _sentiment_scores(full_context: Dict[str, Any]) -> Optional[str]:
+        """Per-platform scores from the sentiment payload (platforms without data are skipped)"""
+        payload = get_structured_report(full_context, "sentiment")
+        if not payload or not payload.get("has_real_data"):
+            return None
+        sources = payload.get("sources") or {}
+        scores = []
+        for platform, score in (payload.get("scores") or {}).items():
+            source = sources.get(platform) or {}
+            if score is None or source.get("error"):
+                continue
+            scores.append(f"{platform}: {score} ({source.get('volume', 0)} posts, "
+                          f"confidence {source.get('confidence') or 'unknown'})")
+        return ' | '.join(scores) if scores else None
+    
+    @staticmethod
+    def _headlines_with_sentiment(articles: List[Dict[str, Any]], sentiment: str, limit: int = 3) -> str:
+        titles = [a.get("title", "") for a in articles if str(a.get("sentiment", "")).upper() == sentiment]
+        return ' | '.join(title for title in titles[:limit] if title)
+    
+    @staticmethod
+    def _summarize_articles(articles: List[Dict[str, Any]]) -> str:
+        sentiments = [str(a.get("sentiment", "")).upper() for a in articles]
+        summary = (f"News Sentiment Distribution: {sentiments.count('POSITIVE')} Positive, "
+                   f"{sentiments.count('NEUTRAL')} Neutral, {sentiments.count('NEGATIVE')} Negative")
+        headlines = [a.get("title", "") for a in articles[:2] if a.get("title")]
+        if headlines:
+            summary += f" | Key Headlines: {' | '.join(headlines)}"
+        return summary[:400]  # Limit length
+    
     def _extract_default_context(self, full_context: Dict[str, Any]) -> str:
         """Fallback context extraction for unknown component types"""
         sections = []
@@ -234,6 +450,12 @@ class SmartContextManager:
     
     # Context extraction helper methods
     
+    @_memoized_extraction
+    def _report_lines(self, text: str) -> Tuple[str, ...]:
+        """Stripped, non-empty lines of a report (split once, shared by all extractors)"""
+        return tuple(line for line in (raw.strip() for raw in text.split('\n')) if line)
+    
+    @_memoized_extraction
     def _extract_key_points(self, text: str, focus: str, max_chars: int = 500) -> str:
         """Extract key points based on focus area"""
         if not text or not isinstance(text, str):
@@ -262,6 +484,7 @@ class SmartContextManager:
         result = ' '.join(relevant_sentences)[:max_chars]
         return result if result else text[:max_chars]
     
+    @_memoized_extraction
     def _extract_bullish_signals(self, market_report: str) -> str:
         """Extract bullish market signals"""
         if not market_report:
@@ -275,7 +498,7 @@ class SmartContextManager:
         ]
         
         signals = []
-        lines = market_report.split('\n')
+        lines = self._report_lines(market_report)
         
         for line in lines:
             line = line.strip()
@@ -286,6 +509,7 @@ class SmartContextManager:
         
         return ' | '.join(signals) if signals else "No clear bullish signals detected"
     
+    @_memoized_extraction
     def _extract_risk_signals(self, market_report: str) -> str:
         """Extract bearish/risk market signals"""
         if not market_report:
@@ -299,7 +523,7 @@ class SmartContextManager:
         ]
         
         signals = []
-        lines = market_report.split('\n')
+        lines = self._report_lines(market_report)
         
         for line in lines:
             line = line.strip()
@@ -310,6 +534,7 @@ class SmartContextManager:
         
         return ' | '.join(signals) if signals else "No clear risk signals detected"
     
+    @_memoized_extraction
     def _extract_positive_headlines(self, news_report: str) -> str:
         """Extract positive news headlines"""
         if not news_report:
@@ -322,7 +547,7 @@ class SmartContextManager:
         ]
         
         headlines = []
-        lines = news_report.split('\n')
+        lines = self._report_lines(news_report)
         
         for line in lines:
             line = line.strip()
@@ -338,6 +563,7 @@ class SmartContextManager:
         
         return ' | '.join(headlines) if headlines else "No significant positive catalysts"
     
+    @_memoized_extraction
     def _extract_negative_headlines(self, news_report: str) -> str:
         """Extract negative news headlines"""
         if not news_report:
@@ -350,7 +576,7 @@ class SmartContextManager:
         ]
         
         headlines = []
-        lines = news_report.split('\n')
+        lines = self._report_lines(news_report)
         
         for line in lines:
             line = line.strip()
@@ -365,6 +591,7 @@ class SmartContextManager:
         
         return ' | '.join(headlines) if headlines else "No significant risk catalysts"
     
+    @_memoized_extraction
     def _extract_growth_metrics(self, fundamentals_report: str) -> str:
         """Extract growth-related fundamental metrics"""
         if not fundamentals_report:
@@ -377,7 +604,7 @@ class SmartContextManager:
         ]
         
         metrics = []
-        lines = fundamentals_report.split('\n')
+        lines = self._report_lines(fundamentals_report)
         
         for line in lines:
             line = line.strip()
@@ -392,6 +619,7 @@ class SmartContextManager:
         
         return ' | '.join(metrics) if metrics else "Limited growth metrics available"
     
+    @_memoized_extraction
     def _extract_risk_metrics(self, fundamentals_report: str) -> str:
         """Extract risk-related fundamental metrics"""
         if not fundamentals_report:
@@ -404,7 +632,7 @@ class SmartContextManager:
         ]
         
         metrics = []
-        lines = fundamentals_report.split('\n')
+        lines = self._report_lines(fundamentals_report)
         
         for line in lines:
             line = line.strip()
@@ -418,6 +646,7 @@ class SmartContextManager:
         
         return ' | '.join(metrics) if metrics else "Limited risk metrics available"
     
+    @_memoized_extraction
     def _extract_summary(self, text: str, max_chars: int = 300) -> str:
         """Extract general summary from text"""
         if not text:
@@ -440,13 +669,14 @@ class SmartContextManager:
         first_para = text.split('\n\n')[0]
         return first_para[:max_chars]
     
+    @_memoized_extraction
     def _extract_market_overview(self, market_report: str) -> str:
         """Extract market overview information"""
         if not market_report:
             return "No market data available"
         
         overview_lines = []
-        lines = market_report.split('\n')
+        lines = self._report_lines(market_report)
         
         for line in lines:
             line = line.strip()
@@ -458,6 +688,7 @@ class SmartContextManager:
         
         return ' | '.join(overview_lines) if overview_lines else "Limited market data"
     
+    @_memoized_extraction
     def _extract_news_summary(self, news_report: str) -> str:
         """Extract balanced news summary"""
         if not news_report:
@@ -472,7 +703,7 @@ class SmartContextManager:
         
         # Extract a few key headlines
         headlines = []
-        lines = news_report.split('\n')
+        lines = self._report_lines(news_report)
         for line in lines:
             if line.strip() and ('.' in line or 'Source:' in line):
                 headlines.append(line.strip())
@@ -484,13 +715,14 @@ class SmartContextManager:
         
         return summary[:400]  # Limit length
     
+    @_memoized_extraction
     def _extract_valuation_summary(self, fundamentals_report: str) -> str:
         """Extract valuation metrics summary"""
         if not fundamentals_report:
             return "No fundamentals data available"
         
         valuation_metrics = []
-        lines = fundamentals_report.split('\n')
+        lines = self._report_lines(fundamentals_report)
         
         for line in lines:
             line = line.strip()
@@ -501,13 +733,14 @@ class SmartContextManager:
         
         return ' | '.join(valuation_metrics) if valuation_metrics else "Limited valuation data"
     
+    @_memoized_extraction
     def _extract_bullish_sentiment(self, sentiment_report: str) -> str:
         """Extract bullish social sentiment indicators"""
         if not sentiment_report:
             return "No sentiment data available"
         
         bullish_indicators = []
-        lines = sentiment_report.split('\n')
+        lines = self._report_lines(sentiment_report)
         
         for line in lines:
             line = line.strip()
@@ -519,13 +752,14 @@ class SmartContextManager:
         
         return ' | '.join(bullish_indicators) if bullish_indicators else "Mixed sentiment signals"
     
+    @_memoized_extraction
     def _extract_bearish_sentiment(self, sentiment_report: str) -> str:
         """Extract bearish social sentiment indicators"""  
         if not sentiment_report:
             return "No sentiment data available"
         
         bearish_indicators = []
-        lines = sentiment_report.split('\n')
+        lines = self._report_lines(sentiment_report)
         
         for line in lines:
             line = line.strip()
@@ -537,6 +771,7 @@ class SmartContextManager:
         
         return ' | '.join(bearish_indicators) if bearish_indicators else "Limited bearish signals"
     
+    @_memoized_extraction
     def _extract_sentiment_overview(self, sentiment_report: str) -> str:
         """Extract overall sentiment overview"""
         if not sentiment_report:
@@ -544,7 +779,7 @@ class SmartContextManager:
         
         # Look for summary or score information
         overview_lines = []
-        lines = sentiment_report.split('\n')
+        lines = self._report_lines(sentiment_report)
         
         for line in lines:
             line = line.strip()
@@ -569,18 +804,20 @@ class SmartContextManager:
         return context
     
     def _generate_cache_key(self, component: str, context: Dict[str, Any]) -> str:
-        """Generate cache key for context"""
-        # Create hash of context for caching
-        context_str = json.dumps({
-            k: str(v)[:100] if isinstance(v, str) else str(v) 
-            for k, v in context.items() if v
-        }, sort_keys=True)
-        context_hash = hashlib.md5(context_str.encode()).hexdigest()[:8]
-        return f"{component}_{context_hash}"
+        """Generate cache key from a digest of the full context"""
+        digest = hashlib.sha256(component.encode())
+        for key in sorted(context):
+            value = context[key]
+            if not value:
+                continue
+            data = value if isinstance(value, str) else repr(value)
+            digest.update(f"\0{key}\0{len(data)}\0".encode())
+            digest.update(data.encode("utf-8", errors="surrogatepass"))
+        return f"{component}_{digest.hexdigest()}"
     
     def _log_optimization_metrics(self, debator_type: str, full_context: Dict, optimized_context: str):
         """Log context optimization metrics"""
-        original_size = sum(len(str(v)) for v in full_context.values())
+        original_size = sum(len(str(v)) for k, v in full_context.items() if k != "structured_reports")
         optimized_size = len(optimized_context)
         reduction_pct = (1 - optimized_size/original_size) * 100 if original_size > 0 else 0
         
@@ -596,24 +833,36 @@ class SmartContextManager:
         
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring"""
-        return {
-            "cache_size": len(self.context_cache),
-            "cache_keys": list(self.context_cache.keys()),
-            "memory_usage": sum(len(v) for v in self.context_cache.values()),
-            "token_budgets": self.token_budgets
-        }
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": (self._stats["hits"] / lookups * 100) if lookups > 0 else 0,
+                "cache_size": len(self.context_cache),
+                "max_contexts": self.max_contexts,
+                "extraction_cache_size": len(self._extraction_cache),
+                "max_extractions": self.max_extractions,
+                "cache_keys": list(self.context_cache.keys()),
+                "memory_usage": sum(len(v) for v in self.context_cache.values()),
+                "token_budgets": self.token_budgets
+            }
     
     def clear_cache(self):
-        """Clear context cache"""
-        self.context_cache.clear()
+        """Clear context and extraction caches"""
+        with self._lock:
+            self.context_cache.clear()
+            self._extraction_cache.clear()
         logger.info("🗑️ Context cache cleared")
 
 # Global singleton instance
 _smart_context_manager: Optional[SmartContextManager] = None
+_smart_context_manager_lock = threading.Lock()
 
 def get_smart_context_manager() -> SmartContextManager:
     """Get or create SmartContextManager singleton"""
     global _smart_context_manager
     if _smart_context_manager is None:
-        _smart_context_manager = SmartContextManager()
+        with _smart_context_manager_lock:
+            if _smart_context_manager is None:
+                _smart_context_manager = SmartContextManager()
     return _smart_context_manager
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Structured Report Side-Channel
+Typed analyst payloads carried in state next to the rendered report text
+
+Analysts publish the data behind their reports (news articles, technical
+indicators, fundamentals metrics, social sentiment scores) under
+state["structured_reports"][<kind>]. Downstream agents read and slice these
+payloads directly instead of regex-parsing JSON back out of markdown, and
+render them as compact JSON only when a prompt needs them.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, TypedDict
+
+logger = logging.getLogger(__name__)
+
+REPORT_KINDS = ("market", "news", "fundamentals", "sentiment")
+
+
+class NewsPayload(TypedDict, total=False):
+    company: str
+    date: str
+    total: int
+    original_count: int
+    articles: List[Dict[str, Any]]
+
+
+class MarketPayload(TypedDict, total=False):
+    ticker: str
+    current_price: float
+    indicators: Dict[str, Any]
+    indicator_count: int
+    engine: str
+    timestamp: str
+
+
+class FundamentalsPayload(TypedDict, total=False):
+    ticker: str
+    asset_type: str
+    profile: Dict[str, Any]
+    metrics: Dict[str, Any]
+    price_targets: Dict[str, Any]
+
+
+class SentimentPayload(TypedDict, total=False):
+    ticker: str
+    has_real_data: bool
+    scores: Dict[str, Any]
+    sources: Dict[str, Dict[str, Any]]
+
+
+def merge_structured_reports(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """State reducer: parallel analysts each contribute their own kind"""
+    if not left:
+        return dict(right or {})
+    if not right:
+        return left
+    return {**left, **right}
+
+
+def structured_update(kind: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    State update publishing one analyst payload.
+
+    Returns:
+        {"structured_reports": {kind: payload}}, or {} when there is no payload
+    """
+    if kind not in REPORT_KINDS:
+        raise ValueError(f"Unknown structured report kind: {kind}")
+    if not payload:
+        return {}
+    return {"structured_reports": {kind: payload}}
+
+
+def get_structured_report(state: Any, kind: str) -> Optional[Dict[str, Any]]:
+    """Payload of one kind from a state (or state wrapper), if published"""
+    try:
+        reports = state.get("structured_reports")
+    except Exception:
+        return None
+    if not isinstance(reports, dict):
+        return None
+    return reports.get(kind)
+
+
+def compact_json(value: Any) -> str:
+    """JSON without indentation or padding, for prompts"""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def slice_articles(payload: Optional[Dict[str, Any]], max_articles: int) -> List[Dict[str, Any]]:
+    """Top N articles of a news payload (already in relevance order)"""
+    if not payload:
+        return []
+    return list(payload.get("articles") or [])[:max_articles]
+
+
+def select_indicators(payload: Optional[Dict[str, Any]], names: List[str]) -> Dict[str, Any]:
+    """Subset of a market payload's indicators by name (missing ones are skipped)"""
+    indicators = (payload or {}).get("indicators") or {}
+    return {name: indicators[name] for name in names if name in indicators}
+
+
+def select_metrics(payload: Optional[Dict[str, Any]], names: List[str]) -> Dict[str, Any]:
+    """Subset of a fundamentals payload's metrics by name (missing or empty ones are skipped)"""
+    metrics = (payload or {}).get("metrics") or {}
+    return {name: metrics[name] for name in names if metrics.get(name) not in (None, "")}
@@ -1,12 +1,21 @@
 """
 Timing utilities for tracking agent and tool execution times
+
+Trackers are scoped to the current context (see tracing.py): each run that
+calls timing_tracker.start_total() gets its own TimingTracker, so concurrent
+requests no longer overwrite each other's start times. The decorators also
+record node/tool spans into the active RunTrace.
 """
+import contextvars
+import inspect
 import time
 import logging
 from functools import wraps
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Optional
 from datetime import datetime
 
+from .tracing import span
+
 logger = logging.getLogger(__name__)
 
 class TimingTracker:
@@ -96,33 +105,68 @@ class TimingTracker:
         
         return summary
 
-# Global timing tracker instance
-timing_tracker = TimingTracker()
+_context_tracker: contextvars.ContextVar[Optional[TimingTracker]] = contextvars.ContextVar(
+    "tradingagents_timing_tracker", default=None
+)
+# Used outside of any run (keeps the old module-level behaviour)
+_fallback_tracker = TimingTracker()
 
-def timed_agent(agent_name: str):
-    """Decorator to time agent execution"""
+
+def get_timing_tracker() -> TimingTracker:
+    """Get the TimingTracker of the current run"""
+    return _context_tracker.get() or _fallback_tracker
+
+
+class _ContextTimingTracker:
+    """
+    Module-level handle that forwards to the current run's TimingTracker.
+
+    start_total() installs a fresh tracker in the calling context; asyncio
+    tasks and LangGraph nodes started from there inherit it.
+    """
+
+    def start_total(self):
+        tracker = TimingTracker()
+        _context_tracker.set(tracker)
+        tracker.start_total()
+
+    def __getattr__(self, name):
+        return getattr(get_timing_tracker(), name)
+
+
+# Global timing tracker handle
+timing_tracker = _ContextTimingTracker()
+
+def _timed(name: str, kind: str, start: Callable, end: Callable):
     def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                tracker = get_timing_tracker()
+                with span(name, kind):
+                    start(tracker, name)
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        end(tracker, name)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            timing_tracker.start_agent(agent_name)
-            try:
-                result = func(*args, **kwargs)
-                return result
-            finally:
-                timing_tracker.end_agent(agent_name)
+            tracker = get_timing_tracker()
+            with span(name, kind):
+                start(tracker, name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    end(tracker, name)
         return wrapper
     return decorator
 
+def timed_agent(agent_name: str):
+    """Decorator to time agent execution"""
+    return _timed(agent_name, "node", TimingTracker.start_agent, TimingTracker.end_agent)
+
 def timed_tool(tool_name: str):
     """Decorator to time tool execution"""
-    def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            timing_tracker.start_tool(tool_name)
-            try:
-                result = func(*args, **kwargs)
-                return result
-            finally:
-                timing_tracker.end_tool(tool_name)
-        return wrapper
-    return decorator
\ No newline at end of file
+    return _timed(tool_name, "tool", TimingTracker.start_tool, TimingTracker.end_tool)
@@ -3,16 +3,54 @@ Smart Caching System for Tool Execution
 Optimization 3: Implement Smart Caching to reduce redundant API calls
 """
 
-import hashlib
-import json
+import asyncio
+import inspect
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable, Tuple
 from dataclasses import dataclass
 
+from .shared_cache import SharedResultCache, get_shared_cache, is_missing, make_cache_key
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached results before least recently used ones are evicted
+DEFAULT_MAX_ENTRIES = 512
+
+# Per-tool time-to-live in seconds, shared by every cache tier
+DEFAULT_TOOL_TTLS = {
+    # Market data changes slowly during market hours
+    "get_YFin_data": 300,                    # 5 minutes
+    "get_YFin_data_online": 300,             # 5 minutes
+    "get_stockstats_indicators_report": 300, # 5 minutes
+    "get_stockstats_indicators_table": 300,  # 5 minutes
+    "get_stockstats_indicators_table_online": 300,  # 5 minutes
+    
+    # Fundamentals change quarterly
+    "get_fundamentals_openai": 1800,         # 30 minutes
+    "get_simfin_balance_sheet": 3600,        # 1 hour
+    "get_simfin_income_stmt": 3600,          # 1 hour
+    "get_simfin_cashflow": 3600,             # 1 hour
+    
+    # News is time-sensitive but can be cached briefly
+    "get_global_news_openai": 300,           # 5 minutes
+    "get_google_news": 300,                  # 5 minutes
+    "get_finnhub_news": 300,                 # 5 minutes
+    "get_reddit_news": 180,                  # 3 minutes
+    
+    # Social sentiment changes frequently
+    "get_reddit_stock_info": 180,            # 3 minutes
+    "get_stocktwits_sentiment": 120,         # 2 minutes
+    "get_twitter_mentions": 120,             # 2 minutes
+    
+    # Insider data changes infrequently
+    "get_finnhub_company_insider_sentiment": 1800,     # 30 minutes
+    "get_finnhub_company_insider_transactions": 1800,  # 30 minutes
+}
+
 @dataclass
 class CacheEntry:
     """Represents a cached tool result"""
@@ -23,56 +61,110 @@ class CacheEntry:
     hit_count: int = 0
 
 class ToolCache:
-    """Smart caching system for tool execution results"""
-    
-    def __init__(self):
-        self._cache: Dict[str, CacheEntry] = {}
-        self._default_ttls = {
-            # Market data changes slowly during market hours
-            "get_YFin_data": 300,                    # 5 minutes
-            "get_YFin_data_online": 300,             # 5 minutes
-            "get_stockstats_indicators_report": 300, # 5 minutes
-            
-            # Fundamentals change quarterly
-            "get_fundamentals_openai": 1800,         # 30 minutes
-            "get_simfin_balance_sheet": 3600,        # 1 hour
-            "get_simfin_income_stmt": 3600,          # 1 hour
-            "get_simfin_cashflow": 3600,             # 1 hour
-            
-            # News is time-sensitive but can be cached briefly
-            "get_global_news_openai": 300,           # 5 minutes
-            "get_google_news": 300,                  # 5 minutes
-            "get_finnhub_news": 300,                 # 5 minutes
-            "get_reddit_news": 180,                  # 3 minutes
-            
-            # Social sentiment changes frequently
-            "get_reddit_stock_info": 180,            # 3 minutes
-            "get_stocktwits_sentiment": 120,         # 2 minutes
-            "get_twitter_mentions": 120,             # 2 minutes
-            
-            # Insider data changes infrequently
-            "get_finnhub_company_insider_sentiment": 1800,     # 30 minutes
-            "get_finnhub_company_insider_transactions": 1800,  # 30 minutes
-        }
+    """
+    Smart caching system for tool execution results
+    
+    Entries live in an LRU bounded by max_entries. The async path
+    (aget_or_fetch) is single-flight: concurrent misses for the same key share
+    one in-flight fetch, failed fetches are never stored, and with
+    stale_while_revalidate an expired entry is served while one background
+    refresh runs.
+    
+    An optional shared tier (see shared_cache.py) sits behind the in-process
+    LRU so multiple worker processes reuse each other's fetches.
+    """
+    
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 stale_while_revalidate: int = 0,
+                 shared_cache: Optional[SharedResultCache] = None):
+        """
+        Args:
+            max_entries: Maximum cached results kept (LRU eviction)
+            stale_while_revalidate: Seconds past the TTL an entry may still be
+                served while it is refreshed in the background (0 disables)
+            shared_cache: Out-of-process second tier (None for in-process only)
+        """
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.shared_cache = shared_cache
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> (future, loop) of the fetch currently running for that key
+        self._inflight: Dict[str, Tuple[asyncio.Future, asyncio.AbstractEventLoop]] = {}
+        # Strong references to running fetch tasks
+        self._fetch_tasks: set = set()
+        self._default_ttls = dict(DEFAULT_TOOL_TTLS)
         
         # Cache statistics
         self._stats = {
             "hits": 0,
             "misses": 0,
             "evictions": 0,
-            "total_calls": 0
+            "total_calls": 0,
+            "coalesced": 0,
+            "stale_hits": 0,
+            "failures": 0,
+            "shared_hits": 0
         }
+        self._tool_stats: Dict[str, Dict[str, int]] = {}
         
         logger.info("🧠 ToolCache initialized with smart TTL strategies")
     
     def _create_cache_key(self, tool_name: str, args: Dict[str, Any]) -> str:
         """Create a consistent cache key from tool name and arguments"""
-        # Sort args to ensure consistent key generation
-        sorted_args = json.dumps(args, sort_keys=True, default=str)
-        key_data = f"{tool_name}:{sorted_args}"
+        return make_cache_key(tool_name, args)
+    
+    def _count(self, tool_name: str, stat: str) -> None:
+        """Bump a global and a per-tool counter"""
+        self._stats[stat] += 1
+        tool_stats = self._tool_stats.get(tool_name)
+        if tool_stats is None:
+            tool_stats = self._tool_stats[tool_name] = {
+                "hits": 0, "misses": 0, "coalesced": 0, "stale_hits": 0, "failures": 0, "shared_hits": 0
+            }
+        tool_stats[stat] = tool_stats.get(stat, 0) + 1
+    
+    def _lookup(self, tool_name: str, cache_key: str, ttl: int, stale_ttl: int) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Find an entry and classify it. Must hold self._lock.
         
-        # Use hash for consistent, short keys
-        return hashlib.md5(key_data.encode()).hexdigest()
+        Returns:
+            (entry, is_fresh) - entry is None on a miss; a stale entry is
+            returned with is_fresh False while it is within the stale window
+        """
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None, False
+        
+        age = datetime.now() - entry.timestamp
+        if age < timedelta(seconds=ttl):
+            self._cache.move_to_end(cache_key)
+            return entry, True
+        if stale_ttl and age < timedelta(seconds=ttl + stale_ttl):
+            self._cache.move_to_end(cache_key)
+            return entry, False
+        
+        # Expired, remove from cache
+        del self._cache[cache_key]
+        self._stats["evictions"] += 1
+        logger.info(f"⏰ Cache EXPIRED: {tool_name} (age: {age.seconds}s)")
+        return None, False
+    
+    def _store(self, tool_name: str, cache_key: str, value: Any, ttl: int) -> None:
+        """Insert a result and evict least recently used entries. Must hold self._lock."""
+        self._cache[cache_key] = CacheEntry(
+            value=value,
+            timestamp=datetime.now(),
+            tool_name=tool_name,
+            hash_key=cache_key,
+            hit_count=0
+        )
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+            self._stats["evictions"] += 1
+        logger.info(f"💾 Cache STORE: {tool_name} (TTL: {ttl}s)")
     
     def get_or_fetch(self, 
                      tool_name: str, 
@@ -80,7 +172,11 @@ class ToolCache:
                      fetcher: Callable, 
                      ttl: Optional[int] = None) -> Any:
         """
-        Get cached result or fetch new data
+        Get cached result or fetch new data (synchronous path)
+        
+        Async callers should use aget_or_fetch(), which coalesces concurrent
+        misses. If fetcher returns an asyncio.Task, the task is cached and
+        dropped again as soon as it fails.
         
         Args:
             tool_name: Name of the tool being cached
@@ -99,60 +195,194 @@ class ToolCache:
             ttl = self._default_ttls.get(tool_name, 300)  # Default 5 minutes
         
         # Check cache
-        if cache_key in self._cache:
-            entry = self._cache[cache_key]
-            
-            # Check if still valid
-            if datetime.now() - entry.timestamp < timedelta(seconds=ttl):
+        with self._lock:
+            entry, fresh = self._lookup(tool_name, cache_key, ttl, 0)
+            if entry is not None and fresh:
                 entry.hit_count += 1
-                self._stats["hits"] += 1
-                
+                self._count(tool_name, "hits")
                 logger.info(f"✅ Cache HIT: {tool_name} (age: {(datetime.now() - entry.timestamp).seconds}s, hits: {entry.hit_count})")
                 return entry.value
-            else:
-                # Expired, remove from cache
-                del self._cache[cache_key]
-                self._stats["evictions"] += 1
-                logger.info(f"⏰ Cache EXPIRED: {tool_name} (age: {(datetime.now() - entry.timestamp).seconds}s)")
+            self._count(tool_name, "misses")
+        
+        # Second tier: another worker may already have fetched it
+        if self.shared_cache is not None:
+            shared = self.shared_cache.get(cache_key)
+            if not is_missing(shared):
+                self._count(tool_name, "shared_hits")
+                logger.info(f"✅ Shared cache HIT: {tool_name}")
+                with self._lock:
+                    self._store(tool_name, cache_key, shared, ttl)
+                return shared
         
         # Cache miss - fetch new data
-        self._stats["misses"] += 1
         logger.info(f"❌ Cache MISS: {tool_name} (fetching...)")
         
         try:
             result = fetcher()
-            
-            # Store in cache
-            entry = CacheEntry(
-                value=result,
-                timestamp=datetime.now(),
-                tool_name=tool_name,
-                hash_key=cache_key,
-                hit_count=0
-            )
-            self._cache[cache_key] = entry
-            
-            logger.info(f"💾 Cache STORE: {tool_name} (TTL: {ttl}s)")
-            return result
-            
         except Exception as e:
+            self._count(tool_name, "failures")
             logger.error(f"❌ Cache FETCH failed for {tool_name}: {e}")
             raise
+        
+        with self._lock:
+            self._store(tool_name, cache_key, result, ttl)
+        if self.shared_cache is not None and not isinstance(result, asyncio.Future):
+            self.shared_cache.set(cache_key, result, ttl)
+        
+        if isinstance(result, asyncio.Future):
+            def _drop_failed(task, key=cache_key):
+                if task.cancelled() or task.exception() is not None:
+                    with self._lock:
+                        current = self._cache.get(key)
+                        if current is not None and current.value is task:
+                            del self._cache[key]
+                    self._count(tool_name, "failures")
+            result.add_done_callback(_drop_failed)
+        
+        return result
+    
+    async def aget_or_fetch(self,
+                            tool_name: str,
+                            args: Dict[str, Any],
+                            fetcher: Callable,
+                            ttl: Optional[int] = None,
+                            cache_if: Optional[Callable[[Any], bool]] = None,
+                            stale_while_revalidate: Optional[int] = None) -> Any:
+        """
+        Get cached result or fetch it once for all concurrent callers
+        
+        Args:
+            tool_name: Name of the tool being cached
+            args: Tool arguments (used for cache key)
+            fetcher: Zero-argument callable returning a value or an awaitable
+            ttl: Time-to-live in seconds (optional, uses defaults)
+            cache_if: Predicate deciding whether a successful result is stored
+                (e.g. to skip fallback/error payloads)
+            stale_while_revalidate: Overrides the cache-wide stale window
+        
+        Returns:
+            Cached or freshly fetched result
+        """
+        self._stats["total_calls"] += 1
+        cache_key = self._create_cache_key(tool_name, args)
+        
+        if ttl is None:
+            ttl = self._default_ttls.get(tool_name, 300)  # Default 5 minutes
+        stale_ttl = self.stale_while_revalidate if stale_while_revalidate is None else stale_while_revalidate
+        loop = asyncio.get_running_loop()
+        
+        with self._lock:
+            entry, fresh = self._lookup(tool_name, cache_key, ttl, stale_ttl)
+            if entry is not None:
+                entry.hit_count += 1
+                if fresh:
+                    self._count(tool_name, "hits")
+                    logger.info(f"✅ Cache HIT: {tool_name} (age: {(datetime.now() - entry.timestamp).seconds}s, hits: {entry.hit_count})")
+                    return entry.value
+                self._count(tool_name, "stale_hits")
+            
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None and inflight[1] is not loop:
+                # Futures are bound to their loop; a fetch on another loop can't be joined
+                inflight = None
+            
+            if inflight is None:
+                future = loop.create_future()
+                self._inflight[cache_key] = (future, loop)
+                owner = True
+            else:
+                future = inflight[0]
+                owner = False
+                if entry is None:
+                    self._count(tool_name, "coalesced")
+            
+            if entry is None and owner:
+                self._count(tool_name, "misses")
+        
+        if owner:
+            # The fetch runs as its own task so no single caller's cancellation aborts it
+            task = loop.create_task(self._run_fetch(tool_name, cache_key, fetcher, ttl, cache_if, future))
+            self._fetch_tasks.add(task)
+            task.add_done_callback(self._fetch_tasks.discard)
+            if entry is not None:
+                # Serve the stale value now and refresh in the background
+                logger.info(f"♻️ Cache STALE: {tool_name} (revalidating in background)")
+                return entry.value
+            logger.info(f"❌ Cache MISS: {tool_name} (fetching...)")
+        elif entry is not None:
+            return entry.value
+        else:
+            logger.info(f"🔗 Cache COALESCED: {tool_name} (awaiting in-flight fetch)")
+        
+        # shield() keeps one waiter's cancellation from cancelling the shared result
+        return await asyncio.shield(future)
+    
+    async def _run_fetch(self, tool_name: str, cache_key: str, fetcher: Callable, ttl: int,
+                         cache_if: Optional[Callable[[Any], bool]], future: asyncio.Future) -> None:
+        """Run the fetcher once, publish the outcome to all waiters and store successes"""
+        try:
+            # Second tier: another worker may already have fetched it
+            if self.shared_cache is not None:
+                shared = await asyncio.to_thread(self.shared_cache.get, cache_key)
+                if not is_missing(shared):
+                    self._count(tool_name, "shared_hits")
+                    logger.info(f"✅ Shared cache HIT: {tool_name}")
+                    with self._lock:
+                        self._inflight.pop(cache_key, None)
+                        self._store(tool_name, cache_key, shared, ttl)
+                    if not future.done():
+                        future.set_result(shared)
+                    return
+            
+            result = fetcher()
+            if inspect.isawaitable(result):
+                result = await result
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+            self._count(tool_name, "failures")
+            if not isinstance(e, asyncio.CancelledError):
+                logger.error(f"❌ Cache FETCH failed for {tool_name}: {e}")
+            if not future.done():
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark retrieved so an unawaited failure doesn't log "exception never retrieved"
+                    future.exception()
+            return
+        
+        cacheable = cache_if is None or cache_if(result)
+        with self._lock:
+            self._inflight.pop(cache_key, None)
+            if cacheable:
+                self._store(tool_name, cache_key, result, ttl)
+            else:
+                logger.info(f"🚫 Cache SKIP: {tool_name} (result not cacheable)")
+        if not future.done():
+            future.set_result(result)
+        
+        # Publish to the shared tier after waiters have been released
+        if cacheable and self.shared_cache is not None:
+            await asyncio.to_thread(self.shared_cache.set, cache_key, result, ttl)
     
     def invalidate(self, tool_name: str, args: Dict[str, Any]) -> bool:
         """Invalidate a specific cache entry"""
         cache_key = self._create_cache_key(tool_name, args)
         
-        if cache_key in self._cache:
-            del self._cache[cache_key]
+        with self._lock:
+            removed = self._cache.pop(cache_key, None) is not None
+        if self.shared_cache is not None:
+            self.shared_cache.delete(cache_key)
+        if removed:
             logger.info(f"🗑️ Cache INVALIDATED: {tool_name}")
-            return True
-        return False
+        return removed
     
     def clear_all(self) -> int:
         """Clear all cache entries"""
-        count = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
         logger.info(f"🧹 Cache CLEARED: {count} entries removed")
         return count
     
@@ -165,7 +395,11 @@ class ToolCache:
             **self._stats,
             "hit_rate": hit_rate,
             "cached_entries": len(self._cache),
-            "cache_size_mb": self._estimate_cache_size()
+            "max_entries": self.max_entries,
+            "inflight": len(self._inflight),
+            "cache_size_mb": self._estimate_cache_size(),
+            "tools": {name: dict(stats) for name, stats in self._tool_stats.items()},
+            "shared": self.shared_cache.get_stats() if self.shared_cache is not None else None
         }
     
     def _estimate_cache_size(self) -> float:
@@ -175,7 +409,8 @@ class ToolCache:
         
         # Sample a few entries to estimate average size
         sample_size = min(5, len(self._cache))
-        sample_entries = list(self._cache.values())[:sample_size]
+        with self._lock:
+            sample_entries = list(self._cache.values())[:sample_size]
         
         total_size = 0
         for entry in sample_entries:
@@ -200,6 +435,8 @@ class ToolCache:
    📊 Total Calls: {stats['total_calls']}
    ✅ Cache Hits: {stats['hits']} ({stats['hit_rate']:.1f}%)
    ❌ Cache Misses: {stats['misses']}
+   🔗 Coalesced: {stats['coalesced']}
+   ♻️ Stale Hits: {stats['stale_hits']}
    ⏰ Evictions: {stats['evictions']}
    💾 Cached Entries: {stats['cached_entries']}
    📏 Cache Size: {stats['cache_size_mb']:.2f} MB
@@ -208,12 +445,15 @@ class ToolCache:
 
 # Global cache instance
 _global_cache: Optional[ToolCache] = None
+_global_cache_lock = threading.Lock()
 
 def get_tool_cache() -> ToolCache:
     """Get the global tool cache instance"""
     global _global_cache
     if _global_cache is None:
-        _global_cache = ToolCache()
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = ToolCache(shared_cache=get_shared_cache())
     return _global_cache
 
 def clear_tool_cache():
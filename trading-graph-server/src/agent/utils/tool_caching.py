@@ -1,42 +1,98 @@
 """
 Tool Result Caching for Priority 3 Optimization
 Implements an LRU cache for frequently accessed market data
+
+LRU order lives in an OrderedDict and expiry times in a heap, so lookups,
+inserts and evictions stay cheap at any cache size.
 """
 
 import asyncio
 import functools
-import hashlib
+import heapq
+import inspect
 import json
 import logging
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .shared_cache import SharedResultCache, get_shared_cache, is_missing, make_cache_key
+from .tool_cache import DEFAULT_TOOL_TTLS
 
 logger = logging.getLogger(__name__)
 
 
+# Default memory budget for cached results (estimated bytes)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Seconds between background sweeps of expired entries
+DEFAULT_EXPIRY_INTERVAL = 30.0
+
+
+@dataclass
+class _Entry:
+    """One cached result"""
+    value: Any
+    tool_name: str
+    expires_at: float
+    size: int
+
+
+def estimate_size(value: Any) -> int:
+    """Rough size in bytes of a cached value"""
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value) + 64
+    try:
+        return len(json.dumps(value, default=str)) + 64
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
 class ToolCache:
     """
-    A simple in-memory cache for tool results with TTL support.
+    In-memory cache for tool results with per-tool TTLs and a byte budget.
     
-    This implementation uses Python's built-in lru_cache with custom TTL logic
-    for caching market data and technical indicators.
+    Entries are kept in an OrderedDict in LRU order (O(1) touch and eviction)
+    and their expiry times in a min-heap (O(log n) insert/expire). Expired
+    entries are dropped lazily on access and by a background sweeper thread.
     """
     
-    def __init__(self, max_size: int = 1000, default_ttl: int = 300):
+    def __init__(self,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 default_ttl: int = 300,
+                 shared_cache: Optional[SharedResultCache] = None,
+                 expiry_interval: Optional[float] = DEFAULT_EXPIRY_INTERVAL):
         """
         Initialize the tool cache.
         
         Args:
-            max_size: Maximum number of cached items
-            default_ttl: Default time-to-live in seconds (5 minutes)
+            max_bytes: Estimated memory budget; least recently used entries are
+                evicted beyond it
+            default_ttl: Time-to-live in seconds for tools without a per-tool TTL
+            shared_cache: Out-of-process second tier (None for in-process only)
+            expiry_interval: Seconds between background expiry sweeps (None disables)
         """
-        self.max_size = max_size
+        self.max_bytes = max_bytes
         self.default_ttl = default_ttl
-        self._cache = {}
-        self._timestamps = {}
+        self.shared_cache = shared_cache
+        self.expiry_interval = expiry_interval
+        
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._tool_ttls: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        
         self._hit_count = 0
         self._miss_count = 0
+        self._evictions = 0
+        self._expirations = 0
+        
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
         
     def _generate_key(self, tool_name: str, args: Dict[str, Any]) -> str:
         """
@@ -49,15 +105,18 @@ class ToolCache:
         Returns:
             Hash key for caching
         """
-        # Create a consistent string representation
-        key_data = {
-            'tool': tool_name,
-            'args': args
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        
-        # Generate hash
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return make_cache_key(tool_name, args)
+    
+    def set_tool_ttl(self, tool_name: str, ttl: int) -> None:
+        """Override the TTL used for one tool"""
+        self._tool_ttls[tool_name] = ttl
+    
+    def ttl_for(self, tool_name: str) -> int:
+        """TTL of a tool: explicit override, then DEFAULT_TOOL_TTLS, then default_ttl"""
+        ttl = self._tool_ttls.get(tool_name)
+        if ttl is None:
+            ttl = DEFAULT_TOOL_TTLS.get(tool_name, self.default_ttl)
+        return ttl
     
     def get(self, tool_name: str, args: Dict[str, Any]) -> Optional[Any]:
         """
@@ -71,30 +130,56 @@ class ToolCache:
             Cached result or None if not found/expired
         """
         key = self._generate_key(tool_name, args)
+        value = self._get_local(tool_name, key)
+        if value is not None:
+            return value
+        return self._get_shared(tool_name, key)
+    
+    async def aget(self, tool_name: str, args: Dict[str, Any]) -> Optional[Any]:
+        """Like get(), but a shared tier lookup (SQLite/Redis I/O) runs off the event loop"""
+        if self.shared_cache is None:
+            return self.get(tool_name, args)
+        key = self._generate_key(tool_name, args)
+        value = self._get_local(tool_name, key)
+        if value is not None:
+            return value
+        return await asyncio.to_thread(self._get_shared, tool_name, key)
+    
+    def _get_local(self, tool_name: str, key: str) -> Optional[Any]:
+        """Look a key up in the in-process tier"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry.expires_at > time.time():
+                    self._cache.move_to_end(key)
+                    self._hit_count += 1
+                    hit_rate = self._hit_count / (self._hit_count + self._miss_count) * 100
+                    logger.info(f"✅ Cache HIT for {tool_name} (hit rate: {hit_rate:.1f}%)")
+                    return entry.value
+                
+                # Remove expired entry
+                self._remove(key)
+                self._expirations += 1
+                logger.debug(f"📊 Cache EXPIRED for {tool_name}")
+        return None
+    
+    def _get_shared(self, tool_name: str, key: str) -> Optional[Any]:
+        """Look a local miss up in the shared tier"""
+        if self.shared_cache is not None:
+            value = self.shared_cache.get(key)
+            if not is_missing(value):
+                with self._lock:
+                    self._hit_count += 1
+                    self._store_local(tool_name, key, value, self.ttl_for(tool_name))
+                logger.info(f"✅ Shared cache HIT for {tool_name}")
+                return value
         
-        # Check if key exists
-        if key not in self._cache:
-            self._miss_count += 1
-            logger.debug(f"📊 Cache MISS for {tool_name} (total misses: {self._miss_count})")
-            return None
-        
-        # Check if expired
-        timestamp = self._timestamps.get(key, 0)
-        if time.time() - timestamp > self.default_ttl:
-            # Remove expired entry
-            del self._cache[key]
-            del self._timestamps[key]
+        with self._lock:
             self._miss_count += 1
-            logger.debug(f"📊 Cache EXPIRED for {tool_name}")
-            return None
-        
-        self._hit_count += 1
-        hit_rate = self._hit_count / (self._hit_count + self._miss_count) * 100
-        logger.info(f"✅ Cache HIT for {tool_name} (hit rate: {hit_rate:.1f}%)")
-        
-        return self._cache[key]
+        logger.debug(f"📊 Cache MISS for {tool_name} (total misses: {self._miss_count})")
+        return None
     
-    def set(self, tool_name: str, args: Dict[str, Any], result: Any) -> None:
+    def set(self, tool_name: str, args: Dict[str, Any], result: Any, ttl: Optional[int] = None) -> None:
         """
         Store a result in the cache.
         
@@ -102,103 +187,215 @@ class ToolCache:
             tool_name: Name of the tool
             args: Arguments passed to the tool
             result: Result to cache
+            ttl: Time-to-live in seconds (defaults to the tool's TTL)
         """
+        key, ttl = self._set_local(tool_name, args, result, ttl)
+        if self.shared_cache is not None:
+            self.shared_cache.set(key, result, ttl)
+    
+    async def aset(self, tool_name: str, args: Dict[str, Any], result: Any, ttl: Optional[int] = None) -> None:
+        """Like set(), but the shared tier write runs off the event loop"""
+        key, ttl = self._set_local(tool_name, args, result, ttl)
+        if self.shared_cache is not None:
+            await asyncio.to_thread(self.shared_cache.set, key, result, ttl)
+    
+    def _set_local(self, tool_name: str, args: Dict[str, Any], result: Any,
+                   ttl: Optional[int]) -> Tuple[str, int]:
+        """Store in the in-process tier, returning the key and effective TTL"""
         key = self._generate_key(tool_name, args)
+        if ttl is None:
+            ttl = self.ttl_for(tool_name)
         
-        # Check cache size limit
-        if len(self._cache) >= self.max_size:
-            # Remove oldest entry
-            oldest_key = min(self._timestamps, key=self._timestamps.get)
-            del self._cache[oldest_key]
-            del self._timestamps[oldest_key]
-            logger.debug(f"🗑️ Evicted oldest cache entry")
-        
-        self._cache[key] = result
-        self._timestamps[key] = time.time()
+        with self._lock:
+            self._store_local(tool_name, key, result, ttl)
         logger.debug(f"💾 Cached result for {tool_name}")
+        
+        self._ensure_sweeper()
+        return key, ttl
+    
+    def _store_local(self, tool_name: str, key: str, result: Any, ttl: int) -> None:
+        """Insert into the in-process tier. Must hold self._lock."""
+        size = estimate_size(result)
+        if size > self.max_bytes:
+            logger.debug(f"⚠️ Result of {tool_name} ({size} bytes) exceeds cache budget, not cached")
+            return
+        
+        if key in self._cache:
+            self._remove(key)
+        
+        expires_at = time.time() + ttl
+        self._cache[key] = _Entry(result, tool_name, expires_at, size)
+        self._total_bytes += size
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        
+        # Evict least recently used entries until within budget
+        while self._total_bytes > self.max_bytes and self._cache:
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
+            self._evictions += 1
+            logger.debug(f"🗑️ Evicted least recently used cache entry")
+        
+        # Superseded heap items are skipped lazily; rebuild if they pile up
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [(e.expires_at, k) for k, e in self._cache.items()]
+            heapq.heapify(self._expiry_heap)
+    
+    def _remove(self, key: str) -> None:
+        """Drop an entry. Must hold self._lock."""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+    
+    def expire(self) -> int:
+        """
+        Remove all expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._expiry_heap)
+                entry = self._cache.get(key)
+                # Skip heap items superseded by a newer set() of the same key
+                if entry is not None and entry.expires_at == expires_at:
+                    self._remove(key)
+                    removed += 1
+            self._expirations += removed
+        if removed:
+            logger.debug(f"⏰ Expired {removed} cache entries")
+        return removed
+    
+    def _ensure_sweeper(self) -> None:
+        """Start the background expiry thread on first use"""
+        if self.expiry_interval is None or (self._sweeper is not None and self._sweeper.is_alive()):
+            return
+        with self._lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._stop_sweeper.clear()
+            self._sweeper = threading.Thread(target=self._sweep, name="tool-cache-expiry", daemon=True)
+            self._sweeper.start()
+    
+    def _sweep(self) -> None:
+        while not self._stop_sweeper.wait(self.expiry_interval):
+            try:
+                self.expire()
+            except Exception as e:
+                logger.error(f"❌ Cache expiry sweep failed: {e}")
+    
+    def stop(self) -> None:
+        """Stop the background expiry thread."""
+        self._stop_sweeper.set()
     
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._cache.clear()
-        self._timestamps.clear()
-        self._hit_count = 0
-        self._miss_count = 0
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
+            self._hit_count = 0
+            self._miss_count = 0
         logger.info("🗑️ Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_requests = self._hit_count + self._miss_count
-        hit_rate = self._hit_count / total_requests * 100 if total_requests > 0 else 0
-        
-        return {
-            'size': len(self._cache),
-            'max_size': self.max_size,
-            'hits': self._hit_count,
-            'misses': self._miss_count,
-            'hit_rate': hit_rate,
-            'ttl': self.default_ttl
-        }
+        with self._lock:
+            total_requests = self._hit_count + self._miss_count
+            hit_rate = self._hit_count / total_requests * 100 if total_requests > 0 else 0
+            
+            return {
+                'size': len(self._cache),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hit_count,
+                'misses': self._miss_count,
+                'hit_rate': hit_rate,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'ttl': self.default_ttl,
+                'shared': self.shared_cache.get_stats() if self.shared_cache is not None else None
+            }
 
 
 # Global cache instance
-_tool_cache = ToolCache()
+_tool_cache = ToolCache(shared_cache=get_shared_cache())
 
 
-def cache_tool_result(ttl: Optional[int] = None):
+def _is_cacheable(result: Any) -> bool:
+    """Skip empty results and error strings so failures are retried"""
+    if result is None:
+        return False
+    if isinstance(result, str) and result.lstrip().startswith(("Error", "❌")):
+        return False
+    return True
+
+
+def cache_tool_result(ttl: Optional[int] = None,
+                      tool_name: Optional[str] = None,
+                      cache: Optional[ToolCache] = None):
     """
     Decorator to cache tool results.
     
     This is the implementation for Priority 3: Tool Result Caching.
+    Apply it below @tool so the tool schema still comes from the function.
+    Arguments are bound to the signature, so positional and keyword calls
+    share one cache entry.
     
     Args:
-        ttl: Time-to-live for this specific tool (optional)
+        ttl: Time-to-live for this specific tool (defaults to the per-tool TTL)
+        tool_name: Cache namespace (defaults to the function name)
+        cache: Cache to use (defaults to the global tool cache)
         
     Returns:
         Decorated function with caching
     """
     def decorator(func):
+        name = tool_name or func.__name__
+        signature = inspect.signature(func)
+        
+        def cache_args_for(args, kwargs) -> Dict[str, Any]:
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return dict(bound.arguments)
+            except TypeError:
+                return {'args': args, 'kwargs': kwargs}
+        
+        def target() -> ToolCache:
+            return cache or _tool_cache
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Extract tool name
-            tool_name = func.__name__
-            
-            # Create args dict for cache key
-            cache_args = {
-                'args': args,
-                'kwargs': kwargs
-            }
+            cache_args = cache_args_for(args, kwargs)
             
             # Check cache first
-            cached_result = _tool_cache.get(tool_name, cache_args)
+            cached_result = target().get(name, cache_args)
             if cached_result is not None:
                 return cached_result
             
             # Execute tool and cache result
             result = func(*args, **kwargs)
-            _tool_cache.set(tool_name, cache_args, result)
+            if _is_cacheable(result):
+                target().set(name, cache_args, result, ttl)
             
             return result
         
         # Also create async version if needed
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Extract tool name
-            tool_name = func.__name__
+            cache_args = cache_args_for(args, kwargs)
             
-            # Create args dict for cache key
-            cache_args = {
-                'args': args,
-                'kwargs': kwargs
-            }
-            
-            # Check cache first
-            cached_result = _tool_cache.get(tool_name, cache_args)
+            # Check cache first (shared tier I/O stays off the event loop)
+            cached_result = await target().aget(name, cache_args)
             if cached_result is not None:
                 return cached_result
             
             # Execute tool and cache result
             result = await func(*args, **kwargs)
-            _tool_cache.set(tool_name, cache_args, result)
+            if _is_cacheable(result):
+                await target().aset(name, cache_args, result, ttl)
             
             return result
         
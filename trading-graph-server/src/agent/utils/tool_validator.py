@@ -9,7 +9,7 @@ class ToolUsageValidator:
     """Validates that analysts use tools before providing analysis"""
     
     REQUIRED_TOOLS = {
-        "market": ["get_YFin_data", "get_stockstats_indicators_report"],
+        "market": ["get_YFin_data", "get_stockstats_indicators_table", "get_stockstats_indicators_report"],
         "news": ["get_global_news_openai", "get_finnhub_news", "get_google_news"],
         "social": ["get_reddit_stock_info", "get_stock_news_openai"],
         "fundamentals": ["get_fundamentals_openai", "get_simfin_balance_sheet", "get_simfin_income_stmt"]
@@ -0,0 +1,488 @@
+"""
+Run-Scoped Tracing
+Per-run span trees for graph nodes, tools, LLM calls and HTTP requests
+
+Each analysis run gets its own RunTrace held in a ContextVar, so concurrent
+runs never share timing state. Context variables follow asyncio tasks
+(including asyncio.gather branches) and LangGraph's node executors; use
+wrap_context() when handing work to a plain thread pool.
+
+Spans come from two places:
+- TracingCallbackHandler: LangChain callbacks for graph nodes, tools and LLMs
+- span() / traced() / start_span(): our own code (HTTP hooks, helpers)
+
+Our spans are parented to the innermost active span, falling back to the
+LangChain run that is currently executing, so HTTP calls made by a tool
+show up under that tool.
+
+Usage:
+    with start_run("analyze", ticker="AAPL") as run:
+        graph.invoke(state, {"callbacks": [run.callback_handler()]})
+    run.export_json("trace.json")
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SPAN_KINDS = ("run", "node", "tool", "llm", "http", "internal")
+
+_current_trace: contextvars.ContextVar[Optional["RunTrace"]] = contextvars.ContextVar(
+    "tradingagents_current_trace", default=None
+)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "tradingagents_current_span", default=None
+)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+@dataclass
+class Span:
+    """One timed operation inside a run"""
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str = field(default_factory=_new_span_id)
+    parent_id: Optional[str] = None
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (up to now while the span is open)"""
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """Close the span; later calls are ignored"""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.status = "error"
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration": round(self.duration, 6),
+            "attributes": dict(self.attributes),
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class RunTrace:
+    """All spans recorded for one run, exportable as a tree"""
+
+    def __init__(self, name: str, **attributes):
+        self.trace_id = secrets.token_hex(16)
+        self.name = name
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+        # LangChain run_id -> span (or nearest recorded ancestor for skipped runs)
+        self._runs: Dict[str, Span] = {}
+        self.root = self.add_span(name, "run", parent=None, **attributes)
+
+    def add_span(self, name: str, kind: str, parent: Optional[Span] = None, **attributes) -> Span:
+        """Record a new open span under `parent` (or the run root)"""
+        if parent is None and self._spans:
+            parent = self.root
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=self.trace_id,
+            parent_id=parent.span_id if parent is not None else None,
+            attributes=attributes,
+        )
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    # LangChain run bookkeeping --------------------------------------------
+
+    def span_for_run(self, run_id: Any) -> Optional[Span]:
+        if run_id is None:
+            return None
+        with self._lock:
+            return self._runs.get(str(run_id))
+
+    def bind_run(self, run_id: Any, span: Span) -> None:
+        with self._lock:
+            self._runs[str(run_id)] = span
+
+    def release_run(self, run_id: Any) -> Optional[Span]:
+        with self._lock:
+            return self._runs.pop(str(run_id), None)
+
+    # Reporting ------------------------------------------------------------
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.root.finish(error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Nested span tree"""
+        spans = self.spans
+        nodes = {span.span_id: {**span.to_dict(), "children": []} for span in spans}
+        for span in spans:
+            if span.parent_id in nodes:
+                nodes[span.parent_id]["children"].append(nodes[span.span_id])
+        for node in nodes.values():
+            node["children"].sort(key=lambda child: child["start_ns"])
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "span_count": len(spans),
+            "root": nodes[self.root.span_id],
+        }
+
+    def critical_path(self) -> List[Dict[str, Any]]:
+        """Chain of spans from the root that finished last at every level"""
+        spans = self.spans
+        children: Dict[str, List[Span]] = {}
+        for span in spans:
+            if span.parent_id is not None:
+                children.setdefault(span.parent_id, []).append(span)
+
+        path = []
+        current = self.root
+        while True:
+            path.append({"name": current.name, "kind": current.kind, "duration": round(current.duration, 3)})
+            candidates = children.get(current.span_id)
+            if not candidates:
+                return path
+            current = max(candidates, key=lambda s: s.end_ns if s.end_ns is not None else time.time_ns())
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregated durations, keyed like TimingTracker.get_summary()"""
+        totals: Dict[str, Dict[str, float]] = {kind: {} for kind in ("node", "tool", "llm", "http")}
+        counts: Dict[str, int] = {kind: 0 for kind in totals}
+        for span in self.spans:
+            if span.kind in totals:
+                bucket = totals[span.kind]
+                bucket[span.name] = bucket.get(span.name, 0.0) + span.duration
+                counts[span.kind] += 1
+
+        return {
+            "trace_id": self.trace_id,
+            "total_duration": self.root.duration,
+            "agent_times": totals["node"],
+            "tool_times": totals["tool"],
+            "llm_times": totals["llm"],
+            "http_times": totals["http"],
+            "total_agent_time": sum(totals["node"].values()),
+            "total_tool_time": sum(totals["tool"].values()),
+            "agent_count": len(totals["node"]),
+            "tool_call_count": counts["tool"],
+            "llm_call_count": counts["llm"],
+            "http_request_count": counts["http"],
+            "critical_path": self.critical_path(),
+        }
+
+    def export_json(self, path: str) -> str:
+        """Write the span tree as JSON; returns the path"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        logger.info(f"🧭 Trace exported: {path}")
+        return path
+
+    def to_otlp(self, service_name: str = "tradingagents") -> Dict[str, Any]:
+        """OTLP/JSON (ExportTraceServiceRequest) representation"""
+        otlp_spans = []
+        for span in self.spans:
+            otlp_span = {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                # SPAN_KIND_CLIENT for outbound HTTP, SPAN_KIND_INTERNAL otherwise
+                "kind": 3 if span.kind == "http" else 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns if span.end_ns is not None else time.time_ns()),
+                "attributes": [_otlp_attribute("tradingagents.span.kind", span.kind)]
+                + [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+                "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": otlp_spans,
+                }],
+            }]
+        }
+
+    def export_otlp(self, path: str, service_name: str = "tradingagents") -> str:
+        """Write the trace as an OTLP/JSON file (importable by OTel collectors); returns the path"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_otlp(service_name), f, default=str)
+        logger.info(f"🧭 OTLP trace exported: {path}")
+        return path
+
+    def callback_handler(self):
+        """LangChain callback handler recording node, tool and LLM spans into this run"""
+        return TracingCallbackHandler(self)
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# Context access -------------------------------------------------------------
+
+def current_trace() -> Optional[RunTrace]:
+    """The RunTrace of the current context, if any"""
+    return _current_trace.get()
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span of the current context, if any"""
+    return _current_span.get()
+
+
+def _langchain_parent(trace: RunTrace) -> Optional[Span]:
+    """Span of the LangChain run executing in this context, if it was recorded"""
+    try:
+        from langchain_core.runnables.config import var_child_runnable_config
+    except ImportError:
+        return None
+    callbacks = (var_child_runnable_config.get() or {}).get("callbacks")
+    return trace.span_for_run(getattr(callbacks, "parent_run_id", None))
+
+
+def start_span(name: str, kind: str = "internal", **attributes) -> Optional[Span]:
+    """
+    Open a span in the current run without making it the current span.
+
+    Meant for callback-style hooks (e.g. aiohttp tracing) that start and end
+    in different places. Returns None when no run is active; call
+    span.finish() to close it.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return None
+    parent = _current_span.get() or _langchain_parent(trace)
+    return trace.add_span(name, kind, parent=parent, **attributes)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes):
+    """
+    Record a child span around a block and make it the current span.
+
+    Yields the Span, or None when no run is active (the block still runs).
+    """
+    opened = start_span(name, kind, **attributes)
+    if opened is None:
+        yield None
+        return
+    token = _current_span.set(opened)
+    try:
+        yield opened
+    except BaseException as e:
+        opened.finish(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        opened.finish()
+
+
+@contextmanager
+def start_run(name: str, **attributes):
+    """
+    Start a run-scoped trace for the current context.
+
+    If a run is already active (e.g. the API layer started one around
+    propagate()), a child span is opened in it instead and the existing
+    RunTrace is yielded.
+    """
+    existing = _current_trace.get()
+    if existing is not None:
+        with span(name, "internal", **attributes):
+            yield existing
+        return
+
+    trace = RunTrace(name, **attributes)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.finish(e)
+        raise
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        trace.finish()
+
+
+def traced(name: Optional[str] = None, kind: str = "internal"):
+    """Decorator recording a span around a sync or async function"""
+    def decorator(func: Callable):
+        span_name = name or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def wrap_context(func: Callable) -> Callable:
+    """Bind func to a copy of the current context, for ThreadPoolExecutor.submit()"""
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return ctx.run(func, *args, **kwargs)
+    return wrapper
+
+
+# LangChain integration ------------------------------------------------------
+
+try:
+    from langchain_core.callbacks import BaseCallbackHandler
+except ImportError:  # pragma: no cover - langchain is a hard dependency of the graph
+    BaseCallbackHandler = object
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """
+    Records LangGraph nodes, tools and LLM calls as spans of a RunTrace.
+
+    Only graph nodes (chains tagged with langgraph_node metadata), tools and
+    LLM calls become spans; intermediate runnables are folded into their
+    nearest recorded ancestor so the tree stays readable.
+    """
+
+    raise_error = False
+    run_inline = True
+
+    def __init__(self, trace: RunTrace):
+        super().__init__()
+        self.trace = trace
+
+    def _parent(self, parent_run_id: Any) -> Span:
+        return self.trace.span_for_run(parent_run_id) or self.trace.root
+
+    def _open(self, run_id: Any, parent_run_id: Any, name: str, kind: str, **attributes) -> None:
+        span = self.trace.add_span(name, kind, parent=self._parent(parent_run_id), **attributes)
+        self.trace.bind_run(run_id, span)
+
+    def _close(self, run_id: Any, error: Optional[BaseException] = None, **attributes) -> None:
+        span = self.trace.release_run(run_id)
+        if span is None or span.end_ns is not None:
+            return
+        span.attributes.update(attributes)
+        span.finish(error)
+
+    def _skip(self, run_id: Any, parent_run_id: Any) -> None:
+        # Children of a skipped run attach to its nearest recorded ancestor
+        parent = self.trace.span_for_run(parent_run_id)
+        if parent is not None:
+            self.trace.bind_run(run_id, parent)
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        name = kwargs.get("name") or (serialized or {}).get("name")
+        if parent_run_id is None:
+            # Top-level graph invocation
+            self.trace.bind_run(run_id, _current_span.get() or self.trace.root)
+        elif node and name == node:
+            self._open(run_id, parent_run_id, node, "node",
+                       step=(metadata or {}).get("langgraph_step"))
+        else:
+            self._skip(run_id, parent_run_id)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        span = self.trace.span_for_run(run_id)
+        if span is not None and span.kind == "node":
+            self._close(run_id)
+        else:
+            self.trace.release_run(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        span = self.trace.span_for_run(run_id)
+        if span is not None and span.kind == "node":
+            self._close(run_id, error)
+        else:
+            self.trace.release_run(run_id)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, parent_run_id=None, **kwargs):
+        name = kwargs.get("name") or (serialized or {}).get("name") or "tool"
+        self._open(run_id, parent_run_id, name, "tool")
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._close(run_id)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._close(run_id, error)
+
+    def _on_model_start(self, serialized, run_id, parent_run_id, kwargs):
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name") or (serialized or {}).get("name") or "llm"
+        self._open(run_id, parent_run_id, str(model), "llm")
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, **kwargs):
+        self._on_model_start(serialized, run_id, parent_run_id, kwargs)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, **kwargs):
+        self._on_model_start(serialized, run_id, parent_run_id, kwargs)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+        attributes = {key: usage[key] for key in ("prompt_tokens", "completion_tokens", "total_tokens") if key in usage}
+        self._close(run_id, **attributes)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._close(run_id, error)
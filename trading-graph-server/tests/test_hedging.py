@@ -0,0 +1,94 @@
+import asyncio
+
+from agent.utils.hedging import (
+    MIN_SAMPLES,
+    HedgeSource,
+    LatencyTracker,
+    hedge_delay_for,
+    hedged_race,
+)
+
+
+def _source(name, value=None, delay=0.0, timeout=5.0, error=None, started=None, **kwargs):
+    async def fetch():
+        if started is not None:
+            started.append(name)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return value
+
+    return HedgeSource(name, fetch, timeout=timeout, **kwargs)
+
+
+def _race(sources, budget=2.0, hedge_delay=0.05):
+    return asyncio.run(hedged_race(sources, budget=budget, hedge_delay=hedge_delay,
+                                   tracker=LatencyTracker()))
+
+
+def test_fast_primary_wins_without_hedging():
+    started = []
+    result = _race([
+        _source("primary", {"n": 1}, started=started),
+        _source("backup", {"n": 2}, started=started),
+    ], hedge_delay=0.5)
+    assert result.source == "primary"
+    assert result.value == {"n": 1}
+    assert started == ["primary"]
+
+
+def test_slow_primary_is_hedged_and_loses_to_backup():
+    result = _race([
+        _source("primary", {"n": 1}, delay=0.5),
+        _source("backup", {"n": 2}),
+    ])
+    assert result.source == "backup"
+    assert result.attempts == {"backup": "won", "primary": "cancelled"}
+
+
+def test_rejected_result_launches_next_source_immediately():
+    result = _race([
+        _source("primary", {"fallback_mode": True},
+                accept=lambda r: bool(r) and not r.get("fallback_mode")),
+        _source("backup", {"n": 2}),
+    ], hedge_delay=1.0)
+    assert result.source == "backup"
+    assert result.attempts["primary"] == "rejected"
+    assert result.elapsed < 0.5
+
+
+def test_errors_and_timeouts_fall_through_in_priority_order():
+    result = _race([
+        _source("primary", error=RuntimeError("boom")),
+        _source("secondary", {"n": 2}, delay=0.2, timeout=0.05),
+        _source("tertiary", {"n": 3}),
+    ])
+    assert result.source == "tertiary"
+    assert result.attempts["primary"] == "error"
+    assert result.attempts["secondary"] == "timeout"
+
+
+def test_budget_cancels_running_sources():
+    result = _race([
+        _source("primary", {"n": 1}, delay=1.0),
+        _source("backup", {"n": 2}, delay=1.0),
+    ], budget=0.2)
+    assert not result.ok
+    assert result.attempts == {"primary": "cancelled", "backup": "cancelled"}
+    assert result.elapsed < 0.5
+
+
+def test_hedge_delay_is_capped_by_p95():
+    tracker = LatencyTracker()
+    for _ in range(MIN_SAMPLES):
+        tracker.record("primary", 0.2, True)
+    source = _source("primary")
+    assert hedge_delay_for(source, 1.0, tracker) == 0.2
+    assert hedge_delay_for(_source("unknown"), 1.0, tracker) == 1.0
+
+
+def test_unhealthy_source_is_hedged_immediately():
+    tracker = LatencyTracker()
+    for _ in range(MIN_SAMPLES):
+        tracker.record("primary", 0.1, False)
+    assert hedge_delay_for(_source("primary"), 1.0, tracker) == 0.0
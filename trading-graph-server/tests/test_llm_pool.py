@@ -0,0 +1,36 @@
+import asyncio
+
+from agent.factories.llm_factory import LLMClientPool
+
+
+def test_clear_closes_sync_and_async_clients():
+    pool = LLMClientPool()
+    sync_client, async_client = pool.get_http_clients("openai", "https://example.invalid/v1")
+    pool.clear()
+    assert sync_client.is_closed
+    assert async_client.is_closed
+    assert pool.get_stats()["endpoints"] == {}
+
+
+def test_clear_inside_a_running_loop_schedules_the_async_close():
+    async def run():
+        pool = LLMClientPool()
+        _, async_client = pool.get_http_clients("openai", None)
+        pool.clear()
+        assert pool._closing
+        await asyncio.gather(*pool._closing)
+        return async_client
+
+    assert asyncio.run(run()).is_closed
+
+
+def test_aclose_waits_for_every_endpoint():
+    async def run():
+        pool = LLMClientPool()
+        clients = [pool.get_http_clients("openai", url) for url in (None, "http://localhost:11434/v1")]
+        await pool.aclose()
+        return clients
+
+    for sync_client, async_client in asyncio.run(run()):
+        assert sync_client.is_closed
+        assert async_client.is_closed
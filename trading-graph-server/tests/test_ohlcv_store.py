@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from agent.dataflows.ohlcv_store import OHLCVStore
+
+
+def _write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_same_symbol_from_different_files_is_not_shared(tmp_path):
+    store = OHLCVStore(cache_dir=str(tmp_path / "store"))
+    first = _write(tmp_path / "a.csv", "Date,Close\n2024-01-02,1.0\n")
+    second = _write(tmp_path / "b.csv", "Date,Close\n2024-01-02,2.0\n")
+    os.utime(second, ns=(os.stat(first).st_mtime_ns,) * 2)
+    assert store.read_csv(first, "AAPL", "yfin")["Close"].tolist() == [1.0]
+    assert store.read_csv(second, "AAPL", "yfin")["Close"].tolist() == [2.0]
+    assert store.get_stats()["csv_parses"] == 2
+
+
+def test_read_arguments_are_part_of_the_key(tmp_path):
+    store = OHLCVStore(cache_dir=str(tmp_path / "store"))
+    path = _write(tmp_path / "a.csv", "Date;Close\n2024-01-02;1.0\n")
+    assert list(store.read_csv(path, "AAPL", "simfin").columns) == ["Date;Close"]
+    assert list(store.read_csv(path, "AAPL", "simfin", sep=";").columns) == ["Date", "Close"]
+
+
+def test_columnar_copy_is_reused_by_a_new_store(tmp_path):
+    path = _write(tmp_path / "a.csv", "Date,Close\n2024-01-02,1.0\n")
+    OHLCVStore(cache_dir=str(tmp_path / "store")).read_csv(path, "AAPL", "yfin")
+    store = OHLCVStore(cache_dir=str(tmp_path / "store"))
+    assert store.read_csv(path, "AAPL", "yfin")["Close"].tolist() == [1.0]
+    assert store.get_stats()["columnar_loads"] == 1
+
+
+def test_parse_error_releases_the_key_lock(tmp_path):
+    store = OHLCVStore(cache_dir=str(tmp_path / "store"))
+    path = _write(tmp_path / "a.csv", "Date,Close\n2024-01-02,1.0\n")
+    with pytest.raises(Exception):
+        store.read_csv(path, "AAPL", "yfin", usecols=["missing"])
+    assert store._key_locks == {}
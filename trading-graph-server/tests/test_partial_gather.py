@@ -0,0 +1,75 @@
+import asyncio
+
+from agent.utils import partial_gather
+from agent.utils.partial_gather import GatherSource, gather_partial
+
+
+def _source(name, value=None, delay=0.0, error=None, **kwargs):
+    async def fetch():
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return value
+
+    return GatherSource(name, fetch, **kwargs)
+
+
+def test_keeps_results_and_classifies_failures():
+    arrived = []
+    result = asyncio.run(gather_partial([
+        _source("fast", 1, delay=0.01),
+        _source("empty", None),
+        _source("broken", error=RuntimeError("boom")),
+        _source("late", 2, delay=1.0, deadline=0.05),
+        _source("slow", 3, delay=1.0),
+    ], budget=0.2, on_result=lambda name, value: arrived.append(name)))
+    assert result.results == {"fast": 1}
+    assert arrived == ["fast"]
+    assert result.rejected == ["empty"]
+    assert result.errors == {"broken": "boom"}
+    assert result.timed_out == ["late"]
+    assert result.cancelled == ["slow"]
+    assert result.elapsed < 0.5
+
+
+def test_finished_sources_are_collected_not_cancelled_at_budget(monkeypatch):
+    real_wait = asyncio.wait
+
+    async def wait_past_budget(fs, timeout=None, return_when=None):
+        # The budget timer fires as the sources complete: nothing reported done yet
+        await real_wait(fs)
+        return set(), set(fs)
+
+    monkeypatch.setattr(partial_gather.asyncio, "wait", wait_past_budget)
+    result = asyncio.run(gather_partial([
+        _source("a", 1, delay=0.02, deadline=1.0),
+        _source("b", 2, delay=0.02, deadline=1.0),
+    ], budget=0.01))
+    assert result.results == {"a": 1, "b": 2}
+    assert result.cancelled == []
+
+
+def test_quorum_ends_the_wait_early():
+    result = asyncio.run(gather_partial([
+        _source("a", 0.7, delay=0.01),
+        _source("b", 0.8, delay=0.02),
+        _source("slow", 0.1, delay=1.0),
+    ], budget=2.0, quorum=2))
+    assert result.quorum_met
+    assert set(result.results) == {"a", "b"}
+    assert result.cancelled == ["slow"]
+    assert result.elapsed < 0.5
+
+
+def test_quorum_waits_while_results_disagree():
+    def bullish(values):
+        return all(v > 0.5 for v in values)
+
+    result = asyncio.run(gather_partial([
+        _source("a", 0.7, delay=0.01),
+        _source("b", 0.2, delay=0.02),
+        _source("c", 0.9, delay=0.05),
+    ], budget=2.0, quorum=2, agree=bullish))
+    assert not result.quorum_met
+    assert set(result.results) == {"a", "b", "c"}
+    assert result.cancelled == []
@@ -0,0 +1,79 @@
+import pytest
+
+from agent.graph.signal_processing import FAST_PATH_MIN_CONFIDENCE, extract_decision
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("FINAL TRANSACTION PROPOSAL: **BUY**", "BUY"),
+        ("**FINAL TRANSACTION PROPOSAL: SELL**", "SELL"),
+        ("Final Decision: HOLD", "HOLD"),
+        ("**Recommendation:** STRONG BUY.", "BUY"),
+        ("Recommendation: **Sell**", "SELL"),
+        ("Action - SELL - margins are compressing", "SELL"),
+    ],
+)
+def test_explicit_decisions_take_the_fast_path(text, expected):
+    extraction = extract_decision(text)
+    assert extraction.decision == expected
+    assert extraction.confidence >= FAST_PATH_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Our rating: Buy-side demand is weak; we recommend selling. **SELL**", "SELL"),
+        ("Action - Sell-side estimates rose. **BUY**", "BUY"),
+    ],
+)
+def test_hyphenated_prose_is_not_a_labeled_decision(text, expected):
+    extraction = extract_decision(text)
+    assert extraction.decision == expected
+    assert extraction.rule == "bold"
+
+
+def test_prose_after_label_is_not_a_decision():
+    extraction = extract_decision("Recommendation: Hold off on buying")
+    assert extraction.decision is None
+    assert extraction.confidence < FAST_PATH_MIN_CONFIDENCE
+
+
+def test_upper_case_word_must_end_its_clause():
+    assert extract_decision("Decision: BUY the dip and reassess").rule != "labeled"
+
+
+def test_label_contradicted_by_bold_is_left_to_the_llm():
+    extraction = extract_decision("Recommendation: BUY\n\nAfter the risk debate: **SELL**")
+    assert extraction.decision is None
+    assert extraction.confidence < FAST_PATH_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Answer with BUY/HOLD/SELL.\nFINAL TRANSACTION PROPOSAL: **HOLD**", "HOLD"),
+        ("Choose BUY, SELL, or HOLD. Decision: SELL", "SELL"),
+        ("Reply with one of buy or sell or hold.\n**BUY**", "BUY"),
+    ],
+)
+def test_prompt_echoes_are_ignored(text, expected):
+    assert extract_decision(text).decision == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Your answer must end with FINAL TRANSACTION PROPOSAL: BUY/HOLD/SELL",
+        "Decision: BUY, SELL, or HOLD",
+    ],
+)
+def test_bare_prompt_echo_has_no_decision(text):
+    extraction = extract_decision(text)
+    assert extraction.decision is None
+    assert extraction.rule == "none"
+
+
+def test_conflicting_labels_fall_below_the_fast_path():
+    extraction = extract_decision("Decision: BUY\nFinal Decision: SELL")
+    assert extraction.confidence < FAST_PATH_MIN_CONFIDENCE